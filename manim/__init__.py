@@ -10,6 +10,7 @@ except ModuleNotFoundError:
 __version__ = importlib_metadata.version(__name__)
 
 
+import importlib
 import sys
 
 # Importing the config module should be the first thing we do, since other
@@ -32,91 +33,669 @@ for i, arg in enumerate(sys.argv):
     elif arg == "--use_webgl_renderer":
         config.renderer = "webgl"
 
+# The constants are needed by the config module anyway. The standard modules
+# below used to be exported by ``from manim import *`` through the cairo
+# renderer module, which does not define ``__all__``.
+import time
+import typing
 
-from .animation.animation import *
-from .animation.composition import *
-from .animation.creation import *
-from .animation.fading import *
-from .animation.growing import *
-from .animation.indication import *
-from .animation.movement import *
-from .animation.numbers import *
-from .animation.rotation import *
-from .animation.transform import *
-from .animation.transform_matching_parts import *
-from .animation.update import *
-from .camera.camera import *
-from .camera.mapping_camera import *
-from .camera.moving_camera import *
-from .camera.multi_camera import *
-from .camera.three_d_camera import *
+import numpy as np
+
+from . import _config, constants
 from .constants import *
-from .mobject.changing import *
-from .mobject.coordinate_systems import *
-from .mobject.frame import *
-from .mobject.functions import *
-from .mobject.geometry import *
-from .mobject.graph import *
-from .mobject.logo import *
-from .mobject.matrix import *
-from .mobject.mobject import *
-from .mobject.mobject_update_utils import *
-from .mobject.number_line import *
-from .mobject.numbers import *
-from .mobject.polyhedra import *
-from .mobject.probability import *
-from .mobject.shape_matchers import *
-from .mobject.svg.brace import *
-from .mobject.svg.code_mobject import *
-from .mobject.svg.style_utils import *
-from .mobject.svg.svg_mobject import *
-from .mobject.svg.svg_path import *
-from .mobject.svg.tex_mobject import *
-from .mobject.svg.text_mobject import *
-from .mobject.three_d_utils import *
-from .mobject.three_dimensions import *
-from .mobject.types.image_mobject import *
-from .mobject.types.point_cloud_mobject import *
-from .mobject.types.vectorized_mobject import *
-from .mobject.value_tracker import *
-from .mobject.vector_field import *
-from .renderer.cairo_renderer import *
-from .scene.graph_scene import *
-from .scene.moving_camera_scene import *
-from .scene.reconfigurable_scene import *
-from .scene.sample_space_scene import *
-from .scene.scene import *
-from .scene.scene_file_writer import *
-from .scene.three_d_scene import *
-from .scene.vector_space_scene import *
-from .scene.zoomed_scene import *
-from .utils import color as color
-from .utils import rate_functions, unit
-from .utils.bezier import *
-from .utils.color import *
-from .utils.config_ops import *
-from .utils.debug import *
-from .utils.file_ops import *
-from .utils.images import *
-from .utils.iterables import *
-from .utils.paths import *
-from .utils.rate_functions import *
-from .utils.simple_functions import *
-from .utils.sounds import *
-from .utils.space_ops import *
-from .utils.strings import *
-from .utils.tex import *
-from .utils.tex_templates import *
 
-try:
-    from IPython import get_ipython
+# Everything else is imported on first access, see ``__getattr__`` below: each
+# module lists the names it exports, in the order of the star imports this
+# table replaces (a name listed by several modules is taken from the last one).
+_EXPORTS = {
+    ".animation.animation": (
+        "Animation",
+        "Wait",
+        "override_animation",
+    ),
+    ".animation.composition": (
+        "AnimationGroup",
+        "Succession",
+        "LaggedStart",
+        "LaggedStartMap",
+    ),
+    ".animation.creation": (
+        "Create",
+        "Uncreate",
+        "DrawBorderThenFill",
+        "Write",
+        "Unwrite",
+        "ShowPartial",
+        "ShowIncreasingSubsets",
+        "AddTextLetterByLetter",
+        "ShowSubmobjectsOneByOne",
+        "AddTextWordByWord",
+    ),
+    ".animation.fading": (
+        "FadeOut",
+        "FadeIn",
+    ),
+    ".animation.growing": (
+        "GrowFromPoint",
+        "GrowFromCenter",
+        "GrowFromEdge",
+        "GrowArrow",
+        "SpinInFromNothing",
+    ),
+    ".animation.indication": (
+        "FocusOn",
+        "Indicate",
+        "Flash",
+        "ShowPassingFlash",
+        "ShowPassingFlashWithThinningStrokeWidth",
+        "ShowCreationThenFadeOut",
+        "ApplyWave",
+        "Circumscribe",
+        "Wiggle",
+    ),
+    ".animation.movement": (
+        "Homotopy",
+        "SmoothedVectorizedHomotopy",
+        "ComplexHomotopy",
+        "PhaseFlow",
+        "MoveAlongPath",
+    ),
+    ".animation.numbers": (
+        "ChangingDecimal",
+        "ChangeDecimalToValue",
+    ),
+    ".animation.rotation": (
+        "Rotating",
+        "Rotate",
+    ),
+    ".animation.transform": (
+        "Transform",
+        "ReplacementTransform",
+        "TransformFromCopy",
+        "ClockwiseTransform",
+        "CounterclockwiseTransform",
+        "MoveToTarget",
+        "ApplyMethod",
+        "ApplyPointwiseFunction",
+        "ApplyPointwiseFunctionToCenter",
+        "FadeToColor",
+        "FadeTransform",
+        "FadeTransformPieces",
+        "ScaleInPlace",
+        "ShrinkToCenter",
+        "Restore",
+        "ApplyFunction",
+        "ApplyMatrix",
+        "ApplyComplexFunction",
+        "CyclicReplace",
+        "Swap",
+        "TransformAnimations",
+    ),
+    ".animation.transform_matching_parts": (
+        "TransformMatchingShapes",
+        "TransformMatchingTex",
+    ),
+    ".animation.update": (
+        "UpdateFromFunc",
+        "UpdateFromAlphaFunc",
+        "MaintainPositionRelativeTo",
+    ),
+    ".camera.camera": (
+        "Camera",
+        "BackgroundColoredVMobjectDisplayer",
+    ),
+    ".camera.mapping_camera": (
+        "MappingCamera",
+        "OldMultiCamera",
+        "SplitScreenCamera",
+    ),
+    ".camera.moving_camera": (
+        "CameraFrame",
+        "MovingCamera",
+    ),
+    ".camera.multi_camera": ("MultiCamera",),
+    ".camera.three_d_camera": ("ThreeDCamera",),
+    ".mobject.changing": (
+        "AnimatedBoundary",
+        "TracedPath",
+    ),
+    ".mobject.coordinate_systems": (
+        "CoordinateSystem",
+        "Axes",
+        "ThreeDAxes",
+        "NumberPlane",
+        "PolarPlane",
+        "ComplexPlane",
+    ),
+    ".mobject.frame": (
+        "ScreenRectangle",
+        "FullScreenRectangle",
+        "FullScreenFadeRectangle",
+        "PictureInPictureFrame",
+    ),
+    ".mobject.functions": (
+        "ParametricFunction",
+        "FunctionGraph",
+    ),
+    ".mobject.geometry": (
+        "TipableVMobject",
+        "Arc",
+        "ArcBetweenPoints",
+        "CurvedArrow",
+        "CurvedDoubleArrow",
+        "Circle",
+        "Dot",
+        "AnnotationDot",
+        "LabeledDot",
+        "Ellipse",
+        "AnnularSector",
+        "Sector",
+        "Annulus",
+        "Line",
+        "DashedLine",
+        "TangentLine",
+        "Elbow",
+        "Arrow",
+        "Vector",
+        "DoubleArrow",
+        "CubicBezier",
+        "Polygram",
+        "Polygon",
+        "RegularPolygram",
+        "RegularPolygon",
+        "Star",
+        "ArcPolygon",
+        "ArcPolygonFromArcs",
+        "Triangle",
+        "ArrowTip",
+        "Rectangle",
+        "Square",
+        "RoundedRectangle",
+        "Cutout",
+        "Angle",
+        "RightAngle",
+        "ArrowCircleFilledTip",
+        "ArrowCircleTip",
+        "ArrowSquareTip",
+        "ArrowSquareFilledTip",
+    ),
+    ".mobject.graph": ("Graph",),
+    ".mobject.logo": ("ManimBanner",),
+    ".mobject.matrix": (
+        "Matrix",
+        "DecimalMatrix",
+        "IntegerMatrix",
+        "MobjectMatrix",
+        "matrix_to_tex_string",
+        "matrix_to_mobject",
+        "get_det_text",
+    ),
+    ".mobject.mobject": (
+        "Mobject",
+        "Group",
+        "override_animate",
+    ),
+    ".mobject.mobject_update_utils": (
+        "assert_is_mobject_method",
+        "always",
+        "f_always",
+        "always_redraw",
+        "always_shift",
+        "always_rotate",
+        "turn_animation_into_updater",
+        "cycle_animation",
+    ),
+    ".mobject.number_line": (
+        "NumberLine",
+        "UnitInterval",
+        "NumberLineOld",
+    ),
+    ".mobject.numbers": (
+        "DecimalNumber",
+        "Integer",
+        "Variable",
+    ),
+    ".mobject.polyhedra": (
+        "Polyhedron",
+        "Tetrahedron",
+        "Octahedron",
+        "Icosahedron",
+        "Dodecahedron",
+    ),
+    ".mobject.probability": (
+        "SampleSpace",
+        "BarChart",
+    ),
+    ".mobject.shape_matchers": (
+        "SurroundingRectangle",
+        "BackgroundRectangle",
+        "Cross",
+        "Underline",
+    ),
+    ".mobject.svg.brace": (
+        "Brace",
+        "BraceLabel",
+        "ArcBrace",
+        "BraceText",
+        "BraceBetweenPoints",
+    ),
+    ".mobject.svg.code_mobject": ("Code",),
+    ".mobject.svg.style_utils": (
+        "cascade_element_style",
+        "parse_style",
+        "parse_color_string",
+    ),
+    ".mobject.svg.svg_mobject": (
+        "SVGMobject",
+        "string_to_numbers",
+    ),
+    ".mobject.svg.svg_path": (
+        "SVGPathMobject",
+        "string_to_numbers",
+    ),
+    ".mobject.svg.tex_mobject": (
+        "TexSymbol",
+        "SingleStringMathTex",
+        "MathTex",
+        "Tex",
+        "BulletedList",
+        "Title",
+    ),
+    ".mobject.svg.text_mobject": (
+        "Text",
+        "Paragraph",
+        "MarkupText",
+        "register_font",
+    ),
+    ".mobject.three_d_utils": (
+        "get_3d_vmob_gradient_start_and_end_points",
+        "get_3d_vmob_start_corner_index",
+        "get_3d_vmob_end_corner_index",
+        "get_3d_vmob_start_corner",
+        "get_3d_vmob_end_corner",
+        "get_3d_vmob_unit_normal",
+        "get_3d_vmob_start_corner_unit_normal",
+        "get_3d_vmob_end_corner_unit_normal",
+    ),
+    ".mobject.three_dimensions": (
+        "ThreeDVMobject",
+        "ParametricSurface",
+        "Sphere",
+        "Dot3D",
+        "Cube",
+        "Prism",
+        "Cone",
+        "Arrow3D",
+        "Cylinder",
+        "Line3D",
+        "Torus",
+    ),
+    ".mobject.types.image_mobject": (
+        "AbstractImageMobject",
+        "ImageMobject",
+        "ImageMobjectFromCamera",
+    ),
+    ".mobject.types.point_cloud_mobject": (
+        "PMobject",
+        "Mobject1D",
+        "Mobject2D",
+        "PGroup",
+        "PointCloudDot",
+        "Point",
+    ),
+    ".mobject.types.vectorized_mobject": (
+        "VMobject",
+        "VGroup",
+        "VDict",
+        "VectorizedPoint",
+        "CurvesAsSubmobjects",
+        "DashedVMobject",
+    ),
+    ".mobject.value_tracker": (
+        "ValueTracker",
+        "ComplexValueTracker",
+    ),
+    ".mobject.vector_field": (
+        "VectorField",
+        "ArrowVectorField",
+        "StreamLines",
+    ),
+    ".renderer.cairo_renderer": (
+        "CairoRenderer",
+        "handle_play_like_call",
+    ),
+    ".scene.graph_scene": ("GraphScene",),
+    ".scene.moving_camera_scene": ("MovingCameraScene",),
+    ".scene.reconfigurable_scene": ("ReconfigurableScene",),
+    ".scene.sample_space_scene": ("SampleSpaceScene",),
+    ".scene.scene": ("Scene",),
+    ".scene.scene_file_writer": ("SceneFileWriter",),
+    ".scene.three_d_scene": (
+        "ThreeDScene",
+        "SpecialThreeDScene",
+    ),
+    ".scene.vector_space_scene": (
+        "VectorScene",
+        "LinearTransformationScene",
+    ),
+    ".scene.zoomed_scene": ("ZoomedScene",),
+    ".utils.bezier": (
+        "bezier",
+        "batched_bezier",
+        "partial_bezier_points",
+        "batched_partial_bezier_points",
+        "partial_quadratic_bezier_points",
+        "interpolate",
+        "integer_interpolate",
+        "mid",
+        "inverse_interpolate",
+        "match_interpolate",
+        "get_smooth_handle_points",
+        "get_smooth_cubic_bezier_handle_points",
+        "diag_to_matrix",
+        "is_closed",
+    ),
+    ".utils.color": (
+        "color_to_rgb",
+        "color_to_rgba",
+        "rgb_to_color",
+        "rgba_to_color",
+        "rgb_to_hex",
+        "hex_to_rgb",
+        "invert_color",
+        "color_to_int_rgb",
+        "color_to_int_rgba",
+        "color_gradient",
+        "interpolate_color",
+        "average_color",
+        "random_bright_color",
+        "random_color",
+        "get_shaded_rgb",
+        "WHITE",
+        "GRAY_A",
+        "GREY_A",
+        "GRAY_B",
+        "GREY_B",
+        "GRAY_C",
+        "GREY_C",
+        "GRAY_D",
+        "GREY_D",
+        "GRAY_E",
+        "GREY_E",
+        "BLACK",
+        "LIGHTER_GRAY",
+        "LIGHTER_GREY",
+        "LIGHT_GRAY",
+        "LIGHT_GREY",
+        "GRAY",
+        "GREY",
+        "DARK_GRAY",
+        "DARK_GREY",
+        "DARKER_GRAY",
+        "DARKER_GREY",
+        "BLUE_A",
+        "BLUE_B",
+        "BLUE_C",
+        "BLUE_D",
+        "BLUE_E",
+        "PURE_BLUE",
+        "BLUE",
+        "DARK_BLUE",
+        "TEAL_A",
+        "TEAL_B",
+        "TEAL_C",
+        "TEAL_D",
+        "TEAL_E",
+        "TEAL",
+        "GREEN_A",
+        "GREEN_B",
+        "GREEN_C",
+        "GREEN_D",
+        "GREEN_E",
+        "PURE_GREEN",
+        "GREEN",
+        "YELLOW_A",
+        "YELLOW_B",
+        "YELLOW_C",
+        "YELLOW_E",
+        "YELLOW_D",
+        "YELLOW",
+        "GOLD_A",
+        "GOLD_B",
+        "GOLD_C",
+        "GOLD_D",
+        "GOLD_E",
+        "GOLD",
+        "RED_A",
+        "RED_B",
+        "RED_C",
+        "RED_D",
+        "RED_E",
+        "PURE_RED",
+        "RED",
+        "MAROON_A",
+        "MAROON_B",
+        "MAROON_C",
+        "MAROON_D",
+        "MAROON_E",
+        "MAROON",
+        "PURPLE_A",
+        "PURPLE_B",
+        "PURPLE_C",
+        "PURPLE_D",
+        "PURPLE_E",
+        "PURPLE",
+        "PINK",
+        "LIGHT_PINK",
+        "ORANGE",
+        "LIGHT_BROWN",
+        "DARK_BROWN",
+        "GRAY_BROWN",
+        "GREY_BROWN",
+    ),
+    ".utils.config_ops": (
+        "merge_dicts_recursively",
+        "update_dict_recursively",
+        "DictAsObject",
+    ),
+    ".utils.debug": (
+        "print_family",
+        "index_labels",
+    ),
+    ".utils.file_ops": (
+        "add_extension_if_not_present",
+        "guarantee_existence",
+        "seek_full_path_from_defaults",
+        "modify_atime",
+        "open_file",
+        "is_mp4_format",
+        "is_gif_format",
+        "is_png_format",
+        "is_webm_format",
+        "is_mov_format",
+        "write_to_movie",
+    ),
+    ".utils.images": (
+        "get_full_raster_image_path",
+        "drag_pixels",
+        "invert_image",
+    ),
+    ".utils.iterables": (
+        "remove_list_redundancies",
+        "list_update",
+        "list_difference_update",
+        "all_elements_are_instances",
+        "adjacent_n_tuples",
+        "adjacent_pairs",
+        "tuplify",
+        "stretch_array_to_length",
+        "make_even",
+        "make_even_by_cycling",
+        "remove_nones",
+        "concatenate_lists",
+        "listify",
+    ),
+    ".utils.paths": (
+        "straight_path",
+        "path_along_arc",
+        "clockwise_path",
+        "counterclockwise_path",
+    ),
+    ".utils.rate_functions": (
+        "linear",
+        "smooth",
+        "rush_into",
+        "rush_from",
+        "slow_into",
+        "double_smooth",
+        "there_and_back",
+        "there_and_back_with_pause",
+        "running_start",
+        "not_quite_there",
+        "wiggle",
+        "squish_rate_func",
+        "lingering",
+        "exponential_decay",
+    ),
+    ".utils.simple_functions": (
+        "sigmoid",
+        "choose_using_cache",
+        "choose",
+        "get_num_args",
+        "get_parameters",
+        "clip_in_place",
+        "fdiv",
+        "binary_search",
+    ),
+    ".utils.sounds": ("get_full_sound_file_path",),
+    ".utils.space_ops": (
+        "quaternion_mult",
+        "quaternion_from_angle_axis",
+        "angle_axis_from_quaternion",
+        "quaternion_conjugate",
+        "rotate_vector",
+        "thick_diagonal",
+        "rotation_matrix",
+        "rotation_about_z",
+        "z_to_vector",
+        "angle_of_vector",
+        "angle_between_vectors",
+        "project_along_vector",
+        "normalize",
+        "get_unit_normal",
+        "compass_directions",
+        "regular_vertices",
+        "complex_to_R3",
+        "R3_to_complex",
+        "complex_func_to_R3_func",
+        "center_of_mass",
+        "midpoint",
+        "find_intersection",
+        "line_intersection",
+        "get_winding_number",
+        "cross2d",
+        "earclip_triangulation",
+    ),
+    ".utils.strings": (
+        "to_camel_case",
+        "initials",
+        "camel_case_initials",
+        "complex_string",
+        "split_string_to_isolate_substrings",
+        "split_string_list_to_isolate_substrings",
+    ),
+    ".utils.tex": (
+        "TexTemplate",
+        "TexTemplateFromFile",
+    ),
+    ".utils.tex_templates": (
+        "TexTemplateLibrary",
+        "TexFontTemplates",
+    ),
+    ".utils.exceptions": ("EndSceneEarlyException",),
+    ".utils.hashing": ("get_hash_from_play_call",),
+}
+
+# Modules exported as a whole. Besides the ones imported explicitly, the star
+# import used to export the subpackages and the plugin modules loaded by then.
+_EXPORTED_MODULES = {
+    "color": ".utils.color",
+    "rate_functions": ".utils.rate_functions",
+    "unit": ".utils.unit",
+    "animation": ".animation",
+    "camera": ".camera",
+    "cli": ".cli",
+    "gui": ".gui",
+    "mobject": ".mobject",
+    "plugins": ".plugins",
+    "renderer": ".renderer",
+    "scene": ".scene",
+    "utils": ".utils",
+    "import_plugins": ".plugins.import_plugins",
+    "plugins_flags": ".plugins.plugins_flags",
+}
+
+_LAZY_EXPORTS = dict(_EXPORTED_MODULES)
+for _module_name, _names in _EXPORTS.items():
+    _LAZY_EXPORTS.update(dict.fromkeys(_names, _module_name))
+
+__all__ = [
+    "__version__",
+    "importlib_metadata",
+    "sys",
+    *_config.__all__,
+    "constants",
+    *constants.__all__,
+    "np",
+    "time",
+    "typing",
+    *_LAZY_EXPORTS,
+]
+
+
+def __getattr__(name):
+    """Import the module exporting ``name`` when it is first accessed.
 
-    from .utils.ipython_magic import ManimMagic
-except ImportError:
-    pass
-else:
-    ipy = get_ipython()
-    if ipy is not None:
-        ipy.register_magics(ManimMagic)
+    Names that are not exported are looked up as submodules, so that
+    ``manim.utils`` keeps working without importing ``manim.utils`` first.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        if name.startswith("__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if name in _EXPORTED_MODULES else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# Jupyter and IPython always import IPython before running any code, so there
+# is nothing to register when it has not been imported yet.
+if "IPython" in sys.modules:
+    try:
+        from IPython import get_ipython
+
+        from .utils.ipython_magic import ManimMagic
+    except ImportError:
+        pass
+    else:
+        ipy = get_ipython()
+        if ipy is not None:
+            ipy.register_magics(ManimMagic)
 
 from .plugins import *
+from .plugins.import_plugins import __all__ as _plugin_names
+
+__all__ += _plugin_names
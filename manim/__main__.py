@@ -9,6 +9,7 @@ from .cli.init.commands import init
 from .cli.new.group import new
 from .cli.plugins.commands import plugins
 from .cli.render.commands import render
+from .cli.serve.group import serve
 from .constants import EPILOG
 
 
@@ -46,6 +47,7 @@ main.add_command(plugins)
 main.add_command(init)
 main.add_command(new)
 main.add_command(render)
+main.add_command(serve)
 
 if __name__ == "__main__":
     main()
@@ -242,6 +242,8 @@ class ManimConfig(MutableMapping):
         "assets_dir",
         "background_color",
         "background_opacity",
+        "batch_vmobject_paths",
+        "cache_svg_geometry",
         "custom_folders",
         "disable_caching",
         "ffmpeg_loglevel",
@@ -259,6 +261,8 @@ class ManimConfig(MutableMapping):
         "webgl_renderer_path",
         "log_dir",
         "log_to_file",
+        "max_cache_age",
+        "max_cache_size",
         "max_files_cached",
         "media_dir",
         "movie_file_extension",
@@ -271,6 +275,7 @@ class ManimConfig(MutableMapping):
         "png_mode",
         "preview",
         "progress_bar",
+        "render_workers",
         "save_as_gif",
         "save_last_frame",
         "save_pngs",
@@ -521,6 +526,8 @@ class ManimConfig(MutableMapping):
             "disable_caching",
             "flush_cache",
             "custom_folders",
+            "batch_vmobject_paths",
+            "cache_svg_geometry",
             "use_opengl_renderer",
             "use_webgl_renderer",
             "enable_gui",
@@ -535,6 +542,9 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_cache_size",
+            "max_cache_age",
+            "render_workers",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -656,6 +666,9 @@ class ManimConfig(MutableMapping):
             "format",
             "flush_cache",
             "progress_bar",
+            "render_workers",
+            "batch_vmobject_paths",
+            "cache_svg_geometry",
             "transparent",
             "scene_names",
             "verbosity",
@@ -1005,6 +1018,24 @@ class ManimConfig(MutableMapping):
         doc="Maximum number of files cached.  Use -1 for infinity (no flag).",
     )
 
+    max_cache_size = property(
+        lambda self: self._d["max_cache_size"],
+        lambda self, val: self._set_pos_number("max_cache_size", val, True),
+        doc="Maximum total size of the files cached, in megabytes.  Use -1 for infinity (no flag).",
+    )
+
+    max_cache_age = property(
+        lambda self: self._d["max_cache_age"],
+        lambda self, val: self._set_pos_number("max_cache_age", val, True),
+        doc="Maximum number of days a cached file is kept unused.  Use -1 for infinity (no flag).",
+    )
+
+    render_workers = property(
+        lambda self: self._d["render_workers"],
+        lambda self, val: self._set_pos_number("render_workers", val, False),
+        doc="Number of processes rendering play calls concurrently.  Use 0 or 1 to render serially (--render_workers).",
+    )
+
     window_monitor = property(
         lambda self: self._d["window_monitor"],
         lambda self, val: self._set_pos_number("window_monitor", val, True),
@@ -1022,6 +1053,18 @@ class ManimConfig(MutableMapping):
         doc="Whether to use scene caching.",
     )
 
+    batch_vmobject_paths = property(
+        lambda self: self._d["batch_vmobject_paths"],
+        lambda self, val: self._set_boolean("batch_vmobject_paths", val),
+        doc="Whether the Cairo camera draws consecutive VMobjects with the same style as one path (--batch_vmobject_paths).",
+    )
+
+    cache_svg_geometry = property(
+        lambda self: self._d["cache_svg_geometry"],
+        lambda self, val: self._set_boolean("cache_svg_geometry", val),
+        doc="Whether the parsed geometry of SVG files is also saved as .npz next to them (--cache_svg_geometry).",
+    )
+
     png_mode = property(
         lambda self: self._d["png_mode"],
         lambda self, val: self._set_from_list("png_mode", val, ["RGB", "RGBA"]),
@@ -4,17 +4,18 @@
 __all__ = ["Camera", "BackgroundColoredVMobjectDisplayer"]
 
 import copy
+import hashlib
 import itertools as it
 import operator as op
 import pathlib
 import time
+from collections import OrderedDict
 from functools import reduce
 from typing import Union
 
 import cairo
 import numpy as np
 from PIL import Image
-from scipy.spatial.distance import pdist
 
 from .. import config, logger
 from ..constants import *
@@ -27,7 +28,10 @@ from ..utils.family import extract_mobject_family_members
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
 from ..utils.simple_functions import fdiv
-from ..utils.space_ops import angle_of_vector
+
+# Total number of pixels of the resampled images kept by each camera (two 4K
+# frames), see :meth:`Camera.get_resampled_image`.
+RESAMPLED_IMAGE_CACHE_PIXELS = 2 * 3840 * 2160
 
 
 class Camera:
@@ -113,6 +117,7 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        self.resampled_image_cache = OrderedDict()
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -596,8 +601,79 @@ class Camera:
             The Pixel array to add the VMobjects to.
         """
         ctx = self.get_cairo_context(pixel_array)
+        if not config["batch_vmobject_paths"]:
+            for vmobject in vmobjects:
+                self.display_vectorized(vmobject, ctx)
+            return
+        for style, batch in it.groupby(vmobjects, self.get_vmobject_style_key):
+            batch = list(batch)
+            if style is None or len(batch) == 1:
+                for vmobject in batch:
+                    self.display_vectorized(vmobject, ctx)
+            else:
+                self.display_vectorized_batch(batch, ctx)
+
+    def get_vmobject_style_key(self, vmobject):
+        """Returns a key identifying how the passed VMobject is filled and stroked.
+
+        VMobjects with equal keys can be drawn as one Cairo path, see
+        :meth:`display_vectorized_batch`.
+
+        Parameters
+        ----------
+        vmobject : VMobject
+            The VMobject
+
+        Returns
+        -------
+        Optional[tuple]
+            The colors and widths of the fill and strokes, or ``None`` if the
+            VMobject uses gradients, which depend on its own points.
+        """
+        fill_rgbas = self.get_fill_rgbas(vmobject)
+        stroke_rgbas = self.get_stroke_rgbas(vmobject)
+        background_stroke_rgbas = self.get_stroke_rgbas(vmobject, background=True)
+        if len(fill_rgbas) != 1 or len(stroke_rgbas) != 1:
+            return None
+        if len(background_stroke_rgbas) != 1:
+            return None
+        return (
+            tuple(fill_rgbas[0]),
+            tuple(stroke_rgbas[0]),
+            vmobject.get_stroke_width(),
+            tuple(background_stroke_rgbas[0]),
+            vmobject.get_stroke_width(background=True),
+        )
+
+    def display_vectorized_batch(self, vmobjects, ctx):
+        """Displays VMobjects sharing the same style as one path in the cairo context
+
+        All VMobjects are filled first and stroked afterwards, so overlapping
+        VMobjects can look different than when displayed one after the other.
+
+        Parameters
+        ----------
+        vmobjects : list
+            The VMobjects to display. They must have the same
+            :meth:`get_vmobject_style_key`.
+        ctx : cairo.Context
+            The cairo context to use.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
+        ctx.new_path()
         for vmobject in vmobjects:
-            self.display_vectorized(vmobject, ctx)
+            points = self.transform_points_pre_display(vmobject, vmobject.points)
+            if len(points) > 0:
+                self.add_cairo_context_subpaths(ctx, vmobject, points)
+        style_reference = vmobjects[0]
+        self.apply_stroke(ctx, style_reference, background=True)
+        self.apply_fill(ctx, style_reference)
+        self.apply_stroke(ctx, style_reference)
+        return self
 
     def display_vectorized(self, vmobject, ctx):
         """Displays a VMobject in the cairo context
@@ -642,17 +718,30 @@ class Camera:
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        self.add_cairo_context_subpaths(ctx, vmobject, points)
+        return self
+
+    def add_cairo_context_subpaths(self, ctx, vmobject, points):
+        """Adds the subpaths defined by the points of a VMobject to the current
+        path of the cairo context
+
+        Parameters
+        ----------
+        ctx : cairo.Context
+            The cairo context
+        vmobject : VMobject
+            The VMobject
+        points : np.ndarray
+            The points of the VMobject, transformed for display.
+        """
+        for curves, is_closed in vmobject.get_subpath_curves_2d(points):
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*curves[0, 0].tolist())
+            # Handles and end anchor of each curve, as python floats
+            for x1, y1, x2, y2, x3, y3 in curves[:, 1:].reshape(-1, 6).tolist():
+                ctx.curve_to(x1, y1, x2, y2, x3, y3)
+            if is_closed:
                 ctx.close_path()
-        return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
         """Sets the color of the cairo context
@@ -853,29 +942,83 @@ class Camera:
         if len(points) == 0:
             return
         pixel_coords = self.points_to_pixel_coords(pmobject, points)
-        pixel_coords = self.thickened_coordinates(pixel_coords, thickness)
-        rgba_len = pixel_array.shape[2]
-
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
-
-        on_screen_indices = self.on_screen_pixels(pixel_coords)
-        pixel_coords = pixel_coords[on_screen_indices]
-        rgbas = rgbas[on_screen_indices]
+        nudges = self.get_thickening_nudges(thickness)
+        # Coordinates of every point for every nudge, in the order of
+        # thickened_coordinates.
+        xs = pixel_coords[:, 0] + nudges[:, 0, np.newaxis]
+        ys = pixel_coords[:, 1] + nudges[:, 1, np.newaxis]
+        on_screen = (xs >= 0) & (xs < self.pixel_width)
+        on_screen &= (ys >= 0) & (ys < self.pixel_height)
+        indices = (ys * self.pixel_width + xs)[on_screen]
+        point_indices = np.broadcast_to(np.arange(len(points)), xs.shape)[on_screen]
+
+        # A view of pixel_array, unless it is not contiguous.
+        flat_pixels = pixel_array.reshape((-1, pixel_array.shape[2]))
+        if np.all(rgbas[:, 3] >= 1):
+            # Opaque points simply cover what is below them, the last point
+            # drawn on a pixel wins.
+            rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
+            target = flat_pixels
+            if target.dtype.itemsize * target.shape[1] == 4:
+                # Copy each pixel as a single 32 bit value.
+                target = target.view(np.uint32)
+                rgbas = np.ascontiguousarray(rgbas).view(np.uint32)
+            target[indices] = rgbas[point_indices]
+        else:
+            self.blend_point_colors(flat_pixels, indices, rgbas, point_indices)
+        if not np.shares_memory(flat_pixels, pixel_array):
+            pixel_array[:, :] = flat_pixels.reshape(pixel_array.shape)
 
-        ph = self.pixel_height
-        pw = self.pixel_width
+    def blend_point_colors(self, flat_pixels, indices, rgbas, point_indices):
+        """Composites translucent colors over the pixels of a flattened pixel array.
 
-        flattener = np.array([1, pw], dtype="int")
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype("int")
+        The colors drawn on the same pixel are composited in order, as if they
+        were drawn one after the other. Like the colors drawn by cairo, the
+        colors of the pixel array are premultiplied by their alpha.
 
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+        Parameters
+        ----------
+        flat_pixels : np.ndarray
+            The pixel array, of shape ``(pixel_height * pixel_width, 4)``.
+        indices : np.ndarray
+            The index in ``flat_pixels`` of every color to draw.
+        rgbas : np.ndarray
+            The colors of the points, with values between 0 and 1.
+        point_indices : np.ndarray
+            The index in ``rgbas`` of every color to draw.
+        """
+        if len(indices) == 0:
+            return
+        # Sort by pixel, keeping the drawing order on each pixel.
+        order = np.argsort(indices, kind="stable")
+        indices = indices[order]
+        rgbas = rgbas.astype(np.float32)[point_indices[order]]
+        alphas = rgbas[:, 3]
+        starts = np.flatnonzero(np.diff(indices, prepend=-1))
+        pixels = indices[starts]
+
+        # Every color is dimmed by the colors drawn over it: the transparency
+        # above color i is the product of 1 - alpha of the colors after it on
+        # the same pixel, computed as a sum of logarithms. Clipping the
+        # transparency of opaque colors keeps the logarithms finite and hides
+        # what is below them just the same.
+        logs = np.log(np.maximum(1 - alphas, 1e-12))
+        suffix_sums = np.append(np.cumsum(logs[::-1])[::-1], 0)
+        ends = np.append(starts[1:], len(indices))
+        segment_ends = np.repeat(ends, np.diff(np.append(starts, len(indices))))
+        above = np.exp(suffix_sums[1:] - suffix_sums[segment_ends])
+        below = np.exp(suffix_sums[starts] - suffix_sums[ends])
+
+        weights = alphas * above
+        premultiplied = np.empty_like(rgbas)
+        premultiplied[:, :3] = rgbas[:, :3] * weights[:, np.newaxis]
+        premultiplied[:, 3] = weights
+        drawn = np.add.reduceat(premultiplied, starts, axis=0)
+        background = flat_pixels[pixels] / self.rgb_max_val
+        result = drawn + background * below[:, np.newaxis]
+        flat_pixels[pixels] = np.round(np.clip(result, 0, 1) * self.rgb_max_val).astype(
+            self.pixel_array_dtype
+        )
 
     def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
         """Displays multiple image mobjects by modifying the passed pixel_array.
@@ -904,44 +1047,118 @@ class Camera:
         ul_coords, ur_coords, dl_coords = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
+        pixel_width = max(int(np.linalg.norm(right_vect)), 1)
+        pixel_height = max(int(np.linalg.norm(down_vect)), 1)
+        source = image_mobject.get_pixel_array()
+        resampling = image_mobject.resampling_algorithm
+        key = (
+            hashlib.sha1(np.ascontiguousarray(source)).digest(),
+            source.shape,
+            source.dtype.str,
+            resampling,
+        )
+        sub_image = self.get_resampled_image(
+            key + (pixel_width, pixel_height),
+            lambda: Image.fromarray(source, mode="RGBA").resize(
+                (pixel_width, pixel_height), resample=resampling
+            ),
+        )
 
-        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
+        if (
+            right_vect[1] == 0
+            and down_vect[0] == 0
+            and right_vect[0] > 0
+            and down_vect[1] > 0
+        ):
+            # Upright images are pasted centered on their position.
+            center_coords = ul_coords + (right_vect + down_vect) / 2
+            x0, y0 = (center_coords - np.array(sub_image.size) / 2).astype(int)
+            x1, y1 = x0 + sub_image.size[0], y0 + sub_image.size[1]
+            visible = self.clip_to_frame(x0, y0, x1, y1)
+            if visible is None:
+                return
+            vx0, vy0, vx1, vy1 = visible
+            sub_image = sub_image.crop((vx0 - x0, vy0 - y0, vx1 - x0, vy1 - y0))
+        else:
+            # The resized image is mapped onto the parallelogram spanned by
+            # the corners, which accounts for rotations, shears and flips.
+            corners = np.array([ul_coords, ur_coords, dl_coords, ur_coords + down_vect])
+            visible = self.clip_to_frame(
+                *np.floor(corners.min(axis=0)), *np.ceil(corners.max(axis=0))
+            )
+            # Maps the coordinates in the resized image to the frame.
+            matrix = np.array([right_vect / pixel_width, down_vect / pixel_height]).T
+            if visible is None or abs(np.linalg.det(matrix)) < 1e-9:
+                return
+            vx0, vy0, vx1, vy1 = visible
+            inverse = np.linalg.inv(matrix)
+            offset = inverse @ (np.array([vx0, vy0]) - ul_coords)
+            coefficients = (*inverse[0], offset[0], *inverse[1], offset[1])
+            if resampling not in (Image.NEAREST, Image.BILINEAR):
+                resampling = Image.BICUBIC
+            resized = sub_image
+            sub_image = self.get_resampled_image(
+                key + (pixel_width, pixel_height, vx1 - vx0, vy1 - vy0, coefficients),
+                lambda: resized.transform(
+                    (vx1 - vx0, vy1 - vy0),
+                    Image.AFFINE,
+                    coefficients,
+                    resample=resampling,
+                ),
+            )
 
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=image_mobject.resampling_algorithm
+        # Paint on top of the covered part of the existing pixel array
+        region = pixel_array[vy0:vy1, vx0:vx1]
+        region[:, :] = np.array(
+            Image.alpha_composite(self.get_image(region), sub_image), dtype="uint8"
         )
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=image_mobject.resampling_algorithm, expand=1
-            )
+    def clip_to_frame(self, x0, y0, x1, y1):
+        """Returns the part of a pixel rectangle that is inside the frame.
 
-        # TODO, there is no accounting for a shear...
+        Parameters
+        ----------
+        x0, y0, x1, y1 : int
+            The pixel coordinates of the upper left (included) and lower right
+            (excluded) corners of the rectangle.
 
-        # Paste into an image as large as the camera's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)), mode="RGBA"
-        )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
-        )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        Returns
+        -------
+        Optional[Tuple[int, int, int, int]]
+            The corners of the visible part of the rectangle, or ``None`` if it
+            is not visible.
+        """
+        x0, x1 = max(int(x0), 0), min(int(x1), self.pixel_width)
+        y0, y1 = max(int(y0), 0), min(int(y1), self.pixel_height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def get_resampled_image(self, key, resample):
+        """Returns a resampled image, from the cache if it was computed before.
+
+        Parameters
+        ----------
+        key : tuple
+            Identifies the source image and the transformation applied to it.
+        resample : Callable[[], PIL.Image]
+            Computes the resampled image.
+
+        Returns
+        -------
+        PIL.Image
+            The resampled image.
+        """
+        cache = self.resampled_image_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        image = cache[key] = resample()
+        pixels = sum(cached.width * cached.height for cached in cache.values())
+        while pixels > RESAMPLED_IMAGE_CACHE_PIXELS and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+            pixels -= evicted.width * evicted.height
+        return image
 
     def overlay_rgba_array(self, pixel_array, new_array):
         """Overlays an RGBA array on top of the given Pixel array.
@@ -1086,8 +1303,11 @@ class Camera:
 
         """
         thickness = int(thickness)
-        _range = list(range(-thickness // 2 + 1, thickness // 2 + 1))
-        return np.array(list(it.product(_range, _range)))
+        _range = np.arange(-thickness // 2 + 1, thickness // 2 + 1)
+        nudges = np.empty((len(_range), len(_range), 2), dtype=int)
+        nudges[:, :, 0] = _range[:, np.newaxis]
+        nudges[:, :, 1] = _range
+        return nudges.reshape((-1, 2))
 
     def thickened_coordinates(self, pixel_coords, thickness):
         """Returns thickened coordinates for a passed array of pixel coords and
@@ -1106,9 +1326,8 @@ class Camera:
             Array of thickened pixel coords.
         """
         nudges = self.get_thickening_nudges(thickness)
-        pixel_coords = np.array([pixel_coords + nudge for nudge in nudges])
-        size = pixel_coords.size
-        return pixel_coords.reshape((size // 2, 2))
+        pixel_coords = nudges[:, np.newaxis, :] + pixel_coords
+        return pixel_coords.reshape((-1, 2))
 
     # TODO, reimplement using cairo matrix
     def get_coords_of_all_pixels(self):
@@ -97,6 +97,16 @@ class ThreeDCamera(Camera):
             return rgbas
         if vmobject.shade_in_3d and (vmobject.get_num_points() > 0):
             light_source_point = self.light_source.points[0]
+            # The shading only depends on the colors, the points and the light
+            # source. The shaded colors are cached on the mobject, which drops
+            # them along with its bounding box when its points change.
+            cache = vmobject._shaded_rgbas_cache
+            if cache is None:
+                cache = vmobject._shaded_rgbas_cache = {}
+            key = rgbas[:2].tobytes()
+            cached = cache.get(key)
+            if cached is not None and np.array_equal(cached[0], light_source_point):
+                return cached[1]
             if len(rgbas) < 2:
                 shaded_rgbas = rgbas.repeat(2, axis=0)
             else:
@@ -113,6 +123,11 @@ class ThreeDCamera(Camera):
                 get_3d_vmob_end_corner_unit_normal(vmobject),
                 light_source_point,
             )
+            shaded_rgbas.flags.writeable = False
+            if len(cache) >= 4:
+                # The colors change, e.g. during an animation: keep the cache small.
+                cache.clear()
+            cache[key] = (light_source_point.copy(), shaded_rgbas)
             return shaded_rgbas
         return rgbas
 
@@ -128,14 +143,18 @@ class ThreeDCamera(Camera):
         mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
         rot_matrix = self.get_rotation_matrix()
 
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
-
-        return sorted(mobjects, key=z_key)
+        # Assign a number to the three dimensional mobjects based on how
+        # close they are to the camera, the others are displayed last.
+        in_3d = [
+            i for i, mob in enumerate(mobjects) if getattr(mob, "shade_in_3d", False)
+        ]
+        z_keys = np.full(len(mobjects), np.inf)
+        if in_3d:
+            reference_points = np.array(
+                [mobjects[i].get_z_index_reference_point() for i in in_3d]
+            )
+            z_keys[in_3d] = np.dot(reference_points, rot_matrix[2])
+        return [mobjects[i] for i in np.argsort(z_keys, kind="stable")]
 
     def get_phi(self):
         """Returns the Polar angle (the angle off Z_AXIS) phi.
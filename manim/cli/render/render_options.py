@@ -79,6 +79,23 @@ render_options = option_group(
         type=float,
         help="Render at this frame rate.",
     ),
+    option(
+        "--render_workers",
+        type=int,
+        help="Render play calls in this many concurrent processes (Cairo only).",
+    ),
+    option(
+        "--batch_vmobject_paths",
+        is_flag=True,
+        default=None,
+        help="Draw consecutive VMobjects with the same style as one path (Cairo only).",
+    ),
+    option(
+        "--cache_svg_geometry",
+        is_flag=True,
+        default=None,
+        help="Save the geometry parsed from SVG files next to them as .npz (Cairo only).",
+    ),
     option(
         "--renderer",
         type=click.Choice(["cairo", "opengl", "webgl"], case_sensitive=False),
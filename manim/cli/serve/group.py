@@ -0,0 +1,148 @@
+"""Manim's serve subcommand.
+
+Manim's serve subcommand is accessed in the command-line interface via ``manim
+serve``. ``manim serve start`` starts a process rendering the jobs sent to it,
+and ``manim serve render`` sends a job to that process.
+
+"""
+import os
+import secrets
+import sys
+from pathlib import Path
+
+import click
+
+from ... import console, error_console
+from ...constants import CONTEXT_SETTINGS, EPILOG
+from ..cfg.group import value_from_string
+from .server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    default_socket_path,
+    make_server,
+    submit_job,
+)
+
+
+def address_options(func):
+    """Add the options selecting the address of the server."""
+    func = click.option(
+        "--token",
+        envvar="MANIM_SERVE_TOKEN",
+        help="Token of a server using a TCP port. Read from MANIM_SERVE_TOKEN "
+        "if not given.",
+    )(func)
+    func = click.option(
+        "--socket",
+        "socket_path",
+        type=click.Path(dir_okay=False),
+        help="Path of the Unix socket of the server. Defaults to a socket only "
+        "accessible by the current user.",
+    )(func)
+    func = click.option(
+        "--port",
+        type=int,
+        help="Use this TCP port instead of a Unix socket. Jobs sent to it need "
+        f"the token of the server. [default if Unix sockets are not available: "
+        f"{DEFAULT_PORT}]",
+    )(func)
+    func = click.option(
+        "--host",
+        default=DEFAULT_HOST,
+        show_default=True,
+        help="Host of a server using a TCP port.",
+    )(func)
+    return func
+
+
+def get_address(host, port, socket_path):
+    """The address selected with the options of :func:`address_options`."""
+    if port is not None:
+        if socket_path is not None:
+            raise click.UsageError("--port and --socket cannot be used together.")
+        return (host, port)
+    if socket_path is None:
+        socket_path = default_socket_path()
+    if socket_path is None:
+        return (host, DEFAULT_PORT)
+    return socket_path
+
+
+@click.group(
+    context_settings=CONTEXT_SETTINGS,
+    invoke_without_command=True,
+    no_args_is_help=True,
+    epilog=EPILOG,
+    help="Renders scenes in a long-lived process.",
+)
+@click.pass_context
+def serve(ctx):
+    """Responsible for the serve subcommand."""
+    pass
+
+
+@serve.command(context_settings=CONTEXT_SETTINGS)
+@address_options
+def start(host, port, socket_path, token):
+    """Start the process rendering the jobs sent with ``manim serve render``."""
+    # Import every module exported by manim now, so that the first job does
+    # not pay for it.
+    exec("from manim import *", {})
+    address = get_address(host, port, socket_path)
+    if isinstance(address, str):
+        token = None
+    elif token is None:
+        token = secrets.token_urlsafe()
+        console.print(
+            f"Send the jobs with --token {token} or set MANIM_SERVE_TOKEN={token}.",
+            markup=False,
+        )
+    server = make_server(address, token)
+    location = address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+    console.print(
+        f"Rendering the jobs sent to {location}, press Ctrl+C to stop.",
+        markup=False,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(address, str):
+            os.remove(address)
+
+
+@serve.command("render", context_settings=CONTEXT_SETTINGS, no_args_is_help=True)
+@click.argument("file", type=Path, required=True)
+@click.argument("scene_names", required=False, nargs=-1)
+@address_options
+@click.option(
+    "-s",
+    "--set",
+    "options",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Set a config option for this job, e.g. -s pixel_height=480.",
+)
+def render_scenes(file, scene_names, host, port, socket_path, token, options):
+    """Render SCENE(S) from the input FILE with a running ``manim serve``."""
+    overrides = {}
+    for option in options:
+        key, separator, value = option.partition("=")
+        if not separator:
+            raise click.BadParameter(f"{option} is not of the form KEY=VALUE.")
+        overrides[key] = value_from_string(value)
+
+    address = get_address(host, port, socket_path)
+    for event in submit_job(address, file, scene_names, overrides, token):
+        if event["event"] == "log":
+            console.print(f"{event['level']:<8} {event['message']}", markup=False)
+        elif event["event"] == "scene":
+            console.print(f"Rendering {event['scene']}")
+        elif event["event"] == "done":
+            for output_file in event["output_files"]:
+                console.print(output_file, markup=False)
+        elif event["event"] == "error":
+            error_console.print(event["message"], markup=False)
+            sys.exit(1)
@@ -0,0 +1,272 @@
+"""A long-lived render process for ``manim serve``.
+
+Rendering a scene with ``manim render`` imports the library, reads the config
+and parses the scene file in a fresh process, and every in-memory cache (e.g.
+of Tex and SVG geometry) is lost when it exits. The server keeps one process
+around instead: it renders the jobs it receives one after the other, only
+re-imports a scene file when its content changed, and streams the log and the
+rendered files back to the client.
+
+The protocol is line based: the client sends one JSON object describing the
+job, and the server answers with one JSON object per event, the last one being
+either ``{"event": "done", ...}`` or ``{"event": "error", ...}``.
+
+Every job makes the server import and run a Python file, so only the user
+running the server may submit jobs. By default, the server listens on a Unix
+socket only its owner can connect to. A server listening on a TCP port, which
+every local user can connect to, requires a token that is sent with each job.
+
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import traceback
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+from ... import config, logger, tempconfig
+from ...utils.module_ops import (
+    get_module,
+    get_scene_classes_from_module,
+    get_scenes_to_render,
+)
+
+__all__ = ["default_socket_path", "make_server", "render_job", "submit_job"]
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7711
+
+Address = Union[str, Tuple[str, int]]
+
+# Resolved path of each scene file rendered so far -> (digest of its source,
+# imported module).
+_modules = {}
+
+
+def default_socket_path() -> Optional[str]:
+    """The path of the Unix socket used when no address is given.
+
+    The socket is placed in a directory that only the current user can access.
+    Returns ``None`` if Unix sockets are not available on this platform.
+    """
+    if not hasattr(socketserver, "UnixStreamServer") or not hasattr(os, "getuid"):
+        return None
+    directory = os.path.join(tempfile.gettempdir(), f"manim-serve-{os.getuid()}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return os.path.join(directory, "socket")
+
+
+class _EventHandler(logging.Handler):
+    """Forwards the records of manim's logger to the client."""
+
+    def __init__(self, send):
+        super().__init__()
+        self.send = send
+
+    def emit(self, record):
+        try:
+            self.send(
+                {
+                    "event": "log",
+                    "level": record.levelname,
+                    "message": record.getMessage().strip(),
+                }
+            )
+        except OSError:
+            # The client went away, render the job anyway.
+            pass
+
+
+def load_scene_module(file: Path):
+    """Import the scene file, unless it was already imported and is unchanged."""
+    path = Path(file).resolve()
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    cached = _modules.get(path)
+    if cached is None or cached[0] != digest:
+        logger.debug("Importing %(path)s", {"path": str(path)})
+        cached = _modules[path] = (digest, get_module(path))
+    return cached[1]
+
+
+def render_job(job: dict, send) -> None:
+    """Render the scenes of a job.
+
+    Parameters
+    ----------
+    job
+        The job, with the keys ``file`` (path of the scene file),
+        ``scene_names`` (optional list of scenes to render) and ``config``
+        (optional dict of config options to use for this job only).
+    send
+        Called with the dict of every event to report to the client.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If the job cannot be rendered by this server.
+    """
+    overrides = dict(job.get("config", {}))
+    unknown = [key for key in overrides if key not in config]
+    if unknown:
+        raise ValueError(f"Unknown config options: {', '.join(unknown)}")
+    if overrides.get("renderer", config.renderer) != config.renderer:
+        raise ValueError(
+            f"This server renders with the {config.renderer} renderer, "
+            "start another one to use a different renderer."
+        )
+    if job["file"] == "-":
+        raise ValueError("Scenes cannot be read from the standard input.")
+    overrides["scene_names"] = list(job.get("scene_names", []))
+    output_files = []
+    with tempconfig(overrides):
+        config.input_file = Path(job["file"]).absolute()
+        module = load_scene_module(config.input_file)
+        scene_classes = get_scene_classes_from_module(module)
+        if len(scene_classes) > 1 and not config.scene_names and not config.write_all:
+            raise ValueError(
+                "The file contains several scenes, "
+                "pass the scenes to render or set write_all."
+            )
+        requested_output_file = config.output_file
+        for SceneClass in get_scenes_to_render(scene_classes):
+            config.output_file = requested_output_file
+            send({"event": "scene", "scene": SceneClass.__name__})
+            scene = SceneClass()
+            scene.render()
+            output_files.extend(
+                str(file) for file in scene.renderer.file_writer.output_files
+            )
+    send({"event": "done", "output_files": output_files})
+
+
+class RenderJobHandler(socketserver.StreamRequestHandler):
+    """Reads a job from the connection and renders it."""
+
+    def send(self, event: dict) -> None:
+        self.wfile.write(json.dumps(event).encode() + b"\n")
+        self.wfile.flush()
+
+    def handle(self):
+        try:
+            job = json.loads(self.rfile.readline())
+        except ValueError as e:
+            self.send({"event": "error", "message": f"Malformed job: {e}"})
+            return
+        token = self.server.token
+        if token is not None and not hmac.compare_digest(
+            str(job.get("token", "")), token
+        ):
+            logger.warning("Rejected a render job with a wrong token.")
+            self.send({"event": "error", "message": "Wrong token."})
+            return
+        handler = _EventHandler(self.send)
+        logger.addHandler(handler)
+        try:
+            render_job(job, self.send)
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        finally:
+            logger.removeHandler(handler)
+        if error is not None:
+            logger.error("Render job failed: %(error)s", {"error": error})
+            message = "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            )
+            self.send({"event": "error", "message": message})
+
+
+class _TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+def make_server(
+    address: Address, token: Optional[str] = None
+) -> socketserver.BaseServer:
+    """Create the server for ``manim serve``.
+
+    Jobs are rendered one after the other, since they all use the global
+    config.
+
+    Parameters
+    ----------
+    address
+        Either the path of a Unix socket, or a ``(host, port)`` pair.
+    token
+        The token the jobs have to be sent with. Required for TCP ports, which
+        other users can connect to. Unix sockets are only accessible by their
+        owner.
+
+    Raises
+    ------
+    :class:`ValueError`
+        If no token is given for a TCP port.
+    """
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.remove(address)
+        # Create the socket without permissions for other users.
+        umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(address, RenderJobHandler)
+        finally:
+            os.umask(umask)
+    else:
+        if not token:
+            raise ValueError("A token is required to serve on a TCP port.")
+        server = _TCPServer(address, RenderJobHandler)
+    server.token = token
+    return server
+
+
+def submit_job(
+    address: Address,
+    file: Union[str, Path],
+    scene_names: Optional[list] = None,
+    config_overrides: Optional[dict] = None,
+    token: Optional[str] = None,
+) -> Iterator[dict]:
+    """Send a render job to a running ``manim serve`` and yield its events.
+
+    Parameters
+    ----------
+    address
+        Either the path of the server's Unix socket, or a ``(host, port)`` pair.
+    file
+        The path of the scene file.
+    scene_names
+        The scenes to render.
+    config_overrides
+        Config options used for this job only.
+    token
+        The token of the server, if it requires one.
+
+    Yields
+    ------
+    :class:`dict`
+        The events sent by the server, until the job is done or failed.
+    """
+    job = {
+        "file": str(Path(file).absolute()),
+        "scene_names": list(scene_names or []),
+        "config": config_overrides or {},
+    }
+    if token is not None:
+        job["token"] = token
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as connection:
+        connection.connect(address)
+        connection.sendall(json.dumps(job).encode() + b"\n")
+        with connection.makefile("rb") as events:
+            for line in events:
+                event = json.loads(line)
+                yield event
+                if event["event"] in ("done", "error"):
+                    return
@@ -407,6 +407,8 @@ class CoordinateSystem:
 
         kwargs
             Additional parameters to be passed to :class:`~.ParametricFunction`.
+            With ``vectorized=True``, ``function`` is called once with the array
+            of all the sampled values of ``x``.
 
         Returns
         -------
@@ -424,9 +426,18 @@ class CoordinateSystem:
         # For axes, the third coordinate of x_range indicates
         # tick frequency.  But for functions, it indicates a
         # sample frequency
-        graph = ParametricFunction(
-            lambda t: self.coords_to_point(t, function(t)), t_range=t_range, **kwargs
-        )
+        if kwargs.get("vectorized", False):
+            # coords_to_point gives one point per row, ParametricFunction
+            # expects one coordinate per row.
+            def parametric_function(t):
+                return self.coords_to_point(t, function(t)).T
+
+        else:
+
+            def parametric_function(t):
+                return self.coords_to_point(t, function(t))
+
+        graph = ParametricFunction(parametric_function, t_range=t_range, **kwargs)
         graph.underlying_function = function
         return graph
 
@@ -1138,12 +1149,13 @@ class Axes(VGroup, CoordinateSystem, metaclass=ConvertToOpenGL):
         -------
         np.ndarray
             A point that results from a change of basis from the coordinate system
-            defined by the :class:`Axes` to that of ``manim``'s default coordinate system
+            defined by the :class:`Axes` to that of ``manim``'s default coordinate system.
+            If the coordinates are arrays, the array of the corresponding points.
         """
         origin = self.x_axis.number_to_point(self.origin_shift(self.x_range))
         result = np.array(origin)
         for axis, coord in zip(self.get_axes(), coords):
-            result += axis.number_to_point(coord) - origin
+            result = result + (axis.number_to_point(coord) - origin)
         return result
 
     def point_to_coords(self, point: float) -> Tuple:
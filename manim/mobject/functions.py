@@ -45,6 +45,42 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
                 self.add(axes, curve1)
                 self.set_camera_orientation(phi=80 * DEGREES, theta=-60 * DEGREES)
                 self.wait()
+
+    Functions written with numpy operations can be evaluated on all the sampled
+    values of ``t`` at once by passing ``vectorized=True``; ``function`` then
+    receives an array of values of ``t`` and returns the array of each coordinate
+    (scalar coordinates are broadcast). With ``adaptive=True``, the samples are
+    refined where the curve bends or jumps between two samples::
+
+        ParametricFunction(
+            lambda t: (np.cos(t), np.sin(t), 0),
+            t_range=[0, TAU, 0.5],
+            vectorized=True,
+            adaptive=True,
+        )
+
+    Parameters
+    ----------
+    function
+        The function mapping ``t`` to a point.
+    t_range
+        The range ``[t_min, t_max, t_step]`` of the parameter, ``t_step``
+        defaulting to 0.01.
+    dt
+        The distance from the discontinuities at which the curve is cut.
+    discontinuities
+        The values of ``t`` where the function is discontinuous.
+    use_smoothing
+        Whether to smooth the curve after sampling it.
+    vectorized
+        Whether ``function`` can be called with an array of values of ``t``.
+    adaptive
+        Whether to sample more finely than ``t_step`` where it is needed.
+    adaptive_tolerance
+        The largest distance allowed between the middle of a segment of the
+        sampled curve and the point of the curve halfway through it.
+    adaptive_max_depth
+        The largest number of times a step of ``t_step`` is halved.
     """
 
     def __init__(
@@ -54,6 +90,10 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         dt=1e-8,
         discontinuities=None,
         use_smoothing=True,
+        vectorized=False,
+        adaptive=False,
+        adaptive_tolerance=1e-3,
+        adaptive_max_depth=8,
         **kwargs
     ):
         self.function = function
@@ -64,6 +104,10 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         self.dt = dt
         self.discontinuities = [] if discontinuities is None else discontinuities
         self.use_smoothing = use_smoothing
+        self.vectorized = vectorized
+        self.adaptive = adaptive
+        self.adaptive_tolerance = adaptive_tolerance
+        self.adaptive_max_depth = adaptive_max_depth
         self.t_min, self.t_max, self.t_step = t_range
 
         super().__init__(**kwargs)
@@ -74,6 +118,57 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
     def get_point_from_function(self, t):
         return self.function(t)
 
+    def get_points_from_function(self, t_values):
+        """Returns the array of the points of the curve at each value of ``t_values``."""
+        if not self.vectorized:
+            return np.array([self.function(t) for t in t_values])
+        coords = self.function(t_values)
+        return np.stack(
+            [np.broadcast_to(coord, t_values.shape) for coord in coords], axis=-1
+        )
+
+    def refine_samples(self, t_values, points):
+        """Adds samples where the curve is not approximated well enough.
+
+        The middle of every segment between two consecutive samples is compared to
+        the point of the curve halfway through it, and the segments where they are
+        further apart than :attr:`adaptive_tolerance` are split in two, up to
+        :attr:`adaptive_max_depth` times. Curved or discontinuous parts of the
+        curve are thus sampled more finely, and the rest keeps ``t_step``.
+
+        Parameters
+        ----------
+        t_values
+            The sampled values of ``t``, in increasing order.
+        points
+            The points of the curve at ``t_values``.
+
+        Returns
+        -------
+        Tuple[:class:`np.ndarray`, :class:`np.ndarray`]
+            The refined values of ``t`` and the corresponding points.
+        """
+        to_split = np.ones(len(t_values) - 1, dtype=bool)
+        for _ in range(self.adaptive_max_depth):
+            segments = np.flatnonzero(to_split)
+            if len(segments) == 0:
+                break
+            mid_t = (t_values[segments] + t_values[segments + 1]) / 2
+            mid_points = self.get_points_from_function(mid_t)
+            chord_middles = (points[segments] + points[segments + 1]) / 2
+            errors = np.linalg.norm(mid_points - chord_middles, axis=1)
+            # NaN errors (e.g. at a pole) are not refined further.
+            split = errors > self.adaptive_tolerance
+            segments = segments[split]
+            t_values = np.insert(t_values, segments + 1, mid_t[split])
+            points = np.insert(points, segments + 1, mid_points[split], axis=0)
+            # Both halves of each split segment are checked again.
+            left_halves = segments + np.arange(len(segments))
+            to_split = np.zeros(len(t_values) - 1, dtype=bool)
+            to_split[left_halves] = True
+            to_split[left_halves + 1] = True
+        return t_values, points
+
     def generate_points(self):
 
         discontinuities = filter(
@@ -91,7 +186,9 @@ class ParametricFunction(VMobject, metaclass=ConvertToOpenGL):
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
             t_range = np.array([*np.arange(t1, t2, self.t_step), t2])
-            points = np.array([self.function(t) for t in t_range])
+            points = self.get_points_from_function(t_range)
+            if self.adaptive:
+                t_range, points = self.refine_samples(t_range, points)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
         if self.use_smoothing:
@@ -137,7 +234,9 @@ class FunctionGraph(ParametricFunction):
             x_range = np.array([-config["frame_x_radius"], config["frame_x_radius"]])
 
         self.x_range = x_range
-        self.parametric_function = lambda t: np.array([t, function(t), 0])
+        self.parametric_function = lambda t: np.array(
+            [t, function(t), np.zeros_like(t)]
+        )
         self.function = function
         super().__init__(self.parametric_function, self.x_range, color=color, **kwargs)
 
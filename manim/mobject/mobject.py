@@ -11,6 +11,7 @@ import random
 import sys
 import types
 import warnings
+import weakref
 from functools import reduce
 from math import ceil
 from pathlib import Path
@@ -61,6 +62,24 @@ T = TypeVar("T", bound="Mobject")
 if TYPE_CHECKING:
     from ..animation.animation import Animation
 
+# Whether each updater takes a ``dt`` parameter, resolved once when it is added
+# instead of on every call.
+_updater_uses_dt = weakref.WeakKeyDictionary()
+
+
+def _uses_dt(updater: Updater) -> bool:
+    """Returns whether ``updater`` takes a ``dt`` parameter."""
+    try:
+        return _updater_uses_dt[updater]
+    except (KeyError, TypeError):
+        uses_dt = "dt" in get_parameters(updater)
+    try:
+        _updater_uses_dt[updater] = uses_dt
+    except TypeError:
+        # Not weakly referenceable, it is inspected on every call.
+        pass
+    return uses_dt
+
 
 class Mobject:
     """Mathematical Object: base class for objects that can be displayed on screen.
@@ -100,9 +119,16 @@ class Mobject:
         self.target = target
         self.z_index = z_index
         self.point_hash = None
+        self.parents = []
+        self._bounding_box_cache = None
+        # Colors shaded by ThreeDCamera.modified_rgbas, dropped with the bounding box
+        self._shaded_rgbas_cache = None
+        self._family_cache = None
         self.submobjects = []
         self.updaters = []
         self.updating_suspended = False
+        # Whether the submobjects have updaters, None until has_updaters_in_family
+        self._submobjects_have_updaters = None
         self.reset_points()
         self.generate_points()
         self.init_colors()
@@ -114,7 +140,6 @@ class Mobject:
         self.gloss = 0.0
         self.shadow = 0.0
         self.needs_new_bounding_box = True
-        self.parents = []
         self.family = [self]
 
         self.init_gl_data()
@@ -203,30 +228,49 @@ class Mobject:
         pass
 
     def get_bounding_box(self):
-        if self.needs_new_bounding_box:
-            self.data["bounding_box"] = self.compute_bounding_box()
-            self.needs_new_bounding_box = False
-        return self.data["bounding_box"]
-
-    def compute_bounding_box(self):
-        all_points = np.vstack(
-            [
-                self.data["points"],
-                *(
-                    mob.get_bounding_box()
-                    for mob in self.get_family()[1:]
-                    if mob.has_points()
-                ),
-            ]
-        )
-        if len(all_points) == 0:
+        """Return the box bounding the points of this mobject and its family.
+
+        The box is cached on every member of the family until the points or
+        submobjects of the member or of one of its descendants are reassigned,
+        see :meth:`refresh_bounding_box`. Repeated calls to
+        :meth:`get_critical_point` and its pseudonyms therefore do not merge the
+        points of the whole family again.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The array ``[mins, mids, maxs]`` of the lower left, center and
+            upper right corners of the box. All zeros if the family has no points.
+        """
+        box = self._get_family_bounding_box()
+        if box is None:
             return np.zeros((3, self.dim))
-        else:
-            # Lower left and upper right corners
+        return box
+
+    def _get_family_bounding_box(self, anchors_only=False):
+        cache = self._bounding_box_cache
+        if cache is None:
+            cache = self._bounding_box_cache = {}
+        elif anchors_only in cache:
+            return cache[anchors_only]
+
+        submob_boxes = (
+            submob._get_family_bounding_box(anchors_only) for submob in self.submobjects
+        )
+        arrays = [box for box in submob_boxes if box is not None]
+        points = self.get_anchors() if anchors_only else self.points
+        if len(points) > 0:
+            arrays.append(points)
+        if arrays:
+            all_points = np.vstack(arrays)
             mins = all_points.min(0)
             maxs = all_points.max(0)
-            mids = (mins + maxs) / 2
-            return np.array([mins, mids, maxs])
+            box = np.array([mins, (mins + maxs) / 2, maxs])
+            box.flags.writeable = False
+        else:
+            box = None
+        cache[anchors_only] = box
+        return box
 
     @property
     def animate(self):
@@ -317,7 +361,14 @@ class Mobject:
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
         for k, v in self.__dict__.items():
+            if k == "parents":
+                # The parents outside of the copied mobjects are not copied, the
+                # links inside of them are restored from the submobjects below.
+                v = []
             setattr(result, k, copy.deepcopy(v, clone_from_id))
+        for submob in result.submobjects:
+            if result not in submob.parents:
+                submob.parents.append(result)
         result.original_id = str(id(self))
         return result
 
@@ -327,6 +378,42 @@ class Mobject:
         else:
             return str(self.name)
 
+    @property
+    def points(self) -> np.ndarray:
+        """The points of this mobject.
+
+        Assigning new points drops the cached bounding boxes of this mobject and
+        its ancestors, and its colors shaded in 3D. Call
+        :meth:`refresh_bounding_box` after modifying the array in place.
+        """
+        return self._points
+
+    @points.setter
+    def points(self, points: np.ndarray):
+        self._points = points
+        self.refresh_bounding_box()
+
+    @property
+    def submobjects(self) -> List["Mobject"]:
+        """The submobjects of this mobject.
+
+        Assigning a new list updates the :attr:`parents` of the submobjects and
+        drops the cached families and bounding boxes of this mobject and its
+        ancestors. Call :meth:`refresh_family` after modifying the list in place.
+        """
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects: List["Mobject"]):
+        for submob in self.__dict__.get("_submobjects", []):
+            if self in submob.parents:
+                submob.parents.remove(self)
+        self._submobjects = submobjects
+        for submob in submobjects:
+            if self not in submob.parents:
+                submob.parents.append(self)
+        self.refresh_family()
+
     def reset_points(self):
         """Sets :attr:`points` to be an empty array."""
         self.points = np.zeros((0, self.dim))
@@ -348,11 +435,53 @@ class Mobject:
     def refresh_bounding_box(self, recurse_down=False, recurse_up=True):
         for mob in self.get_family(recurse_down):
             mob.needs_new_bounding_box = True
+            mob._bounding_box_cache = None
+            mob._shaded_rgbas_cache = None
         if recurse_up:
             for parent in self.parents:
                 parent.refresh_bounding_box()
         return self
 
+    def refresh_family(self) -> "Mobject":
+        """Drop the cached families and bounding boxes of ``self`` and its ancestors.
+
+        This is done when :attr:`submobjects` is assigned, and has to be done after
+        modifying :attr:`submobjects` in place.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+
+        """
+        self._family_cache = None
+        self._submobjects_have_updaters = None
+        self.refresh_bounding_box(recurse_up=False)
+        for parent in self.parents:
+            parent.refresh_family()
+        return self
+
+    def replace_submobject(self, index: int, new_submob: "Mobject") -> "Mobject":
+        """Replace the submobject at the given index.
+
+        Parameters
+        ----------
+        index
+            The index of the submobject to replace.
+        new_submob
+            The mobject to put in its place.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+
+        """
+        submobjects = list(self.submobjects)
+        submobjects[index] = new_submob
+        self.submobjects = submobjects
+        return self
+
     def add(self, *mobjects: "Mobject") -> "Mobject":
         """Add mobjects as submobjects.
 
@@ -517,6 +646,9 @@ class Mobject:
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+                if self in mobject.parents:
+                    mobject.parents.remove(self)
+        self.refresh_family()
         return self
 
     def __sub__(self, other):
@@ -774,7 +906,8 @@ class Mobject:
     def update(self, dt: float = 0, recursive: bool = True) -> "Mobject":
         """Apply all updaters.
 
-        Does nothing if updating is suspended.
+        Does nothing if updating is suspended, or if neither ``self`` nor its
+        submobjects have updaters (see :meth:`has_updaters_in_family`).
 
         Parameters
         ----------
@@ -794,11 +927,10 @@ class Mobject:
         :meth:`get_updaters`
 
         """
-        if self.updating_suspended:
+        if self.updating_suspended or not self.has_updaters_in_family():
             return self
         for updater in self.updaters:
-            parameters = get_parameters(updater)
-            if "dt" in parameters:
+            if _uses_dt(updater):
                 updater(self, dt)
             else:
                 updater(self)
@@ -823,7 +955,7 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [updater for updater in self.updaters if "dt" in get_parameters(updater)]
+        return [updater for updater in self.updaters if _uses_dt(updater)]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -838,10 +970,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        for updater in self.updaters:
-            if "dt" in get_parameters(updater):
-                return True
-        return False
+        return any(map(_uses_dt, self.updaters))
 
     def get_updaters(self) -> List[Updater]:
         """Return all updaters.
@@ -862,6 +991,50 @@ class Mobject:
     def get_family_updaters(self):
         return list(it.chain(*[sm.get_updaters() for sm in self.get_family()]))
 
+    def has_updaters_in_family(self) -> bool:
+        """Test if ``self`` or any of its submobjects (recursively) has updaters.
+
+        The result for the submobjects is cached until the updaters or submobjects
+        of a descendant change, so that :meth:`update` skips the families without
+        updaters.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if at least one mobject of the family has an updater.
+
+        See Also
+        --------
+        :meth:`refresh_has_updater_status`
+
+        """
+        if self.updaters:
+            return True
+        if self._submobjects_have_updaters is None:
+            self._submobjects_have_updaters = any(
+                submob.has_updaters_in_family() for submob in self.submobjects
+            )
+        return self._submobjects_have_updaters
+
+    def refresh_has_updater_status(self) -> "Mobject":
+        """Invalidate the cached results of :meth:`has_updaters_in_family` of ``self``
+        and its ancestors.
+
+        This is done by the methods adding or removing updaters and submobjects,
+        such as :meth:`add_updater` and :meth:`add`, and has to be done after
+        modifying :attr:`updaters` or :attr:`submobjects` in place.
+
+        Returns
+        -------
+        :class:`Mobject`
+            ``self``
+
+        """
+        self._submobjects_have_updaters = None
+        for parent in self.parents:
+            parent.refresh_has_updater_status()
+        return self
+
     def add_updater(
         self,
         update_function: Updater,
@@ -927,6 +1100,8 @@ class Mobject:
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
+        _uses_dt(update_function)
+        self.refresh_has_updater_status()
         if call_updater:
             update_function(self, 0)
         return self
@@ -956,6 +1131,7 @@ class Mobject:
         """
         while update_function in self.updaters:
             self.updaters.remove(update_function)
+        self.refresh_has_updater_status()
         return self
 
     def clear_updaters(self, recursive: bool = True) -> "Mobject":
@@ -979,6 +1155,7 @@ class Mobject:
 
         """
         self.updaters = []
+        self.refresh_has_updater_status()
         if recursive:
             for submob in self.submobjects:
                 submob.clear_updaters()
@@ -1852,11 +2029,10 @@ class Mobject:
         ]
 
     def get_merged_array(self, array_attr):
-        result = getattr(self, array_attr)
+        arrays = [getattr(self, array_attr)]
         for submob in self.submobjects:
-            result = np.append(result, submob.get_merged_array(array_attr), axis=0)
-            submob.get_merged_array(array_attr)
-        return result
+            arrays.append(submob.get_merged_array(array_attr))
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self):
         return self.get_merged_array("points")
@@ -1874,7 +2050,7 @@ class Mobject:
 
     def get_extremum_along_dim(self, points=None, dim=0, key=0):
         if points is None:
-            points = self.get_points_defining_boundary()
+            return self.get_bounding_box()[int(np.sign(key)) + 1, dim]
         values = points[:, dim]
         if key < 0:
             return np.min(values)
@@ -1898,15 +2074,8 @@ class Mobject:
             max_y_3 = sample.get_extremum_along_dim(dim=1, key=1)
 
         """
-        result = np.zeros(self.dim)
-        all_points = self.get_points_defining_boundary()
-        if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points, dim=dim, key=direction[dim]
-            )
-        return result
+        keys = np.sign(np.asarray(direction)[: self.dim]).astype(int)
+        return self.get_bounding_box()[keys + 1, np.arange(self.dim)]
 
     # Pseudonyms for more general get_critical_point method
 
@@ -1979,9 +2148,10 @@ class Mobject:
 
     def length_over_dim(self, dim):
         """Measure the length of an :class:`~.Mobject` in a certain direction."""
-        return self.reduce_across_dimension(
-            np.max, np.max, dim
-        ) - self.reduce_across_dimension(np.min, np.min, dim)
+        box = self._get_family_bounding_box()
+        if box is None:
+            return 0
+        return box[2, dim] - box[0, dim]
 
     def get_coord(self, dim, direction=ORIGIN):
         """Meant to generalize ``get_x``, ``get_y`` and ``get_z``"""
@@ -2143,9 +2313,17 @@ class Mobject:
             else:
                 return [self]
         else:
-            sub_families = list(map(Mobject.get_family, self.submobjects))
-            all_mobjects = [self] + list(it.chain(*sub_families))
-            return remove_list_redundancies(all_mobjects)
+            # The family is cached and shared between calls, like the OpenGL
+            # family list, until refresh_family is called.
+            if not recurse:
+                return [self]
+            family = self._family_cache
+            if family is None:
+                sub_families = map(Mobject.get_family, self.submobjects)
+                all_mobjects = [self] + list(it.chain(*sub_families))
+                family = remove_list_redundancies(all_mobjects)
+                self._family_cache = family
+            return family
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
@@ -2421,6 +2599,7 @@ class Mobject:
         if submob_func is None:
             submob_func = lambda m: point_to_num_func(m.get_center())
         self.submobjects.sort(key=submob_func)
+        self.refresh_family()
         return self
 
     def shuffle(self, recursive=False):
@@ -2429,6 +2608,7 @@ class Mobject:
             for submob in self.submobjects:
                 submob.shuffle(recursive=True)
         random.shuffle(self.submobjects)
+        self.refresh_family()
 
     def invert(self, recursive=False):
         """Inverts the list of :attr:`submobjects`.
@@ -2450,6 +2630,7 @@ class Mobject:
             for submob in self.submobjects:
                 submob.invert(recursive=True)
         list.reverse(self.submobjects)
+        self.refresh_family()
 
     # Just here to keep from breaking old scenes.
     def arrange_submobjects(self, *args, **kwargs):
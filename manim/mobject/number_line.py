@@ -274,8 +274,14 @@ class NumberLine(Line):
         return np.unique(np.concatenate((x_min_segment, x_max_segment)))
 
     def number_to_point(self, number):
-        alpha = float(number - self.x_min) / (self.x_max - self.x_min)
-        return interpolate(self.get_start(), self.get_end(), alpha)
+        """Returns the point on the line corresponding to ``number``.
+
+        An array of numbers gives the array of the corresponding points.
+        """
+        alpha = (np.asarray(number, dtype=float) - self.x_min) / (
+            self.x_max - self.x_min
+        )
+        return interpolate(self.get_start(), self.get_end(), alpha[..., np.newaxis])
 
     def point_to_number(self, point):
         start, end = self.get_start_and_end()
@@ -3,9 +3,11 @@
 __all__ = ["DecimalNumber", "Integer", "Variable"]
 
 import uuid
+from collections import OrderedDict
 
 import numpy as np
 
+from .. import config
 from ..constants import *
 from ..mobject.svg.tex_mobject import MathTex, SingleStringMathTex
 from ..mobject.types.vectorized_mobject import VMobject
@@ -13,6 +15,42 @@ from ..mobject.value_tracker import ValueTracker
 from ..utils.family import extract_mobject_family_members
 from .opengl_compatibility import ConvertToOpenGL
 
+#: Number of glyphs (digits, signs, ellipses, units...) kept in memory.
+GLYPH_ATLAS_SIZE = 1024
+
+# Maps the keys built in :func:`_get_glyph` to a prototype of the glyph, least
+# recently used first.
+_glyph_atlas = OrderedDict()
+
+
+def _get_glyph(tex_string, **kwargs):
+    """Returns a copy of ``SingleStringMathTex(tex_string, **kwargs)``.
+
+    The glyphs of a :class:`DecimalNumber` are built from a small alphabet, so
+    each of them is only typeset once per TeX template and style, and later
+    numbers are assembled from copies of it.
+    """
+    tex_template = kwargs.get("tex_template") or config["tex_template"]
+    key = (
+        tex_string,
+        config.renderer,
+        tex_template.body,
+        repr(
+            sorted(
+                (name, value)
+                for name, value in kwargs.items()
+                if name != "tex_template"
+            )
+        ),
+    )
+    if key in _glyph_atlas:
+        _glyph_atlas.move_to_end(key)
+    else:
+        _glyph_atlas[key] = SingleStringMathTex(tex_string, **kwargs)
+        if len(_glyph_atlas) > GLYPH_ATLAS_SIZE:
+            _glyph_atlas.popitem(last=False)
+    return _glyph_atlas[key].copy()
+
 
 class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
     """An mobject representing a decimal number.
@@ -95,18 +133,18 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
             else:
                 num_string = num_string[1:]
 
-        self.add(*[SingleStringMathTex(char, **kwargs) for char in num_string])
+        self.add(*[_get_glyph(char, **kwargs) for char in num_string])
 
         # Add non-numerical bits
         if self.show_ellipsis:
-            self.add(SingleStringMathTex("\\dots"))
+            self.add(_get_glyph("\\dots"))
 
         if num_string.startswith("-"):
             minus = self.submobjects[0]
             minus.next_to(self.submobjects[1], LEFT, buff=self.digit_to_digit_buff)
 
         if self.unit is not None:
-            self.unit_sign = SingleStringMathTex(self.unit, color=self.color)
+            self.unit_sign = _get_glyph(self.unit, color=self.color)
             self.add(self.unit_sign)
 
         self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
@@ -170,7 +170,7 @@ class BraceLabel(VMobject, metaclass=ConvertToOpenGL):
             obj = self.get_group_class()(*obj)
         self.brace = Brace(obj, self.brace_direction, **kwargs)
         self.brace.put_at_tip(self.label)
-        self.submobjects[0] = self.brace
+        self.replace_submobject(0, self.brace)
         return self
 
     def change_label(self, *text, **kwargs):
@@ -179,7 +179,7 @@ class BraceLabel(VMobject, metaclass=ConvertToOpenGL):
             self.label.scale(self.label_scale)
 
         self.brace.put_at_tip(self.label)
-        self.submobjects[1] = self.label
+        self.replace_submobject(1, self.label)
         return self
 
     def change_brace_label(self, obj, *text):
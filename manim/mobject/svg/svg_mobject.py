@@ -4,16 +4,22 @@
 __all__ = ["SVGMobject", "string_to_numbers"]
 
 
+import copy
+import hashlib
+import importlib
 import itertools as it
+import json
 import os
 import re
 import string
 import warnings
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, List, Optional
 from xml.dom.minidom import Element as MinidomElement
 from xml.dom.minidom import parse as minidom_parse
 
 import numpy as np
+from colour import Color
 
 from ... import config, logger
 from ...constants import *
@@ -23,6 +29,75 @@ from ..opengl_compatibility import ConvertToOpenGL
 from .style_utils import cascade_element_style, parse_style
 from .svg_path import SVGPathMobject, string_to_numbers
 
+#: Number of parsed SVG files whose geometry is kept in memory.
+SVG_GEOMETRY_CACHE_SIZE = 256
+
+# Maps the keys returned by :meth:`SVGMobject.get_geometry_cache_key` to the
+# mobjects parsed from the file, least recently used first.
+_geometry_cache = OrderedDict()
+
+#: Number of glyphs, i.e. definitions referenced by ``<use>`` elements, kept in memory.
+GLYPH_CACHE_SIZE = 4096
+
+# Maps the keys built in :meth:`SVGMobject.use_to_mobjects` to the mobjects
+# parsed from a definition, least recently used first.
+_glyph_cache = OrderedDict()
+
+# The style attributes of a path mobject that are saved with its points.
+_SAVED_STYLE_KEYS = [
+    "fill_color",
+    "fill_opacity",
+    "stroke_color",
+    "stroke_opacity",
+    "stroke_width",
+]
+
+
+def _detached_copy(mobjects):
+    """Copies a list of mobjects without the groups they have been added to."""
+    family = [member for mob in mobjects for member in mob.get_family()]
+    parents = [member.parents for member in family]
+    for member in family:
+        member.parents = []
+    try:
+        copies = copy.deepcopy(mobjects)
+    finally:
+        for member, member_parents in zip(family, parents):
+            member.parents = member_parents
+    for mob in copies:
+        for member in mob.get_family():
+            # Copies made from the same mobject would share its id otherwise.
+            vars(member).pop("original_id", None)
+            for submob in member.submobjects:
+                if member not in submob.parents:
+                    submob.parents.append(member)
+    return copies
+
+
+def _element_key(element):
+    """A hashable key of the content of an element, without the ids in it.
+
+    Cairo numbers the glyphs of each file in the order they are first used,
+    so the same glyph has different ids in the files of different strings.
+    """
+    attributes = tuple(
+        sorted(
+            (name, value) for name, value in element.attributes.items() if name != "id"
+        )
+    )
+    children = tuple(
+        _element_key(child)
+        for child in element.childNodes
+        if child.nodeType == child.ELEMENT_NODE
+    )
+    return element.tagName, attributes, children
+
+
+def _json_style_value(value):
+    if isinstance(value, Color):
+        return value.hex_l
+    return value
+
 
 class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
     """A SVGMobject is a Vector Mobject constructed from an SVG (or XDV) file.
@@ -130,17 +205,152 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         """Called by the Mobject abstract base class. Responsible for generating
         the SVGMobject's points from XML tags, populating self.mobjects, and
         any submobjects within self.mobjects.
+
+        The parsed mobjects are cached in memory, and if ``cache_svg_geometry``
+        is set, also saved next to the file, so that the same file with the same
+        style is only parsed once.
+        """
+        key = self.get_geometry_cache_key()
+        if key in _geometry_cache:
+            _geometry_cache.move_to_end(key)
+            self.add(*_detached_copy(_geometry_cache[key]))
+            return
+        mobjects = self.load_geometry(key)
+        if mobjects is None:
+            mobjects = self.parse_svg()
+            self.save_geometry(key, mobjects)
+        _geometry_cache[key] = _detached_copy(mobjects)
+        if len(_geometry_cache) > SVG_GEOMETRY_CACHE_SIZE:
+            _geometry_cache.popitem(last=False)
+        self.add(*mobjects)
+
+    init_points = generate_points
+
+    def parse_svg(self) -> List[VMobject]:
+        """Parses the SVG file.
+
+        Returns
+        -------
+        List[VMobject]
+            The mobjects to be added to the SVGMobject.
         """
+        result = []
         doc = minidom_parse(self.file_path)
         for svg in doc.getElementsByTagName("svg"):
             mobjects = self.get_mobjects_from(svg, self.generate_style())
             if self.unpack_groups:
-                self.add(*mobjects)
+                result += mobjects
             else:
-                self.add(*mobjects[0].submobjects)
+                result += mobjects[0].submobjects
         doc.unlink()
+        # The definitions are only needed while parsing.
+        self.def_map = {}
+        return result
 
-    init_points = generate_points
+    def get_geometry_cache_key(self) -> tuple:
+        """Returns the key under which the parsed geometry of the SVG file is cached.
+
+        The key depends on the content of the file rather than on its name, and on
+        everything else that changes the result of :meth:`parse_svg`.
+        """
+        with open(self.file_path, "rb") as svg_file:
+            content_hash = hashlib.sha256(svg_file.read()).hexdigest()
+        cls = type(self)
+        return (
+            content_hash,
+            f"{cls.__module__}.{cls.__qualname__}",
+            config.renderer,
+            self.unpack_groups,
+            tuple(sorted(self.path_string_config.items())),
+            tuple(sorted((k, str(v)) for k, v in self.generate_style().items())),
+        )
+
+    def get_geometry_file(self, key: tuple) -> str:
+        """Returns the path of the ``.npz`` file the geometry is saved to."""
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+        return f"{os.path.splitext(self.file_path)[0]}_{digest}.npz"
+
+    def save_geometry(self, key: tuple, mobjects: List[VMobject]):
+        """Saves the points and style of the parsed mobjects as ``.npz``.
+
+        This is only done if ``cache_svg_geometry`` is set, and only when the
+        mobjects are path mobjects without submobjects, like the glyphs of
+        :class:`~.Tex` and :class:`~.Text`.
+        """
+        if not config["cache_svg_geometry"] or config.renderer != "cairo":
+            return
+        if not all(
+            isinstance(mob, SVGPathMobject) and not mob.submobjects for mob in mobjects
+        ):
+            return
+        classes = [
+            f"{type(mob).__module__}:{type(mob).__qualname__}" for mob in mobjects
+        ]
+        styles = [
+            {key: _json_style_value(getattr(mob, key)) for key in _SAVED_STYLE_KEYS}
+            for mob in mobjects
+        ]
+        geometry_file = self.get_geometry_file(key)
+        temporary_file = f"{geometry_file[:-4]}_{os.getpid()}.npz"
+        try:
+            np.savez(
+                temporary_file,
+                points=np.concatenate(
+                    [np.zeros((0, self.dim))] + [mob.points for mob in mobjects]
+                ),
+                lengths=np.array([len(mob.points) for mob in mobjects], dtype=int),
+                classes=np.array(classes),
+                path_strings=np.array([mob.path_string for mob in mobjects]),
+                styles=np.array(json.dumps(styles)),
+            )
+            os.replace(temporary_file, geometry_file)
+        except (OSError, TypeError) as error:
+            logger.debug(
+                "Could not save the geometry of %(file)s: %(error)s",
+                {"file": self.file_path, "error": error},
+            )
+
+    def load_geometry(self, key: tuple) -> Optional[List[VMobject]]:
+        """Loads the mobjects saved by :meth:`save_geometry`.
+
+        Returns
+        -------
+        Optional[List[VMobject]]
+            The mobjects, or ``None`` if no geometry has been saved for ``key``.
+        """
+        if not config["cache_svg_geometry"] or config.renderer != "cairo":
+            return None
+        geometry_file = self.get_geometry_file(key)
+        if not os.path.exists(geometry_file):
+            return None
+        try:
+            with np.load(geometry_file, allow_pickle=False) as data:
+                points = data["points"]
+                lengths = data["lengths"]
+                classes = data["classes"].tolist()
+                path_strings = data["path_strings"].tolist()
+                styles = json.loads(data["styles"].item())
+        except (OSError, ValueError, KeyError) as error:
+            logger.debug(
+                "Could not load the geometry of %(file)s: %(error)s",
+                {"file": self.file_path, "error": error},
+            )
+            return None
+        mobjects = []
+        ends = np.cumsum(lengths)
+        for cls_name, path_string, style, start, end in zip(
+            classes, path_strings, styles, ends - lengths, ends
+        ):
+            module_name, cls_qualname = cls_name.split(":")
+            cls = importlib.import_module(module_name)
+            for name in cls_qualname.split("."):
+                cls = getattr(cls, name)
+            # The points are not parsed again from the path string.
+            mob = cls("", **self.path_string_config, **style)
+            mob.path_string = path_string
+            mob.points = points[start:end].copy()
+            mobjects.append(mob)
+        return mobjects
 
     def get_mobjects_from(
         self,
@@ -177,16 +387,20 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         style = cascade_element_style(element, inherited_style)
         is_defs = element.tagName == "defs"
 
+        if within_defs or is_defs:
+            # Definitions are only recorded here, they are parsed where they
+            # are used, see :meth:`use_to_mobjects`.
+            for child in element.childNodes:
+                self.get_mobjects_from(child, style, within_defs=True)
+            if within_defs and element.hasAttribute("id"):
+                self.def_map[element.getAttribute("id")] = (style, element)
+            return result
+
         if element.tagName == "style":
             pass  # TODO, handle style
         elif element.tagName in ["g", "svg", "symbol", "defs"]:
             result += it.chain(
-                *[
-                    self.get_mobjects_from(
-                        child, style, within_defs=within_defs or is_defs
-                    )
-                    for child in element.childNodes
-                ]
+                *[self.get_mobjects_from(child, style) for child in element.childNodes]
             )
         elif element.tagName == "path":
             temp = element.getAttribute("d")
@@ -215,14 +429,6 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         if len(result) > 1 and not self.unpack_groups:
             result = [group_cls(*result)]
 
-        if within_defs and element.hasAttribute("id"):
-            # it seems wasteful to throw away the actual element,
-            # but I'd like the parsing to be as similar as possible
-            self.def_map[element.getAttribute("id")] = (style, element)
-        if is_defs:
-            # defs shouldn't be part of the result tree, only the id dictionary.
-            return []
-
         return result
 
     def generate_style(self):
@@ -313,7 +519,29 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         style = local_style.copy()
         style.update(def_style)
 
-        return self.get_mobjects_from(def_element, style)
+        # Definitions are mostly glyphs, which are used many times and are the
+        # same across the files written for different strings in the same font.
+        # They are cached by their content without their ids, unless they refer
+        # to other definitions, which may differ from file to file.
+        if def_element.getElementsByTagName("use"):
+            return self.get_mobjects_from(def_element, style)
+        cls = type(self)
+        key = (
+            _element_key(def_element),
+            f"{cls.__module__}.{cls.__qualname__}",
+            config.renderer,
+            tuple(sorted(self.path_string_config.items())),
+            tuple(sorted((k, str(v)) for k, v in style.items())),
+        )
+        if key in _glyph_cache:
+            _glyph_cache.move_to_end(key)
+        else:
+            _glyph_cache[key] = _detached_copy(
+                self.get_mobjects_from(def_element, style)
+            )
+            if len(_glyph_cache) > GLYPH_CACHE_SIZE:
+                _glyph_cache.popitem(last=False)
+        return _detached_copy(_glyph_cache[key])
 
     def line_to_mobject(self, line_element: MinidomElement, style: dict):
         """Creates a Line VMobject from an SVG <line> element.
@@ -16,6 +16,41 @@ from ...utils.deprecation import deprecated
 from ..opengl_compatibility import ConvertToOpenGL
 from ..types.vectorized_mobject import VMobject
 
+#: The path commands, in the order of the codes returned by :func:`tokenize_path_string`.
+PATH_COMMANDS = "MLHVCSQTAZ"
+(
+    _MOVE,
+    _LINE,
+    _HORIZONTAL,
+    _VERTICAL,
+    _CUBIC,
+    _SMOOTH_CUBIC,
+    _QUADRATIC,
+    _SMOOTH_QUADRATIC,
+    _ARC,
+    _CLOSE,
+) = range(len(PATH_COMMANDS))
+
+NUMBER_REGEX = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+PATH_TOKEN_REGEX = re.compile(
+    f"[{PATH_COMMANDS}{PATH_COMMANDS.lower()}]|{NUMBER_REGEX.pattern}"
+)
+
+# Maps the code point of an uppercase command to its index in PATH_COMMANDS.
+_COMMAND_CODES = np.full(128, -1)
+_COMMAND_CODES[[ord(command) for command in PATH_COMMANDS]] = range(len(PATH_COMMANDS))
+
+# The number of numbers taken by one segment of each command.
+_COMMAND_ARITIES = np.array([2, 2, 1, 1, 6, 4, 4, 2, 7, 0])
+
+# The columns of the coordinates of the end point of each command; -1 means
+# that the coordinate does not change.
+_END_X_COLUMNS = np.array([0, 0, 0, -1, 4, 2, 2, 0, 5, -1])
+_END_Y_COLUMNS = np.array([1, 1, -1, 0, 5, 3, 3, 1, 6, -1])
+
+# The parameters of the points added by a line, see VMobject.add_line_to.
+_LINE_ALPHAS = np.linspace(0, 1, 4)[1:]
+
 
 def correct_out_of_range_radii(rx, ry, x1p, y1p):
     """Correction of out-of-range radii.
@@ -196,19 +231,382 @@ def string_to_numbers(num_string: str) -> List[float]:
     list(float)
         List of float values parsed out of the string.
     """
-    num_string = num_string.replace("-", ",-")
-    num_string = num_string.replace("e,-", "e-")
-    float_results = []
-    for s in re.split("[ ,]", num_string):
-        if s != "":
-            try:
-                float_results.append(float(s))
-            except ValueError:
-                # in this case, it's something like "2.4.3.14 which should be parsed as "2.4 0.3 0.14"
-                undotted_parts = s.split(".")
-                float_results.append(undotted_parts[0] + "." + undotted_parts[1])
-                float_results += ["." + u for u in undotted_parts[2:]]
-    return float_results
+    # Something like "2.4.3.14" is parsed as "2.4 .3 .14"
+    return [float(s) for s in NUMBER_REGEX.findall(num_string)]
+
+
+def tokenize_path_string(path_string: str):
+    """Split an SVG ``d`` attribute into its commands and their numbers.
+
+    The whole string is tokenized by a single regular expression, and the
+    tokens are converted to arrays at once.
+
+    Parameters
+    ----------
+    path_string : :class:`str`
+        A path with potentially multiple path commands.
+
+    Returns
+    -------
+    Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The index of each command in :data:`PATH_COMMANDS`, whether each command
+        is relative, the numbers of the path, and the index of the first number of
+        each command.
+    """
+    tokens = np.array(PATH_TOKEN_REGEX.findall(path_string) or [""])
+    is_command = np.char.isalpha(tokens)
+    command_positions = np.flatnonzero(is_command)
+    # Commands are single characters, so their code points can be looked up.
+    code_points = tokens[command_positions].astype("U1").view(np.uint32)
+    is_relative = code_points >= ord("a")
+    codes = _COMMAND_CODES[np.where(is_relative, code_points - 32, code_points)]
+    numbers = tokens[~is_command & (tokens != "")].astype(float)
+    number_starts = command_positions - np.arange(len(command_positions))
+    return codes, is_relative, numbers, number_starts
+
+
+def _vector_angles(ux, uy, vx, vy):
+    """Vectorized :func:`vector_angle`."""
+    sign = np.where(ux * vy - uy * vx < 0, -1, 1)
+    ua = np.sqrt(ux * ux + uy * uy)
+    va = np.sqrt(vx * vx + vy * vy)
+    dot = ux * vx + uy * vy
+    return sign * np.arccos(np.clip(dot / (ua * va), -1, 1))
+
+
+def elliptical_arcs_to_cubic_beziers(
+    starts, radii, phis, large_arc_flags, sweep_flags, ends
+):
+    """Generate cubic bezier curves approximating several SVG elliptical arcs at once.
+
+    This computes the same curves as :func:`elliptical_arc_to_cubic_bezier`
+    for every arc, with array operations.
+
+    Parameters
+    ----------
+    starts : :class:`numpy.ndarray`
+        The start points of the arcs, of shape ``(n, 2)``.
+    radii : :class:`numpy.ndarray`
+        The radii of the arcs, of shape ``(n, 2)``.
+    phis : :class:`numpy.ndarray`
+        The rotations of the arcs, in degrees.
+    large_arc_flags : :class:`numpy.ndarray`
+        Whether the arcs span more than 180 degrees.
+    sweep_flags : :class:`numpy.ndarray`
+        Whether the arcs are drawn in the positive-angle direction.
+    ends : :class:`numpy.ndarray`
+        The end points of the arcs, of shape ``(n, 2)``. They must differ from
+        the start points.
+
+    Returns
+    -------
+    Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The first handles, second handles and end anchors of the curves, of
+        shape ``(number of curves, 3, 2)``, and the number of curves of each arc.
+    """
+    x1, y1 = starts.T
+    x2, y2 = ends.T
+    # If rx or ry are 0 then the arc is treated as a straight line segment
+    # joining the endpoints. The radii are replaced to avoid dividing by zero.
+    is_line = (radii[:, 0] == 0) | (radii[:, 1] == 0)
+    rx = np.where(is_line, 1, np.abs(radii[:, 0]))
+    ry = np.where(is_line, 1, np.abs(radii[:, 1]))
+    phi = np.radians(phis % 360)
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+
+    # Conversion from endpoint to center parameterization, see
+    # get_elliptical_arc_center_parameters.
+    x = (x1 - x2) / 2
+    y = (y1 - y2) / 2
+    x1p = x * cos_phi + y * sin_phi
+    y1p = -x * sin_phi + y * cos_phi
+    Lambda = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    rx = np.where(Lambda > 1, np.sqrt(Lambda) * rx, rx)
+    ry = np.where(Lambda > 1, np.sqrt(Lambda) * ry, ry)
+    rx2 = rx * rx
+    ry2 = ry * ry
+    x1p2 = x1p * x1p
+    y1p2 = y1p * y1p
+    k = np.sqrt(
+        np.maximum((rx2 * ry2 - rx2 * y1p2 - ry2 * x1p2) / (rx2 * y1p2 + ry2 * x1p2), 0)
+    )
+    sign = np.where((large_arc_flags != 0) == (sweep_flags != 0), -1, 1)
+    cxp = sign * k * (rx * y1p) / ry
+    cyp = sign * k * (-ry * x1p) / rx
+    cx = cxp * cos_phi - cyp * sin_phi + (x1 + x2) / 2
+    cy = cxp * sin_phi + cyp * cos_phi + (y1 + y2) / 2
+    ux = (x1p - cxp) / rx
+    uy = (y1p - cyp) / ry
+    theta1 = _vector_angles(1, 0, ux, uy)
+    dtheta = np.degrees(_vector_angles(ux, uy, (-x1p - cxp) / rx, (-y1p - cyp) / ry))
+    dtheta %= 360
+    dtheta = np.radians(
+        np.where((sweep_flags == 0) & (dtheta > 0), dtheta - 360, dtheta)
+    )
+
+    # Chop the arcs into segments of at most 90 degrees if the sweep is a
+    # multiple of 90 degrees, and of at most 36 degrees otherwise.
+    sweep_limits = np.where(np.degrees(dtheta) % 90 == 0, 90, 36)
+    counts = np.ceil(np.abs(np.degrees(dtheta)) / sweep_limits).astype(int)
+    counts = np.where(is_line, 1, np.maximum(counts, 1))
+    segments = dtheta / counts
+    alphas = np.sin(segments) * (np.sqrt(4 + 3 * np.tan(segments / 2) ** 2) - 1) / 3
+
+    arc = np.repeat(np.arange(len(counts)), counts)
+    index = np.arange(len(arc)) - np.repeat(np.cumsum(counts) - counts, counts)
+    start_angles = theta1[arc] + index * segments[arc]
+    end_angles = start_angles + segments[arc]
+    # Like elliptical_arc_to_cubic_bezier, the curves use the radii as given.
+    rx, ry = radii[arc].T
+    cos_phi, sin_phi = cos_phi[arc], sin_phi[arc]
+
+    # Calculate the cubic bezier points from elliptical arc parametric equations.
+    # See: (the box on page 18) http://www.spaceroots.org/documents/ellipse/elliptical-arc.pdf
+    def derivatives(angles):
+        cos_angles = np.cos(angles)
+        sin_angles = np.sin(angles)
+        return np.stack(
+            [
+                -rx * cos_phi * sin_angles - ry * sin_phi * cos_angles,
+                -rx * sin_phi * sin_angles + ry * cos_phi * cos_angles,
+            ],
+            axis=1,
+        )
+
+    cos_end = np.cos(end_angles)
+    sin_end = np.sin(end_angles)
+    curve_ends = np.stack(
+        [
+            cx[arc] + rx * cos_phi * cos_end - ry * sin_phi * sin_end,
+            cy[arc] + rx * sin_phi * cos_end + ry * cos_phi * sin_end,
+        ],
+        axis=1,
+    )
+    is_last = index == counts[arc] - 1
+    curve_ends[is_last] = ends
+    curve_starts = np.roll(curve_ends, 1, axis=0)
+    curve_starts[index == 0] = starts
+    curves = np.stack(
+        [
+            curve_starts + alphas[arc, None] * derivatives(start_angles),
+            curve_ends - alphas[arc, None] * derivatives(end_angles),
+            curve_ends,
+        ],
+        axis=1,
+    )
+    is_line = is_line[arc]
+    curves[is_line, 0] = curve_starts[is_line]
+    curves[is_line, 1] = curve_ends[is_line]
+    return curves, counts
+
+
+def _resolve_coordinates(values, is_absolute, is_close, move_indices):
+    """Compute one coordinate of the end points of the segments of a path.
+
+    Relative coordinates are summed up with a cumulative sum restarting at each
+    absolute coordinate. A closepath goes back to the point of the last moveto,
+    which in turn may be relative to an earlier closepath; these chains are
+    resolved by pointer jumping.
+    """
+    n = len(values)
+    index = np.arange(n)
+    is_anchor = is_absolute | is_close
+    sums = np.append(np.cumsum(np.where(is_anchor, 0, values)), 0)
+    # The last anchor at or before each segment, n if there is none.
+    last_anchors = np.maximum.accumulate(np.where(is_anchor, index, -1))
+    last_anchors[last_anchors == -1] = n
+
+    bases = np.append(np.where(is_absolute, values, 0), 0)
+    parents = np.full(n + 1, n)
+    offsets = np.zeros(n + 1)
+    closes = np.flatnonzero(is_close)
+    moves = move_indices[closes]
+    parents[closes] = last_anchors[moves]
+    offsets[closes] = sums[moves] - sums[last_anchors[moves]]
+    is_close = np.append(is_close, False)
+    while True:
+        pending = closes[is_close[parents[closes]]]
+        if not len(pending):
+            break
+        offsets[pending] += offsets[parents[pending]]
+        parents[pending] = parents[parents[pending]]
+    bases[closes] = bases[parents[closes]] + offsets[closes]
+    return bases[last_anchors] + sums[:-1] - sums[last_anchors]
+
+
+def path_string_to_points(path_string: str) -> np.ndarray:
+    """Convert an SVG ``d`` attribute to the points of a :class:`~.VMobject`.
+
+    The path is tokenized by :func:`tokenize_path_string` and every command is
+    interpreted for all its occurrences at once: relative coordinates are
+    resolved by cumulative sums, the handles of smooth curves are reflected
+    with array operations and all arcs are converted together by
+    :func:`elliptical_arcs_to_cubic_beziers`. Up to rounding, the points are the
+    ones added by :meth:`SVGPathMobject.handle_command` with the Cairo renderer.
+
+    Parameters
+    ----------
+    path_string : :class:`str`
+        A path with potentially multiple path commands.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The points of the path, of shape ``(n, 3)``.
+    """
+    command_codes, command_is_relative, numbers, number_starts = tokenize_path_string(
+        path_string
+    )
+    number_counts = np.diff(np.append(number_starts, len(numbers)))
+
+    # Split the commands into segments, e.g. "L 1 2 3 4" into two lines.
+    arities = _COMMAND_ARITIES[command_codes]
+    segment_counts = np.where(arities > 0, number_counts // np.maximum(arities, 1), 1)
+    command = np.repeat(np.arange(len(command_codes)), segment_counts)
+    n = len(command)
+    if not n:
+        return np.zeros((0, 3))
+    index_in_command = (
+        np.arange(n) - (np.cumsum(segment_counts) - segment_counts)[command]
+    )
+    codes = command_codes[command]
+    # Further coordinate pairs of a moveto are implicit linetos.
+    codes[(codes == _MOVE) & (index_in_command > 0)] = _LINE
+    is_relative = command_is_relative[command]
+    if codes[0] != _MOVE:
+        raise ValueError(f"The path {path_string!r} does not start with a moveto")
+    columns = np.arange(7)
+    has_value = columns < _COMMAND_ARITIES[codes][:, None]
+    values = np.zeros((n, 7))
+    first_numbers = number_starts[command] + index_in_command * arities[command]
+    values[has_value] = numbers[(first_numbers[:, None] + columns)[has_value]]
+
+    # Resolve the end point of each segment.
+    index = np.arange(n)
+    is_close = codes == _CLOSE
+    move_indices = np.maximum.accumulate(np.where(codes == _MOVE, index, -1))
+    ends = np.empty((n, 2))
+    for axis, end_columns in enumerate([_END_X_COLUMNS, _END_Y_COLUMNS]):
+        column = end_columns[codes]
+        has_coordinate = column >= 0
+        ends[:, axis] = _resolve_coordinates(
+            np.where(has_coordinate, values[index, column], 0),
+            has_coordinate & ~is_relative,
+            is_close,
+            move_indices,
+        )
+    starts = np.concatenate([np.zeros((1, 2)), ends[:-1]])
+
+    # The first and second handle of the curve of each segment.
+    offsets = np.where(is_relative[:, None], starts, 0)
+    first_handles = values[:, 0:2] + offsets
+    second_handles = values[:, 2:4] + offsets
+
+    is_line = np.isin(codes, [_LINE, _HORIZONTAL, _VERTICAL, _CLOSE])
+    for handles, alpha in zip([first_handles, second_handles], _LINE_ALPHAS):
+        handles[is_line] = (1 - alpha) * starts[is_line] + alpha * ends[is_line]
+
+    # The first handle of a smooth cubic is the reflection of the second handle
+    # of the previous cubic.
+    is_smooth_cubic = np.flatnonzero(codes == _SMOOTH_CUBIC)
+    previous = is_smooth_cubic - 1
+    second_handles[is_smooth_cubic] = first_handles[is_smooth_cubic]
+    reflected = np.where(
+        np.isin(codes[previous], [_CUBIC, _SMOOTH_CUBIC])[:, None],
+        second_handles[previous],
+        starts[is_smooth_cubic],
+    )
+    first_handles[is_smooth_cubic] = 2 * starts[is_smooth_cubic] - reflected
+
+    # Quadratic curves are converted to cubic ones, see
+    # VMobject.add_quadratic_bezier_curve_to.
+    quadratic_handles = first_handles.copy()
+    is_quadratic = codes == _QUADRATIC
+    first_handles[is_quadratic] = (
+        2 / 3 * quadratic_handles[is_quadratic] + 1 / 3 * starts[is_quadratic]
+    )
+    second_handles[is_quadratic] = (
+        2 / 3 * quadratic_handles[is_quadratic] + 1 / 3 * ends[is_quadratic]
+    )
+    for k in np.flatnonzero(codes == _SMOOTH_QUADRATIC):
+        # Each handle is reflected from the previous one, so this is done in order.
+        if codes[k - 1] in [_QUADRATIC, _SMOOTH_QUADRATIC]:
+            if index_in_command[k] == 0:
+                # Recover the handle of the previous curve from its cubic version.
+                reflected = 1.5 * second_handles[k - 1] - 0.5 * ends[k - 1]
+            else:
+                reflected = quadratic_handles[k - 1]
+        else:
+            reflected = starts[k]
+        quadratic_handles[k] = 2 * starts[k] - reflected
+        first_handles[k] = 2 / 3 * quadratic_handles[k] + 1 / 3 * starts[k]
+        second_handles[k] = 2 / 3 * quadratic_handles[k] + 1 / 3 * ends[k]
+
+    # Every segment but a moveto adds one curve, except for arcs, which add
+    # several or none at all if their start and end points are the same.
+    curve_counts = (codes != _MOVE).astype(int)
+    is_arc = codes == _ARC
+    is_arc[is_arc] = np.any(starts[is_arc] != ends[is_arc], axis=1)
+    curve_counts[codes == _ARC] = 0
+    arc_curves, curve_counts[is_arc] = elliptical_arcs_to_cubic_beziers(
+        starts[is_arc],
+        values[is_arc, 0:2],
+        values[is_arc, 2],
+        values[is_arc, 3],
+        values[is_arc, 4],
+        ends[is_arc],
+    )
+    is_curve = (codes != _MOVE) & (codes != _ARC)
+    curves = np.empty((curve_counts.sum(), 3, 2))
+    first_curves = np.cumsum(curve_counts) - curve_counts
+    curves[first_curves[is_curve]] = np.stack(
+        [first_handles[is_curve], second_handles[is_curve], ends[is_curve]], axis=1
+    )
+    curves[np.repeat(is_arc, curve_counts)] = arc_curves
+
+    # A moveto adds a single point, and each curve its start anchor and its
+    # three other points. The start anchor is the last point added before.
+    row_counts = np.where(codes == _MOVE, 1, 4 * curve_counts)
+    first_rows = np.cumsum(row_counts) - row_counts
+    points = np.zeros((row_counts.sum(), 3))
+    moves = codes == _MOVE
+    points[first_rows[moves], :2] = ends[moves]
+    curve_rows = np.repeat(first_rows, curve_counts) + 4 * (
+        np.arange(len(curves)) - np.repeat(first_curves, curve_counts)
+    )
+    for i in range(3):
+        points[curve_rows + i + 1, :2] = curves[:, i]
+    points[curve_rows] = points[curve_rows - 1]
+
+    # The start anchor of a curve is not added again if the curve starts a new
+    # path, which is whenever it directly follows a moveto, see
+    # VMobject.has_new_path_started.
+    is_move_row = np.zeros(len(points), dtype=bool)
+    is_move_row[first_rows[moves]] = True
+    event_rows = np.sort(np.concatenate([first_rows[moves], curve_rows]))
+    event_is_move = is_move_row[event_rows]
+    run_starts = np.flatnonzero(np.diff(event_is_move, prepend=~event_is_move[0]))
+    run_lengths = np.diff(np.append(run_starts, len(event_rows)))
+    move_runs = event_is_move[run_starts]
+    starts_new_path = np.zeros(len(event_rows), dtype=bool)
+    if np.all(run_lengths[move_runs] == 1):
+        starts_new_path[run_starts[~move_runs]] = True
+    else:
+        # Several consecutive movetos make the number of points skip a beat,
+        # which needs to be followed one run at a time.
+        state = 0
+        for run_start, run_length, is_move_run in zip(
+            run_starts, run_lengths, move_runs
+        ):
+            if is_move_run:
+                state = (state + run_length) % 4
+            elif state == 1:
+                starts_new_path[run_start] = True
+                state = 0
+    keep = np.ones(len(points), dtype=bool)
+    keep[event_rows[starts_new_path]] = False
+    return points[keep]
 
 
 def grouped(iterable, n):
@@ -253,25 +651,27 @@ class SVGPathMobject(VMobject, metaclass=ConvertToOpenGL):
 
     def generate_points(self):
         """Generates points from a given an SVG ``d`` attribute."""
-        pattern = "[%s]" % ("".join(self.get_path_commands()))
-        pairs = list(
-            zip(
-                re.findall(pattern, self.path_string),
-                re.split(pattern, self.path_string)[1:],
-            )
-        )
-        # Which mobject should new points be added to
-        prev_command = None
-        for command, coord_string in pairs:
-            self.handle_command(command, coord_string, prev_command)
-            prev_command = command
         if config["renderer"] == "opengl":
+            pattern = "[%s]" % ("".join(self.get_path_commands()))
+            pairs = list(
+                zip(
+                    re.findall(pattern, self.path_string),
+                    re.split(pattern, self.path_string)[1:],
+                )
+            )
+            # Which mobject should new points be added to
+            prev_command = None
+            for command, coord_string in pairs:
+                self.handle_command(command, coord_string, prev_command)
+                prev_command = command
             if self.should_subdivide_sharp_curves:
                 # For a healthy triangulation later
                 self.subdivide_sharp_curves()
             if self.should_remove_null_curves:
                 # Get rid of any null curves
                 self.set_points(self.get_points_without_null_curves())
+        else:
+            self.points = path_string_to_points(self.path_string)
         # people treat y-coordinate differently
         self.rotate(np.pi, RIGHT, about_point=ORIGIN)
 
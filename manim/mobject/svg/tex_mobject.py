@@ -36,7 +36,7 @@ from ...mobject.svg.svg_path import SVGPathMobject
 from ...mobject.types.vectorized_mobject import VectorizedPoint, VGroup
 from ...utils.color import BLACK, WHITE
 from ...utils.tex import TexTemplate
-from ...utils.tex_file_writing import tex_to_svg_file
+from ...utils.tex_file_writing import prefetch, tex_to_svg_file, tex_to_svg_files
 from .style_utils import parse_style
 
 TEX_MOB_SCALE_FACTOR = 0.05
@@ -243,19 +243,23 @@ class MathTex(SingleStringMathTex):
         tex_environment="align*",
         **kwargs,
     ):
-        self.tex_template = kwargs.pop("tex_template", config["tex_template"])
-        self.arg_separator = arg_separator
-        self.substrings_to_isolate = (
-            [] if substrings_to_isolate is None else substrings_to_isolate
+        self._set_tex_strings(
+            tex_strings,
+            arg_separator,
+            substrings_to_isolate,
+            tex_to_color_map,
+            tex_environment,
+            kwargs.pop("tex_template", config["tex_template"]),
         )
-        self.tex_to_color_map = tex_to_color_map
-        if self.tex_to_color_map is None:
-            self.tex_to_color_map = {}
-        self.tex_environment = tex_environment
-        self.brace_notation_split_occurred = False
-        tex_strings = self.break_up_tex_strings(tex_strings)
-        self.tex_strings = tex_strings
+        tex_strings = self.tex_strings
         try:
+            # Typeset the whole string and the substrings of break_up_by_substrings
+            # in one TeX run, their svg files are then already cached.
+            tex_to_svg_files(
+                self.get_tex_expressions(),
+                environment=self.tex_environment,
+                tex_template=self.tex_template,
+            )
             SingleStringMathTex.__init__(
                 self,
                 self.arg_separator.join(tex_strings),
@@ -284,6 +288,96 @@ class MathTex(SingleStringMathTex):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    @classmethod
+    def prefetch(
+        cls,
+        *tex_strings,
+        arg_separator=" ",
+        substrings_to_isolate=None,
+        tex_to_color_map=None,
+        tex_environment="align*",
+        tex_template=None,
+        **kwargs,
+    ):
+        r"""Starts compiling the TeX code of a mobject in the background.
+
+        The expressions are modified and typeset in the environment and template
+        exactly as ``cls(*tex_strings, **kwargs)`` would, so that creating the
+        mobject afterwards finds their svg files cached or being compiled. See
+        :func:`~.tex_file_writing.prefetch`.
+
+        Parameters
+        ----------
+        tex_strings
+            The strings passed to the mobject.
+        kwargs
+            The keyword arguments passed to the mobject. Only those affecting the
+            TeX code are used.
+
+        Returns
+        -------
+        List[:class:`concurrent.futures.Future`]
+            The futures of the compilations started.
+
+        Examples
+        --------
+        ::
+
+            MathTex.prefetch(r"e^{i\pi} + 1 = 0")
+            Tex.prefetch("Euler's identity")
+            # ... other work ...
+            formula = MathTex(r"e^{i\pi} + 1 = 0")
+        """
+        tex_mobject = cls.__new__(cls)
+        tex_mobject._set_tex_strings(
+            tex_strings,
+            arg_separator,
+            substrings_to_isolate,
+            tex_to_color_map,
+            tex_environment,
+            config["tex_template"] if tex_template is None else tex_template,
+        )
+        return prefetch(
+            tex_mobject.get_tex_expressions(),
+            environment=tex_mobject.tex_environment,
+            tex_template=tex_mobject.tex_template,
+        )
+
+    def _set_tex_strings(
+        self,
+        tex_strings,
+        arg_separator,
+        substrings_to_isolate,
+        tex_to_color_map,
+        tex_environment,
+        tex_template,
+    ):
+        self.tex_template = tex_template
+        self.arg_separator = arg_separator
+        self.substrings_to_isolate = (
+            [] if substrings_to_isolate is None else substrings_to_isolate
+        )
+        self.tex_to_color_map = tex_to_color_map
+        if self.tex_to_color_map is None:
+            self.tex_to_color_map = {}
+        self.tex_environment = tex_environment
+        self.brace_notation_split_occurred = False
+        self.tex_strings = self.break_up_tex_strings(tex_strings)
+
+    def get_tex_expressions(self):
+        """Returns the TeX expressions compiled for this mobject.
+
+        These are the whole string and its parts, see :meth:`break_up_by_substrings`,
+        after :meth:`get_modified_expression`.
+        """
+        return [
+            self.get_modified_expression(tex_string)
+            for tex_string in [
+                self.arg_separator.join(self.tex_strings),
+                *self.tex_strings,
+            ]
+        ]
+
     def break_up_tex_strings(self, tex_strings):
         # Separate out anything surrounded in double braces
         pre_split_length = len(tex_strings)
@@ -395,7 +489,7 @@ class MathTex(SingleStringMathTex):
         return self.index_of_part(part)
 
     def sort_alphabetically(self):
-        self.submobjects.sort(key=lambda m: m.get_tex_string())
+        self.submobjects = sorted(self.submobjects, key=lambda m: m.get_tex_string())
 
 
 class Tex(MathTex):
@@ -422,6 +516,17 @@ class Tex(MathTex):
             **kwargs,
         )
 
+    @classmethod
+    def prefetch(
+        cls, *tex_strings, arg_separator="", tex_environment="center", **kwargs
+    ):
+        return super().prefetch(
+            *tex_strings,
+            arg_separator=arg_separator,
+            tex_environment=tex_environment,
+            **kwargs,
+        )
+
 
 class BulletedList(Tex):
     """
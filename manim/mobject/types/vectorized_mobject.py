@@ -26,6 +26,8 @@ from ...constants import *
 from ...mobject.mobject import Mobject
 from ...mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from ...utils.bezier import (
+    batched_bezier,
+    batched_partial_bezier_points,
     bezier,
     get_smooth_handle_points,
     integer_interpolate,
@@ -101,6 +103,8 @@ class VMobject(Mobject):
         self.shade_in_3d = shade_in_3d
         self.tolerance_for_point_equality = tolerance_for_point_equality
         self.n_points_per_cubic_curve = n_points_per_cubic_curve
+        # Cumulative lengths of the curves, along with the points they were computed from.
+        self._arc_length_table = None
         Mobject.__init__(self, **kwargs)
 
     def get_group_class(self):
@@ -922,12 +926,19 @@ class VMobject(Mobject):
         )
 
     def get_subpaths_from_points(self, points):
-        return list(
-            self._gen_subpaths_from_points(
-                points,
-                lambda n: not self.consider_points_equals(points[n - 1], points[n]),
+        nppcc = self.n_points_per_cubic_curve
+        # Same comparison as consider_points_equals, for all the anchors at once
+        starts = np.arange(nppcc, len(points), nppcc)
+        ends, next_starts = points[starts - 1], points[starts]
+        is_equal = (ends == next_starts) | (
+            np.isfinite(next_starts)
+            & (
+                np.abs(ends - next_starts)
+                <= self.tolerance_for_point_equality + 1.0e-5 * np.abs(next_starts)
             )
         )
+        is_split = set(starts[~is_equal.all(axis=1)].tolist())
+        return list(self._gen_subpaths_from_points(points, is_split.__contains__))
 
     def gen_subpaths_from_points_2d(self, points):
         return self._gen_subpaths_from_points(
@@ -935,6 +946,47 @@ class VMobject(Mobject):
             lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
         )
 
+    def get_subpath_curves_2d(
+        self, points: np.ndarray
+    ) -> typing.List[typing.Tuple[np.ndarray, bool]]:
+        """Returns the subpaths formed by the points as arrays of 2D bezier curves.
+
+        This is equivalent to :meth:`gen_subpaths_from_points_2d` followed by
+        :meth:`gen_cubic_bezier_tuples_from_points` for each subpath, but the
+        subpaths are split with array operations.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            points defining the bezier curves.
+
+        Returns
+        -------
+        typing.List[typing.Tuple[np.ndarray, bool]]
+            For each subpath, the array of shape ``(n_curves, n_points_per_cubic_curve, 2)``
+            of the control points of its curves, and whether the subpath is closed.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        # Same comparison as consider_points_equals_2d
+        rtol = 1.0e-5
+        atol = self.tolerance_for_point_equality
+        xy = points[:, :2]
+        starts = np.arange(nppcc, len(points), nppcc)
+        is_split = (
+            np.abs(xy[starts - 1] - xy[starts]) > atol + rtol * np.abs(xy[starts])
+        ).any(axis=1)
+        split_indices = [0, *starts[is_split].tolist(), len(points)]
+
+        subpaths = []
+        for i1, i2 in zip(split_indices, split_indices[1:]):
+            if (i2 - i1) < nppcc:
+                continue
+            n_curves = (i2 - i1) // nppcc
+            curves = xy[i1 : i1 + n_curves * nppcc].reshape(n_curves, nppcc, 2)
+            is_closed = self.consider_points_equals_2d(xy[i1], xy[i2 - 1])
+            subpaths.append((curves, is_closed))
+        return subpaths
+
     def get_subpaths(self) -> typing.Tuple:
         """Returns subpaths formed by the curves of the VMobject.
 
@@ -1060,6 +1112,58 @@ class VMobject(Mobject):
         for n in range(num_curves):
             yield self.get_nth_curve_function_with_length(n, **kwargs)
 
+    def get_curve_lengths(
+        self, sample_points: Optional[int] = None
+    ) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Returns the (approximate) lengths of the curves of the vmobject, and their cumulative sums.
+
+        The lengths are computed for all the curves at once, as in
+        :meth:`get_nth_curve_function_with_length`. They are cached until the
+        points of the vmobject change.
+
+        Parameters
+        ----------
+        sample_points
+            The number of points to sample on each curve to find its length.
+
+        Returns
+        -------
+        lengths : :class:`numpy.ndarray`
+            The length of each curve.
+        cumulative_lengths : :class:`numpy.ndarray`
+            The length of the path up to the start of each curve, followed by
+            the length of the whole path.
+        """
+        if sample_points is None:
+            sample_points = 10
+
+        table = getattr(self, "_arc_length_table", None)
+        if (
+            table is not None
+            and table[0] == sample_points
+            and np.array_equal(table[1], self.points)
+        ):
+            return table[2], table[3]
+
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        curves = self.points[: nppcc * num_curves].reshape(
+            (num_curves, nppcc, self.points.shape[1])
+        )
+        samples = batched_bezier(
+            curves[:, np.newaxis], np.linspace(0, 1, sample_points)
+        )
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+        cumulative_lengths = np.concatenate([[0], np.cumsum(lengths)])
+
+        self._arc_length_table = (
+            sample_points,
+            self.points.copy(),
+            lengths,
+            cumulative_lengths,
+        )
+        return lengths, cumulative_lengths
+
     def point_from_proportion(self, alpha: float) -> np.ndarray:
         """Gets the point at a proportion along the path of the :class:`VMobject`.
 
@@ -1079,6 +1183,10 @@ class VMobject(Mobject):
             If ``alpha`` is not between 0 and 1.
         :exc:`Exception`
             If the :class:`VMobject` has no points.
+
+        See Also
+        --------
+        :meth:`points_from_proportions`
         """
 
         if alpha < 0 or alpha > 1:
@@ -1088,21 +1196,72 @@ class VMobject(Mobject):
         if alpha == 1:
             return self.get_points()[-1]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
+        return self.points_from_proportions(alpha)
+
+    def points_from_proportions(self, alphas: Sequence[float]) -> np.ndarray:
+        """Gets the points at several proportions along the path of the :class:`VMobject`.
+
+        This is the vectorized version of :meth:`point_from_proportion`: the
+        curve containing each point is found with a binary search in the
+        cumulative lengths of the curves, and all the points are evaluated at
+        once.
+
+        Parameters
+        ----------
+        alphas
+            The proportions along the the path of the :class:`VMobject`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The points on the :class:`VMobject`, one for each proportion.
 
-        target_length = alpha * np.sum(length for _, length in curves_and_lengths)
-        current_length = 0
+        Raises
+        ------
+        :exc:`ValueError`
+            If some alpha is not between 0 and 1.
+        :exc:`Exception`
+            If the :class:`VMobject` has no points.
 
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
+        Examples
+        --------
+        ::
 
-                return curve(residue)
+            >>> from manim import LEFT, RIGHT, Line
+            >>> Line(LEFT, RIGHT).points_from_proportions([0, 0.25, 1])
+            array([[-1. ,  0. ,  0. ],
+                   [-0.5,  0. ,  0. ],
+                   [ 1. ,  0. ,  0. ]])
+        """
+        alphas = np.asarray(alphas, dtype=float)
+        if np.any((alphas < 0) | (alphas > 1)):
+            raise ValueError(f"Alphas {alphas} not all between 0 and 1.")
 
-            current_length += length
+        self.throw_error_if_no_points()
+        lengths, cumulative_lengths = self.get_curve_lengths()
+        num_curves = len(lengths)
+        if num_curves == 0:
+            return np.broadcast_to(self.points[-1], (*alphas.shape, self.dim)).copy()
+
+        target_lengths = alphas * cumulative_lengths[-1]
+        # Index of the first curve ending after the target length.
+        indices = np.minimum(
+            np.searchsorted(cumulative_lengths[1:], target_lengths), num_curves - 1
+        )
+        curve_lengths = lengths[indices]
+        residues = np.divide(
+            target_lengths - cumulative_lengths[indices],
+            curve_lengths,
+            out=np.zeros_like(target_lengths),
+            where=curve_lengths != 0,
+        )
+        nppcc = self.n_points_per_cubic_curve
+        curves = self.points[: nppcc * num_curves].reshape(
+            (num_curves, nppcc, self.points.shape[1])
+        )
+        points = batched_bezier(curves[indices], residues)
+        points[alphas == 1] = self.points[-1]
+        return points
 
     def get_anchors_and_handles(self) -> typing.Iterable[np.ndarray]:
         """Returns anchors1, handles1, handles2, anchors2,
@@ -1157,6 +1316,13 @@ class VMobject(Mobject):
         # Probably returns all anchors, but this is weird regarding  the name of the method.
         return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
 
+    def get_bounding_box(self):
+        # Handles do not define the boundary, see :meth:`get_points_defining_boundary`.
+        box = self._get_family_bounding_box(anchors_only=True)
+        if box is None:
+            return np.zeros((3, self.dim))
+        return box
+
     def get_arc_length(self, sample_points_per_curve: Optional[int] = None) -> float:
         """Return the approximated length of the whole curve.
 
@@ -1171,12 +1337,10 @@ class VMobject(Mobject):
             The length of the :class:`VMobject`.
         """
 
-        return np.sum(
-            length
-            for _, length in self.get_curve_functions_with_lengths(
-                sample_points=sample_points_per_curve
-            )
+        _, cumulative_lengths = self.get_curve_lengths(
+            sample_points=sample_points_per_curve
         )
+        return cumulative_lengths[-1]
 
     # Alignment
     def align_points(self, vmobject):
@@ -1201,8 +1365,8 @@ class VMobject(Mobject):
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
         # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
+        new_path1 = []
+        new_path2 = []
 
         nppcc = self.n_points_per_cubic_curve
 
@@ -1217,12 +1381,10 @@ class VMobject(Mobject):
             sp2 = get_nth_subpath(subpaths2, n)
             diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
             diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
+            new_path1.append(self.insert_n_curves_to_point_list(diff1, sp1))
+            new_path2.append(self.insert_n_curves_to_point_list(diff2, sp2))
+        self.set_points(np.concatenate(new_path1))
+        vmobject.set_points(np.concatenate(new_path2))
         return self
 
     def insert_n_curves(self, n: int) -> "VMobject":
@@ -1265,11 +1427,16 @@ class VMobject(Mobject):
             Points generated.
         """
 
+        nppcc = self.n_points_per_cubic_curve
         if len(points) == 1:
-            nppcc = self.n_points_per_cubic_curve
             return np.repeat(points, nppcc * n, 0)
-        bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
-        curr_num = len(bezier_quads)
+        points = np.asarray(points)
+        curr_num = len(points) // nppcc
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
+        bezier_quads = points[: curr_num * nppcc].reshape(
+            (curr_num, nppcc, points.shape[1])
+        )
         target_num = curr_num + n
         # This is an array with values ranging from 0
         # up to curr_num,  with repeats such that
@@ -1282,18 +1449,21 @@ class VMobject(Mobject):
         # that the nth curve of our path should be split
         # into k pieces.  In the above example, this would
         # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points, partial_bezier_points(quad, a1, a2), axis=0
-                )
-        return new_points
+        split_factors = np.bincount(repeat_indices, minlength=curr_num)
+
+        # What was once a single cubic curve defined
+        # by "quad" will now be broken into sf
+        # smaller cubic curves, the jth of them being the
+        # portion between j / sf and (j + 1) / sf.
+        # All of these portions are computed at once.
+        sf = split_factors[repeat_indices]
+        first_piece_indices = np.cumsum(split_factors) - split_factors
+        j = np.arange(target_num) - first_piece_indices[repeat_indices]
+        step = 1 / sf
+        a1 = j * step
+        a2 = np.where(j + 1 == sf, 1.0, (j + 1) * step)
+        new_points = batched_partial_bezier_points(bezier_quads[repeat_indices], a1, a2)
+        return new_points.reshape((target_num * nppcc, points.shape[1]))
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
@@ -1629,7 +1799,7 @@ class VGroup(VMobject, metaclass=ConvertToOpenGL):
         """
         if not all(isinstance(m, (VMobject, OpenGLVMobject)) for m in value):
             raise TypeError("All submobjects must be of type VMobject")
-        self.submobjects[key] = value
+        self.replace_submobject(key, value)
 
 
 class VDict(VMobject):
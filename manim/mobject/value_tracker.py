@@ -81,6 +81,7 @@ class ValueTracker(Mobject, metaclass=ConvertToOpenGL):
     def set_value(self, value: float):
         """Sets a new scalar value to the ValueTracker"""
         self.get_points()[0, 0] = value
+        self.refresh_bounding_box()
         return self
 
     def increment_value(self, d_value: float):
@@ -172,4 +173,5 @@ class ComplexValueTracker(ValueTracker):
         """Sets a new complex value to the ComplexValueTracker"""
         z = complex(z)
         self.get_points()[0, :2] = (z.real, z.imag)
+        self.refresh_bounding_box()
         return self
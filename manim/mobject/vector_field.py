@@ -8,8 +8,9 @@ __all__ = [
 
 import itertools as it
 import random
+from collections import OrderedDict
 from math import ceil, floor
-from typing import Callable, Optional, Sequence, Tuple, Type
+from typing import Callable, List, Optional, Sequence, Tuple, Type
 
 import numpy as np
 from colour import Color
@@ -31,6 +32,20 @@ from ..utils.simple_functions import sigmoid
 
 DEFAULT_SCALAR_FIELD_COLORS: list = [BLUE_E, GREEN, YELLOW, RED]
 
+#: Number of images generated by :meth:`VectorField.get_colored_background_image`
+#: kept in memory.
+BACKGROUND_IMAGE_CACHE_SIZE = 16
+
+# Maps the keys built in :meth:`VectorField.get_colored_background_image` to the
+# generated images, least recently used first.
+_background_image_cache = OrderedDict()
+
+
+def _norm(vectors: np.ndarray) -> np.ndarray:
+    """The default color scheme, working on single vectors and arrays of vectors."""
+    return np.linalg.norm(vectors, axis=-1)
+
+
 # def get_norm(p):
 #     return np.linalg.norm(p)
 
@@ -56,6 +71,12 @@ class VectorField(VGroup):
         The value of the color_scheme function to be mapped to the last color in `colors`. Higher values also result in the last color of the gradient.
     colors
         The colors defining the color gradient of the vector field.
+    vectorized
+        Whether `func` can be evaluated on many positions at once. If `True`, `func` is
+        passed an array of shape ``(n, 3)`` with one position per row, and must return
+        the array of the corresponding vectors, and `color_scheme` is passed such an
+        array of vectors and must return the array of their values. This makes moving
+        mobjects, computing stream lines and coloring along the vector field much faster.
     kwargs : Any
         Additional arguments to be passed to the :class:`~.VGroup` constructor
 
@@ -69,15 +90,20 @@ class VectorField(VGroup):
         min_color_scheme_value: float = 0,
         max_color_scheme_value: float = 2,
         colors: Sequence[Color] = DEFAULT_SCALAR_FIELD_COLORS,
-        **kwargs
+        vectorized: bool = False,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.func = func
+        self.vectorized = vectorized
         if color is None:
             self.single_color = False
+            self.vectorized_color_scheme = vectorized or color_scheme is None
             if color_scheme is None:
-                color_scheme = lambda p: np.linalg.norm(p)
+                color_scheme = _norm
             self.color_scheme = color_scheme  # TODO maybe other default for direction?
+            self.min_color_scheme_value = min_color_scheme_value
+            self.max_color_scheme_value = max_color_scheme_value
             self.rgbs = np.array(list(map(color_to_rgb, colors)))
 
             def pos_to_rgb(pos: np.ndarray) -> Tuple[float, float, float, float]:
@@ -160,6 +186,127 @@ class VectorField(VGroup):
         """
         return lambda p: func(p * scalar)
 
+    def get_vectors(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the vector field at several positions.
+
+        Parameters
+        ----------
+        points
+            The positions, one per row.
+
+        Returns
+        -------
+        np.ndarray
+            The vectors of the vector field at these positions, one per row.
+        """
+        if self.vectorized:
+            return np.asarray(self.func(points), dtype=float).reshape(points.shape)
+        return np.array([self.func(p) for p in points], dtype=float).reshape(
+            points.shape
+        )
+
+    def get_rgbs(self, points: np.ndarray) -> np.ndarray:
+        """Compute the color of the vector field at several positions.
+
+        This gives the same colors as :attr:`pos_to_rgb`, with the color gradient
+        computed for all positions at once.
+
+        Parameters
+        ----------
+        points
+            The positions, one per row.
+
+        Returns
+        -------
+        np.ndarray
+            The rgb color at each position, one per row.
+        """
+        vectors = self.get_vectors(points)
+        if self.vectorized_color_scheme:
+            values = np.asarray(self.color_scheme(vectors), dtype=float)
+        else:
+            values = np.array([self.color_scheme(vec) for vec in vectors], dtype=float)
+        color_values = np.clip(
+            values, self.min_color_scheme_value, self.max_color_scheme_value
+        )
+        alphas = inverse_interpolate(
+            self.min_color_scheme_value, self.max_color_scheme_value, color_values
+        )
+        alphas *= len(self.rgbs) - 1
+        c1 = self.rgbs[alphas.astype(int)]
+        c2 = self.rgbs[np.minimum((alphas + 1).astype(int), len(self.rgbs) - 1)]
+        alphas %= 1
+        return interpolate(c1, c2, alphas[:, np.newaxis])
+
+    def integration_step(
+        self, points: np.ndarray, step_size, method: str = "rk4"
+    ) -> np.ndarray:
+        """Move several points along the vector field at once.
+
+        Parameters
+        ----------
+        points
+            The positions of the points, one per row.
+        step_size
+            The time by which the points are moved, either shared by all points or
+            given per point as an array.
+        method
+            The integration method, either ``"euler"`` or ``"rk4"`` (the classical
+            fourth order Runge-Kutta method).
+
+        Returns
+        -------
+        np.ndarray
+            The new positions of the points.
+        """
+        step_size = np.asarray(step_size, dtype=float)
+        if step_size.ndim:
+            step_size = step_size[:, np.newaxis]
+        if method == "euler":
+            return points + step_size * self.get_vectors(points)
+        if method != "rk4":
+            raise ValueError(f"Unknown integration method: {method!r}")
+        k_1 = self.get_vectors(points)
+        k_2 = self.get_vectors(points + step_size * (k_1 * 0.5))
+        k_3 = self.get_vectors(points + step_size * (k_2 * 0.5))
+        k_4 = self.get_vectors(points + step_size * k_3)
+        return points + step_size / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
+
+    def adaptive_integration_step(
+        self, points: np.ndarray, step_sizes: np.ndarray, tolerance: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Move several points along the vector field, controlling the error.
+
+        Every point is moved with one step of the fourth order Runge-Kutta method,
+        and with two steps of half its size. The difference between both gives an
+        estimate of the error, from which the size of the next step is chosen.
+
+        Parameters
+        ----------
+        points
+            The positions of the points, one per row.
+        step_sizes
+            The size of the step of each point.
+        tolerance
+            The largest error accepted for a step.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            The new positions of the points, whether each step is accepted (i.e.
+            its error is at most `tolerance`), and the size of the next step of
+            each point.
+        """
+        full_step = self.integration_step(points, step_sizes)
+        half_step = self.integration_step(points, step_sizes / 2)
+        half_step = self.integration_step(half_step, step_sizes / 2)
+        errors = np.linalg.norm(half_step - full_step, axis=1) / 15
+        accepted = errors <= tolerance
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factors = 0.9 * (tolerance / errors) ** 0.2
+        factors = np.clip(np.nan_to_num(factors, nan=0.2, posinf=5), 0.2, 5)
+        return half_step, accepted, step_sizes * factors
+
     def nudge(
         self, mob: Mobject, dt: float = 1, substeps: int = 1, pointwise: bool = False
     ) -> "VectorField":
@@ -207,32 +354,79 @@ class VectorField(VGroup):
 
         """
 
-        def runge_kutta(self, p: Sequence[float], step_size: float) -> float:
-            """Returns the change in position of a point along a vector field.
-            Parameters
-            ----------
-            p
-               The position of each point being moved along the vector field.
-            step_size
-               A scalar that is used to determine how much a point is shifted in a single step.
-
-            Returns
-            -------
-            float
-               How much the point is shifted.
-            """
-            k_1 = self.func(p)
-            k_2 = self.func(p + step_size * (k_1 * 0.5))
-            k_3 = self.func(p + step_size * (k_2 * 0.5))
-            k_4 = self.func(p + step_size * k_3)
-            return step_size / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
+        return self.nudge_mobjects([mob], dt, substeps, pointwise)
+
+    def nudge_mobjects(
+        self,
+        mobjects: Sequence[Mobject],
+        dt: float = 1,
+        substeps: int = 1,
+        pointwise: bool = False,
+    ) -> "VectorField":
+        """Nudge several :class:`~.Mobject` s along the vector field at once.
+
+        The points (or centers) of all mobjects are moved together, as one array,
+        with the fourth order Runge-Kutta method.
 
+        Parameters
+        ----------
+        mobjects
+            The mobjects to move along the vector field.
+        dt
+            A scalar to the amount the mobjects are moved along the vector field.
+        substeps
+            The amount of steps the whole nudge is divided into.
+        pointwise
+            Whether to move the mobjects along the vector field. See :meth:`nudge` for details.
+
+        Returns
+        -------
+        VectorField
+            This vector field.
+        """
         step_size = dt / substeps
-        for i in range(substeps):
-            if pointwise:
-                mob.apply_function(lambda p: p + runge_kutta(self, p, step_size))
-            else:
-                mob.shift(runge_kutta(self, mob.get_center(), step_size))
+        if pointwise and config.renderer == "opengl":
+            for mob in mobjects:
+                for i in range(substeps):
+                    mob.apply_function(
+                        lambda p: self.integration_step(p[np.newaxis], step_size)[0]
+                    )
+        elif pointwise:
+            # Same as mob.apply_function for every mobject, with the points of
+            # all mobjects moved at once.
+            vmobjects = [mob for mob in mobjects if isinstance(mob, VMobject)]
+            members = [
+                member
+                for mob in mobjects
+                for member in mob.family_members_with_points()
+            ]
+            if not members:
+                return self
+            for i in range(substeps):
+                for mob in vmobjects:
+                    mob.scale_handle_to_anchor_distances(
+                        mob.pre_function_handle_to_anchor_scale_factor
+                    )
+                arrays = [member.points for member in members]
+                points = self.integration_step(np.concatenate(arrays), step_size)
+                ends = np.cumsum([len(array) for array in arrays])[:-1]
+                for member, new_points in zip(members, np.split(points, ends)):
+                    member.points = new_points
+                for mob in vmobjects:
+                    mob.scale_handle_to_anchor_distances(
+                        1.0 / mob.pre_function_handle_to_anchor_scale_factor
+                    )
+                    if mob.make_smooth_after_applying_functions:
+                        mob.make_smooth()
+        else:
+            centers = np.array([mob.get_center() for mob in mobjects])
+            if not len(centers):
+                return self
+            new_centers = centers
+            for i in range(substeps):
+                new_centers = self.integration_step(new_centers, step_size)
+            for mob, shift in zip(mobjects, new_centers - centers):
+                mob.shift(shift)
         return self
 
     def nudge_submobjects(
@@ -257,9 +451,7 @@ class VectorField(VGroup):
             This vector field.
 
         """
-        for mob in self.submobjects:
-            self.nudge(mob, dt, substeps, pointwise)
-        return self
+        return self.nudge_mobjects(self.submobjects, dt, substeps, pointwise)
 
     def get_nudge_updater(
         self, speed: float = 1, pointwise: bool = False
@@ -331,6 +523,9 @@ class VectorField(VGroup):
         single value using `self.color_scheme` and finally generate a color from
         that value using the color gradient.
 
+        The generated images are cached, so vector fields with the same function and
+        colors share the same image, which must therefore not be modified.
+
         Parameters
         ----------
         sampling_rate
@@ -350,17 +545,33 @@ class VectorField(VGroup):
         pw = int(config["pixel_width"] / sampling_rate)
         fw = config["frame_width"]
         fh = config["frame_height"]
+        key = (
+            self.func,
+            self.color_scheme,
+            self.vectorized,
+            self.min_color_scheme_value,
+            self.max_color_scheme_value,
+            self.rgbs.tobytes(),
+            ph,
+            pw,
+            fw,
+            fh,
+        )
+        if key in _background_image_cache:
+            _background_image_cache.move_to_end(key)
+            return _background_image_cache[key]
+
         points_array = np.zeros((ph, pw, 3))
         x_array = np.linspace(-fw / 2, fw / 2, pw)
         y_array = np.linspace(fh / 2, -fh / 2, ph)
-        x_array = x_array.reshape((1, len(x_array)))
-        y_array = y_array.reshape((len(y_array), 1))
-        x_array = x_array.repeat(ph, axis=0)
-        y_array.repeat(pw, axis=1)  # TODO why not y_array = y_array.repeat(...)?
-        points_array[:, :, 0] = x_array
-        points_array[:, :, 1] = y_array
-        rgbs = np.apply_along_axis(self.pos_to_rgb, 2, points_array)
-        return Image.fromarray((rgbs * 255).astype("uint8"))
+        points_array[:, :, 0] = x_array.reshape((1, pw))
+        points_array[:, :, 1] = y_array.reshape((ph, 1))
+        rgbs = self.get_rgbs(points_array.reshape((-1, 3))).reshape((ph, pw, 3))
+        image = Image.fromarray((rgbs * 255).astype("uint8"))
+        _background_image_cache[key] = image
+        if len(_background_image_cache) > BACKGROUND_IMAGE_CACHE_SIZE:
+            _background_image_cache.popitem(last=False)
+        return image
 
 
 class ArrowVectorField(VectorField):
@@ -466,7 +677,7 @@ class ArrowVectorField(VectorField):
         length_func: Callable[[float], float] = lambda norm: 0.45 * sigmoid(norm),
         opacity: float = 1.0,
         vector_config: Optional[dict] = None,
-        **kwargs
+        **kwargs,
     ):
         super().__init__(
             func,
@@ -571,6 +782,13 @@ class StreamLines(VectorField):
         The maximum number of anchors per line. Lines with more anchors get reduced in complexity, not in length.
     padding
         The distance agents can move out of the generation area before being terminated.
+    integration_method
+        How the agents are moved at each step: ``"euler"`` (the default), ``"rk4"`` for
+        the fourth order Runge-Kutta method, or ``"adaptive"`` for the Runge-Kutta method
+        with a step size adapted to each agent, starting at `dt`, such that the error
+        of each step stays below `tolerance`.
+    tolerance
+        The largest error accepted for a step if `integration_method` is ``"adaptive"``.
     stroke_width
         The stroke with of the stream lines.
     opacity
@@ -635,10 +853,12 @@ class StreamLines(VectorField):
         virtual_time=3,
         max_anchors_per_line=100,
         padding=3,
+        integration_method: str = "euler",
+        tolerance: float = 1e-4,
         # Determining stream line appearance:
         stroke_width=1,
         opacity=1,
-        **kwargs
+        **kwargs,
     ):
         super().__init__(
             func,
@@ -660,6 +880,8 @@ class StreamLines(VectorField):
         self.virtual_time = virtual_time
         self.max_anchors_per_line = max_anchors_per_line
         self.padding = padding
+        self.integration_method = integration_method
+        self.tolerance = tolerance
         self.stroke_width = stroke_width
 
         half_noise = self.noise_factor / 2
@@ -675,29 +897,13 @@ class StreamLines(VectorField):
             ]
         )
 
-        def outside_box(p):
-            return (
-                p[0] < self.x_min - self.padding
-                or p[0] > self.x_max + self.padding
-                or p[1] < self.y_min - self.padding
-                or p[1] > self.y_max + self.padding
-            )
-
-        max_steps = ceil(virtual_time / dt) + 1
         if not self.single_color:
             self.background_img = self.get_colored_background_image()
-        for point in start_points:
-            points = [point]
-            for step in range(max_steps):
-                last_point = points[-1]
-                new_point = last_point + dt * func(last_point)
-                if outside_box(new_point):
-                    break
-                points.append(new_point)
-            if step == 0:
+        for points, duration in zip(*self.get_trajectories(start_points, dt)):
+            if duration == 0:
                 continue
             line = VMobject()
-            line.duration = step * dt
+            line.duration = duration
             step = max(1, int(len(points) / self.max_anchors_per_line))
             line.set_points_smoothly(points[::step])
             if self.single_color:
@@ -710,11 +916,97 @@ class StreamLines(VectorField):
             self.add(line)
         self.stream_lines = [*self.submobjects]
 
+    def outside_box(self, points: np.ndarray) -> np.ndarray:
+        """Returns which of the points are too far from the generation area to be moved further."""
+        return (
+            (points[:, 0] < self.x_min - self.padding)
+            | (points[:, 0] > self.x_max + self.padding)
+            | (points[:, 1] < self.y_min - self.padding)
+            | (points[:, 1] > self.y_max + self.padding)
+        )
+
+    def get_trajectories(
+        self, start_points: np.ndarray, dt: float
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Move all agents along the vector field for :attr:`virtual_time`.
+
+        The agents are moved together, one step at a time, and each of them stops
+        when it leaves the flowing area.
+
+        Parameters
+        ----------
+        start_points
+            The starting position of each agent.
+        dt
+            The size of the steps, or of the first step if the integration method
+            is ``"adaptive"``.
+
+        Returns
+        -------
+        Tuple[List[np.ndarray], np.ndarray]
+            The positions of each agent after each step, and the time each agent
+            moved for.
+        """
+        n_agents = len(start_points)
+        positions = np.array(start_points, dtype=float)
+        agents = np.arange(n_agents)
+        # The agents moved by each step and their new positions, in order.
+        moved_agents = [agents]
+        moved_positions = [positions.copy()]
+        max_steps = ceil(self.virtual_time / dt) + 1
+        if self.integration_method == "adaptive":
+            step_sizes = np.full(n_agents, float(dt))
+            remaining_time = np.full(n_agents, float(self.virtual_time))
+            # The steps can get arbitrarily small near singularities.
+            for _ in range(10 * max_steps):
+                if not len(agents):
+                    break
+                steps = np.minimum(step_sizes[agents], remaining_time[agents])
+                (
+                    new_positions,
+                    accepted,
+                    step_sizes[agents],
+                ) = self.adaptive_integration_step(
+                    positions[agents], steps, self.tolerance
+                )
+                outside = self.outside_box(new_positions)
+                moved = accepted & ~outside
+                moved_agents.append(agents[moved])
+                moved_positions.append(new_positions[moved])
+                positions[agents[moved]] = new_positions[moved]
+                remaining_time[agents[moved]] -= steps[moved]
+                finished = (accepted & outside) | (remaining_time[agents] <= 0)
+                agents = agents[~finished]
+            durations = self.virtual_time - remaining_time
+        else:
+            n_steps = np.zeros(n_agents, dtype=int)
+            for _ in range(max_steps):
+                if not len(agents):
+                    break
+                new_positions = self.integration_step(
+                    positions[agents], dt, self.integration_method
+                )
+                inside = ~self.outside_box(new_positions)
+                agents = agents[inside]
+                moved_agents.append(agents)
+                moved_positions.append(new_positions[inside])
+                positions[agents] = new_positions[inside]
+                n_steps[agents] += 1
+            # The duration of the agents that never left the area is one step
+            # shorter than their trajectory.
+            durations = np.minimum(n_steps, max_steps - 1) * dt
+
+        moved_agents = np.concatenate(moved_agents)
+        order = np.argsort(moved_agents, kind="stable")
+        positions = np.concatenate(moved_positions)[order]
+        ends = np.cumsum(np.bincount(moved_agents, minlength=n_agents))[:-1]
+        return np.split(positions, ends), durations
+
     def create(
         self,
         lag_ratio: Optional[float] = None,
         run_time: Optional[Callable[[float], float]] = None,
-        **kwargs
+        **kwargs,
     ) -> AnimationGroup:
         """The creation animation of the stream lines.
 
@@ -771,7 +1063,7 @@ class StreamLines(VectorField):
         time_width: float = 0.3,
         rate_func: Callable[[float], float] = linear,
         line_animation_class: Type[ShowPassingFlash] = ShowPassingFlash,
-        **kwargs
+        **kwargs,
     ) -> None:
         """Animates the stream lines using an updater.
 
@@ -1,3 +1,4 @@
+import multiprocessing
 import time
 import typing
 
@@ -10,6 +11,7 @@ from ..camera.camera import Camera
 from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.exceptions import EndSceneEarlyException
+from ..utils.file_ops import is_png_format, write_to_movie
 from ..utils.iterables import list_update
 
 
@@ -70,6 +72,8 @@ class CairoRenderer:
         self.num_plays = 0
         self.time = 0
         self.static_image = None
+        self.render_processes = []
+        self.rendering_in_worker = False
 
     def init_scene(self, scene):
         self.file_writer = SceneFileWriter(
@@ -110,6 +114,11 @@ class CairoRenderer:
             {"h": str(self.animations_hashes[:5])},
         )
 
+        if not self.skip_animations and self.can_render_in_workers():
+            self.play_in_worker(scene)
+            self.num_plays += 1
+            return
+
         # Save a static image, to avoid rendering non moving objects.
         self.static_image = self.save_static_frame_data(scene, scene.static_mobjects)
 
@@ -126,6 +135,100 @@ class CairoRenderer:
 
         self.num_plays += 1
 
+    def can_render_in_workers(self):
+        """Whether play calls can be rendered by worker processes.
+
+        This requires ``config.render_workers`` to be greater than one, the
+        output to be a movie (frames saved as png are numbered globally) and
+        the ``fork`` start method to be available, as the scene is
+        snapshotted by forking the current process.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the frames of play calls can be rendered in workers.
+        """
+        return (
+            config["render_workers"] > 1
+            and write_to_movie()
+            and not is_png_format()
+            and "fork" in multiprocessing.get_all_start_methods()
+        )
+
+    def play_in_worker(self, scene):
+        """Render the frames of the current play call in a worker process.
+
+        The animations are begun, then the process is forked: the child holds
+        a copy of the scene at this play boundary and writes the partial movie
+        file of the play call, while the main process only advances the scene
+        to the end of the animations without capturing any frame. At most
+        ``config.render_workers`` workers run at the same time.
+
+        Parameters
+        ----------
+        scene : :class:`~.Scene`
+            The scene being played, with its animations already compiled.
+        """
+        while len(self.render_processes) >= config["render_workers"]:
+            self.join_render_process()
+
+        scene.begin_animations()
+        process = multiprocessing.get_context("fork").Process(
+            target=self.render_play_call,
+            args=(scene,),
+            name=f"manim-render-{self.num_plays}",
+        )
+        process.start()
+        self.render_processes.append((self.num_plays, process))
+
+        if scene.is_current_animation_frozen_frame():
+            dt = 1 / self.camera.frame_rate
+            self.time += int(scene.duration / dt) * dt
+        else:
+            self.rendering_in_worker = True
+            try:
+                scene.play_internal()
+            finally:
+                self.rendering_in_worker = False
+
+    def render_play_call(self, scene):
+        """Write the partial movie file of the current play call.
+
+        This is the target of the worker processes started by
+        :meth:`play_in_worker`; the animations have already been begun.
+
+        Parameters
+        ----------
+        scene : :class:`~.Scene`
+            The scene being played.
+        """
+        # Progress bars of concurrent workers would garble the terminal.
+        config["progress_bar"] = "none"
+        self.static_image = self.save_static_frame_data(scene, scene.static_mobjects)
+        self.file_writer.begin_animation(True)
+        if scene.is_current_animation_frozen_frame():
+            self.update_frame(scene)
+            self.freeze_current_frame(scene.duration)
+        else:
+            scene.play_internal()
+        self.file_writer.end_animation(True)
+
+    def join_render_process(self):
+        """Wait for the oldest worker process to finish.
+
+        Raises
+        ------
+        :class:`RuntimeError`
+            If the worker failed to write its partial movie file.
+        """
+        play_number, process = self.render_processes.pop(0)
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(
+                f"Animation {play_number} failed to render in worker process "
+                f"{process.name} (exit code {process.exitcode})."
+            )
+
     def update_frame(  # TODO Description in Docstring
         self,
         scene,
@@ -167,6 +270,10 @@ class CairoRenderer:
         self.camera.capture_mobjects(mobjects, **kwargs)
 
     def render(self, scene, time, moving_mobjects):
+        if self.rendering_in_worker:
+            # The frame is captured by the worker rendering this play call.
+            self.time += 1 / self.camera.frame_rate
+            return
         self.update_frame(scene, moving_mobjects)
         self.add_frame(self.get_frame())
 
@@ -197,8 +304,7 @@ class CairoRenderer:
         self.time += num_frames * dt
         if self.skip_animations:
             return
-        for _ in range(num_frames):
-            self.file_writer.write_frame(frame)
+        self.file_writer.write_frame(frame, num_frames=num_frames)
 
     def freeze_current_frame(self, duration: float):
         """Adds a static frame to the movie for a given duration. The static frame is the current frame.
@@ -266,6 +372,8 @@ class CairoRenderer:
                 raise EndSceneEarlyException()
 
     def scene_finished(self, scene):
+        while self.render_processes:
+            self.join_render_process()
         # If no animations in scene, render an image instead
         if self.num_plays:
             self.file_writer.finish()
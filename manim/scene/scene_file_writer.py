@@ -4,10 +4,12 @@ __all__ = ["SceneFileWriter"]
 
 import datetime
 import os
+import queue
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from time import sleep
+from time import perf_counter, sleep
 
 import numpy as np
 from PIL import Image
@@ -17,6 +19,7 @@ from manim import __version__
 
 from .. import config, logger
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
+from ..utils.caching import PartialMovieCache
 from ..utils.file_ops import (
     add_extension_if_not_present,
     add_version_before_extension,
@@ -24,12 +27,131 @@ from ..utils.file_ops import (
     is_gif_format,
     is_png_format,
     is_webm_format,
-    modify_atime,
     write_to_movie,
 )
 from ..utils.sounds import get_full_sound_file_path
 
 
+class _FrameWriter:
+    """Pipes frames to FFMPEG from a background thread.
+
+    Frames are copied into a bounded ring of preallocated buffers, so that the
+    rendering of a frame overlaps with the piping of the previous ones. When
+    every buffer is waiting to be piped, :meth:`write` blocks until FFMPEG has
+    consumed one of them.
+
+    Parameters
+    ----------
+    num_buffers : int, optional
+        The number of frame buffers in the ring.
+    """
+
+    def __init__(self, num_buffers=4):
+        self.num_buffers = num_buffers
+        self.buffers = []
+        self.thread = None
+
+    def start(self, stream):
+        """Start piping frames to ``stream``.
+
+        Parameters
+        ----------
+        stream : io.BufferedWriter
+            The standard input of the FFMPEG process.
+        """
+        self.stream = stream
+        self.free_buffers = queue.Queue()
+        for index in range(len(self.buffers)):
+            self.free_buffers.put(index)
+        self.filled_buffers = queue.Queue()
+        self.error = None
+        self.num_frames = 0
+        self.total_queue_depth = 0
+        self.max_queue_depth = 0
+        self.render_wait_time = 0
+        self.encoder_wait_time = 0
+        self.thread = threading.Thread(target=self._pipe_frames, daemon=True)
+        self.thread.start()
+
+    def write(self, frame, num_frames=1):
+        """Queue ``frame`` to be written ``num_frames`` times.
+
+        Parameters
+        ----------
+        frame : Union[np.ndarray, bytes]
+            The raw data of the frame. It is copied, so it can be modified
+            as soon as this returns.
+        num_frames : int, optional
+            The number of times the frame is written.
+        """
+        self._raise_error()
+        data = np.frombuffer(frame, dtype=np.uint8)
+        if not self.buffers or self.buffers[0].size != data.size:
+            self._allocate_buffers(data.size)
+        t_start = perf_counter()
+        index = self.free_buffers.get()
+        self.render_wait_time += perf_counter() - t_start
+        np.copyto(self.buffers[index], data)
+        self.filled_buffers.put((index, num_frames))
+        queue_depth = self.filled_buffers.qsize()
+        self.num_frames += 1
+        self.total_queue_depth += queue_depth
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+
+    def stop(self):
+        """Wait for every queued frame to be piped, then stop the thread.
+
+        Returns
+        -------
+        :class:`dict`
+            Statistics about the queue: the mean and maximal number of frames
+            waiting to be piped, and the time spent by the renderer waiting for
+            a free buffer (encode-bound) and by the thread waiting for a frame
+            (render-bound).
+        """
+        self.filled_buffers.put(None)
+        self.thread.join()
+        self.thread = None
+        self._raise_error()
+        return {
+            "mean_queue_depth": self.total_queue_depth / max(self.num_frames, 1),
+            "max_queue_depth": self.max_queue_depth,
+            "render_wait_time": self.render_wait_time,
+            "encoder_wait_time": self.encoder_wait_time,
+        }
+
+    def _allocate_buffers(self, size):
+        # Every buffer must be free: the frame size only changes between movies.
+        while self.free_buffers.qsize() < len(self.buffers):
+            sleep(0.001)
+            self._raise_error()
+        self.buffers = [np.empty(size, dtype=np.uint8) for _ in range(self.num_buffers)]
+        self.free_buffers = queue.Queue()
+        for index in range(self.num_buffers):
+            self.free_buffers.put(index)
+
+    def _pipe_frames(self):
+        while True:
+            t_start = perf_counter()
+            item = self.filled_buffers.get()
+            self.encoder_wait_time += perf_counter() - t_start
+            if item is None:
+                return
+            index, num_frames = item
+            try:
+                if self.error is None:
+                    for _ in range(num_frames):
+                        self.stream.write(self.buffers[index])
+            except Exception as error:
+                self.error = error
+            self.free_buffers.put(index)
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+
 class SceneFileWriter(object):
     """
     SceneFileWriter is the object that actually writes the animations
@@ -47,6 +169,8 @@ class SceneFileWriter(object):
             The file-type extension of the outputted video.
         "partial_movie_files"
             List of all the partial-movie files.
+        "output_files"
+            List of the paths of the images and movies written so far.
 
     """
 
@@ -57,6 +181,8 @@ class SceneFileWriter(object):
         self.init_audio()
         self.frame_count = 0
         self.partial_movie_files = []
+        self.output_files = []
+        self.frame_writer = _FrameWriter()
 
     def init_output_directories(self, scene_name):
         """Initialise output directories.
@@ -113,6 +239,7 @@ class SceneFileWriter(object):
                     module_name=module_name,
                 )
             )
+            self.partial_movie_cache = PartialMovieCache(self.partial_movie_directory)
 
     def add_partial_movie_file(self, hash_animation):
         """Adds a new partial movie file path to scene.partial_movie_files from an hash. This method will compute the path from the hash.
@@ -250,13 +377,24 @@ class SceneFileWriter(object):
         Used internally by manim to stream the animation to FFMPEG for
         displaying or writing to a file.
 
+        With the Cairo renderer, FFMPEG is only started once a frame differing
+        from the first one is written, see :meth:`write_frame`.
+
         Parameters
         ----------
         allow_write : bool, optional
             Whether or not to write to a video file.
         """
         if write_to_movie() and allow_write:
-            self.open_movie_pipe(file_path=file_path)
+            if config.renderer == "opengl":
+                self.open_movie_pipe(file_path=file_path)
+            else:
+                if file_path is None:
+                    file_path = self.partial_movie_files[self.renderer.num_plays]
+                self.partial_movie_file_path = file_path
+                self.writing_process = None
+                self.repeated_frame = None
+                self.repeated_frame_count = 0
 
     def end_animation(self, allow_write=False):
         """
@@ -271,31 +409,79 @@ class SceneFileWriter(object):
         if write_to_movie() and allow_write:
             self.close_movie_pipe()
 
-    def write_frame(self, frame_or_renderer):
+    def write_frame(self, frame_or_renderer, num_frames=1):
         """
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
 
+        With the Cairo renderer, identical frames at the start of an animation
+        are only counted. If the whole animation is made of the same frame (as
+        for a static :meth:`~.Scene.wait`), this frame is piped once and
+        FFMPEG clones it for the remaining duration.
+
         Parameters
         ----------
-        frame : np.array
-            Pixel array of the frame.
+        frame_or_renderer : np.array
+            Pixel array of the frame, or the renderer with OpenGL.
+        num_frames : int, optional
+            The number of times the frame is repeated.
         """
         if config.renderer == "opengl":
             renderer = frame_or_renderer
-            self.writing_process.stdin.write(
-                renderer.get_raw_frame_buffer_object_data()
-            )
+            self.frame_writer.write(renderer.get_raw_frame_buffer_object_data())
         else:
             frame = frame_or_renderer
             if write_to_movie():
-                self.writing_process.stdin.write(frame.tobytes())
+                if self.writing_process is None and self.is_repeated_frame(frame):
+                    self.repeated_frame = frame
+                    self.repeated_frame_count += num_frames
+                else:
+                    if self.writing_process is None:
+                        self.open_movie_pipe(file_path=self.partial_movie_file_path)
+                        self.pipe_frame(self.repeated_frame, self.repeated_frame_count)
+                    self.pipe_frame(frame, num_frames)
             if is_png_format():
                 target_dir, extension = os.path.splitext(self.image_file_path)
-                Image.fromarray(frame).save(
-                    f"{target_dir}{self.frame_count}{extension}"
-                )
-                self.frame_count += 1
+                for _ in range(num_frames):
+                    Image.fromarray(frame).save(
+                        f"{target_dir}{self.frame_count}{extension}"
+                    )
+                    self.frame_count += 1
+
+    def is_repeated_frame(self, frame):
+        """Whether ``frame`` continues the run of identical frames that
+        started the current animation.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if no frame has been written yet, or if ``frame`` is
+            identical to the frames written so far.
+        """
+        return (
+            self.repeated_frame is None
+            or frame is self.repeated_frame
+            or np.array_equal(frame, self.repeated_frame)
+        )
+
+    def pipe_frame(self, frame, num_frames=1):
+        """Write ``frame`` ``num_frames`` times to the FFMPEG input buffer.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+        num_frames : int, optional
+            The number of times the frame is written.
+        """
+        if not num_frames:
+            return
+        self.frame_writer.write(np.ascontiguousarray(frame), num_frames)
 
     def save_final_image(self, image):
         """
@@ -342,22 +528,36 @@ class SceneFileWriter(object):
         frame in the default image directory.
         """
         if write_to_movie():
-            if hasattr(self, "writing_process"):
+            if getattr(self, "writing_process", None) is not None:
                 self.writing_process.terminate()
             self.combine_movie_files(partial_movie_files=partial_movie_files)
             if config["flush_cache"]:
                 self.flush_cache_directory()
             else:
                 self.clean_cache()
+            logger.info(
+                "Partial movie cache: %(hits)s hit(s), %(misses)s miss(es).",
+                {
+                    "hits": self.partial_movie_cache.hits,
+                    "misses": self.partial_movie_cache.misses,
+                },
+            )
         elif is_png_format():
             target_dir, _ = os.path.splitext(self.image_file_path)
             logger.info("\n%i images ready at %s\n", self.frame_count, target_dir)
 
-    def open_movie_pipe(self, file_path=None):
+    def open_movie_pipe(self, file_path=None, num_cloned_frames=0):
         """
         Used internally by Manim to initialise
         FFMPEG and begin writing to FFMPEG's input
         buffer.
+
+        Parameters
+        ----------
+        file_path : str, optional
+            The path of the partial movie file to write.
+        num_cloned_frames : int, optional
+            The number of times FFMPEG repeats the last frame it receives.
         """
         if file_path is None:
             file_path = self.partial_movie_files[self.renderer.num_plays]
@@ -391,8 +591,13 @@ class SceneFileWriter(object):
             "-metadata",
             f"comment=Rendered with Manim Community v{__version__}",
         ]
+        video_filters = []
         if config.renderer == "opengl":
-            command += ["-vf", "vflip"]
+            video_filters.append("vflip")
+        if num_cloned_frames:
+            video_filters.append(f"tpad=stop_mode=clone:stop={num_cloned_frames}")
+        if video_filters:
+            command += ["-vf", ",".join(video_filters)]
         if is_webm_format():
             command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
         # .mov format
@@ -400,16 +605,42 @@ class SceneFileWriter(object):
             command += ["-vcodec", "qtrle"]
         else:
             command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
-        command += [file_path]
+        # The file is written under a temporary name, and only moved in place
+        # once complete, so that other renders sharing the cache never see it
+        # partially written.
+        command += [self.partial_movie_cache.temporary_path(file_path)]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.frame_writer.start(self.writing_process.stdin)
 
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's input buffer
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
-
+        if self.writing_process is None:
+            # Every frame of the animation is the same: pipe it only once.
+            self.open_movie_pipe(
+                file_path=self.partial_movie_file_path,
+                num_cloned_frames=max(self.repeated_frame_count - 1, 0),
+            )
+            if self.repeated_frame is not None:
+                self.pipe_frame(self.repeated_frame)
+        try:
+            queue_stats = self.frame_writer.stop()
+        finally:
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
+        self.partial_movie_cache.commit(self.partial_movie_file_path)
+        logger.debug(
+            f"Animation {self.renderer.num_plays} : frame queue depth %(mean)s "
+            "on average, %(max)s at most; renderer waited %(render)s s for a "
+            "free buffer, FFMPEG waited %(encoder)s s for a frame.",
+            {
+                "mean": f"{queue_stats['mean_queue_depth']:.1f}",
+                "max": queue_stats["max_queue_depth"],
+                "render": f"{queue_stats['render_wait_time']:.3f}",
+                "encoder": f"{queue_stats['encoder_wait_time']:.3f}",
+            },
+        )
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
             {"path": f"'{self.partial_movie_file_path}'"},
@@ -434,7 +665,7 @@ class SceneFileWriter(object):
             self.partial_movie_directory,
             f"{hash_invocation}{config['movie_file_extension']}",
         )
-        return os.path.exists(path)
+        return self.partial_movie_cache.lookup(path)
 
     def combine_movie_files(self, partial_movie_files=None):
         """
@@ -455,9 +686,11 @@ class SceneFileWriter(object):
         # it's just an empty scene initialized.
 
         # Write a file partial_file_list.txt containing all partial movie
-        # files. This is used by FFMPEG.
+        # files. This is used by FFMPEG. Its name is unique to this process,
+        # as several renders may share the partial movie directory.
         file_list = os.path.join(
-            self.partial_movie_directory, "partial_movie_file_list.txt"
+            self.partial_movie_directory,
+            f"partial_movie_file_list_{os.getpid()}.txt",
         )
         logger.debug(
             f"Partial movie files to combine ({len(partial_movie_files)} files): %(p)s",
@@ -505,6 +738,7 @@ class SceneFileWriter(object):
 
         combine_process = subprocess.Popen(commands)
         combine_process.wait()
+        os.remove(file_list)
 
         if self.includes_sound:
             extension = config["movie_file_extension"]
@@ -550,48 +784,37 @@ class SceneFileWriter(object):
             self.gif_file_path if is_gif_format() else movie_file_path
         )
         if write_to_movie():
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
+            # Mark the files as used, so that if we have to clean the cache we remove the ones used the longest ago.
+            self.partial_movie_cache.touch(partial_movie_files)
 
     def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                cached_partial_movies,
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        """Will clean the cache by removing the partial_movie_files used by manim the longest ago.
+
+        Files are removed until there are at most ``config["max_files_cached"]``
+        of them, they weigh at most ``config["max_cache_size"]`` megabytes, and
+        none of them has been unused for more than ``config["max_cache_age"]`` days.
+        """
+        number_files_deleted = self.partial_movie_cache.evict(
+            max_files=config["max_files_cached"],
+            max_size=config["max_cache_size"] * 1024 ** 2,
+            max_age=config["max_cache_age"] * 24 * 3600,
+        )
+        if number_files_deleted:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The partial movie directory is full. Therefore, manim has removed {number_files_deleted} file(s) used by it the longest ago."
+                + "You can change this behaviour by changing max_files_cached, max_cache_size or max_cache_age in config."
             )
 
     def flush_cache_directory(self):
         """Delete all the cached partial movie files"""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        for f in cached_partial_movies:
-            os.remove(f)
+        number_files_deleted = self.partial_movie_cache.flush()
         logger.info(
-            f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
+            f"Cache flushed. {number_files_deleted} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
         )
 
     def print_file_ready_message(self, file_path):
         """Prints the "File Ready" message to STDOUT."""
         config["output_file"] = file_path
+        self.output_files.append(file_path)
         logger.info("\nFile ready at %(file_path)s\n", {"file_path": f"'{file_path}'"})
@@ -2,7 +2,9 @@
 
 __all__ = [
     "bezier",
+    "batched_bezier",
     "partial_bezier_points",
+    "batched_partial_bezier_points",
     "partial_quadratic_bezier_points",
     "interpolate",
     "integer_interpolate",
@@ -51,6 +53,34 @@ def bezier(
     )
 
 
+def batched_bezier(points: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Evaluate many bezier curves at once.
+
+    This computes the same values as :func:`bezier`, for all the curves and
+    parameters at once.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points defining the bezier curves, of shape ``(..., n + 1, dim)``
+        for curves of degree ``n``.
+    t : np.ndarray
+        Parameters at which the curves are evaluated. Their shape must be
+        broadcastable with ``points.shape[:-2]``.
+
+    Returns
+    -------
+    np.ndarray
+        The points on the curves, of shape ``(..., dim)``.
+    """
+    t = np.asarray(t, dtype=float)[..., np.newaxis]
+    n = points.shape[-2] - 1
+    return sum(
+        ((1 - t) ** (n - k)) * (t ** k) * choose(n, k) * points[..., k, :]
+        for k in range(n + 1)
+    )
+
+
 def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     """Given an array of points which define bezier curve, and two numbers 0<=a<b<=1, return an array of the same size,
     which describes the portion of the original bezier curve on the interval [a, b].
@@ -79,6 +109,42 @@ def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
 
 
+def batched_partial_bezier_points(
+    points: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    """Batched version of :func:`partial_bezier_points`: return the points
+    describing the portions on the intervals ``[a[i], b[i]]`` of the bezier
+    curves defined by ``points[i]``.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points defining the bezier curves, of shape ``(m, n + 1, dim)``.
+    a : np.ndarray
+        Lower bounds of the desired partial bezier curves, of shape ``(m,)``.
+    b : np.ndarray
+        Upper bounds of the desired partial bezier curves, of shape ``(m,)``.
+
+    Returns
+    -------
+    np.ndarray
+        Points defining the partial bezier curves, of shape ``(m, n + 1, dim)``.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    num_points = points.shape[1]
+    a_to_1 = np.stack(
+        [batched_bezier(points[:, i:], a) for i in range(num_points)], axis=1
+    )
+    end_prop = np.divide(b - a, 1.0 - a, out=np.zeros_like(a), where=a != 1)
+    result = np.stack(
+        [batched_bezier(a_to_1[:, : i + 1], end_prop) for i in range(num_points)],
+        axis=1,
+    )
+    result[a == 1] = points[a == 1, -1:]
+    return result
+
+
 # Shortened version of partial_bezier_points just for quadratics,
 # since this is called a fair amount
 def partial_quadratic_bezier_points(points, a, b):
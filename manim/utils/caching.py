@@ -1,3 +1,7 @@
+import os
+import sqlite3
+import time
+
 from .. import config, logger
 from ..utils.hashing import get_hash_from_play_call
 
@@ -58,3 +62,214 @@ def handle_caching_play(func):
         func(self, scene, *args, **kwargs)
 
     return wrapper
+
+
+class PartialMovieCache:
+    """On-disk cache of the partial movie files, indexed by their hash.
+
+    The files live in ``directory``, named after the hash of the play call
+    that produced them. An sqlite index alongside them records the size of
+    each file and when it was last used, so that eviction does not rely on
+    the access time of the files (which is not updated on ``noatime``
+    volumes). Several renders can share one directory: sqlite serializes the
+    accesses to the index, and files are written under a temporary name then
+    atomically renamed by :meth:`commit`.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory of the partial movie files.
+    """
+
+    INDEX_FILE_NAME = ".partial_movie_cache.db"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, self.INDEX_FILE_NAME)
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS partial_movies "
+                "(file_name TEXT PRIMARY KEY, size INTEGER, last_used REAL)"
+            )
+        connection.close()
+
+    def _connect(self):
+        # A connection is opened for each operation, as connections can neither
+        # be shared between processes nor kept open while the directory is flushed.
+        return sqlite3.connect(self.index_path, timeout=60)
+
+    def _cached_file_names(self):
+        return [
+            file_name
+            for file_name in os.listdir(self.directory)
+            if not file_name.startswith(".")
+            and not file_name.endswith(".txt")
+            and os.path.isfile(os.path.join(self.directory, file_name))
+        ]
+
+    def lookup(self, file_path):
+        """Check whether ``file_path`` is cached, and count a hit or a miss.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the partial movie file.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file exists.
+        """
+        if os.path.exists(file_path):
+            self.hits += 1
+            self.touch([file_path])
+            return True
+        self.misses += 1
+        return False
+
+    def temporary_path(self, file_path):
+        """Return the path under which ``file_path`` is written before :meth:`commit`.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the partial movie file.
+
+        Returns
+        -------
+        :class:`str`
+            A hidden path in the same directory, unique to this process.
+        """
+        directory, file_name = os.path.split(file_path)
+        return os.path.join(directory, f".{os.getpid()}.{file_name}")
+
+    def commit(self, file_path):
+        """Move the temporary file of ``file_path`` in place and index it.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the partial movie file.
+        """
+        os.replace(self.temporary_path(file_path), file_path)
+        self.touch([file_path])
+
+    def touch(self, file_paths):
+        """Mark ``file_paths`` as used now.
+
+        Parameters
+        ----------
+        file_paths : Iterable[:class:`str`]
+            Paths of partial movie files of this cache.
+        """
+        now = time.time()
+        rows = []
+        for file_path in file_paths:
+            try:
+                rows.append(
+                    (os.path.basename(file_path), os.path.getsize(file_path), now)
+                )
+            except OSError:
+                # The file has been evicted by another render in the meantime.
+                continue
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO partial_movies VALUES (?, ?, ?)", rows
+            )
+        connection.close()
+
+    def evict(
+        self, max_files=float("inf"), max_size=float("inf"), max_age=float("inf")
+    ):
+        """Remove the least recently used files until the cache fits the limits.
+
+        Files present in the directory but missing from the index (e.g.
+        written by an older version of manim) are indexed with their
+        modification time.
+
+        Parameters
+        ----------
+        max_files : :class:`float`
+            The maximum number of files kept.
+        max_size : :class:`float`
+            The maximum total size of the files kept, in bytes.
+        max_age : :class:`float`
+            The maximum time since a file has been used, in seconds.
+
+        Returns
+        -------
+        :class:`int`
+            The number of files removed.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                # Hold the write lock on the index while the directory is modified.
+                connection.execute("BEGIN IMMEDIATE")
+                indexed = {
+                    file_name: (size, last_used)
+                    for file_name, size, last_used in connection.execute(
+                        "SELECT file_name, size, last_used FROM partial_movies"
+                    )
+                }
+                entries = []
+                for file_name in self._cached_file_names():
+                    if file_name in indexed:
+                        entries.append((file_name, *indexed[file_name]))
+                    else:
+                        stat = os.stat(os.path.join(self.directory, file_name))
+                        entries.append((file_name, stat.st_size, stat.st_mtime))
+                # Most recently used first.
+                entries.sort(key=lambda entry: entry[2], reverse=True)
+                now = time.time()
+                kept, evicted = [], []
+                total_size = 0
+                for entry in entries:
+                    file_name, size, last_used = entry
+                    if (
+                        not evicted
+                        and len(kept) < max_files
+                        and total_size + size <= max_size
+                        and now - last_used <= max_age
+                    ):
+                        kept.append(entry)
+                        total_size += size
+                    else:
+                        evicted.append(entry)
+                for file_name, _, _ in evicted:
+                    try:
+                        os.remove(os.path.join(self.directory, file_name))
+                    except FileNotFoundError:
+                        pass
+                connection.execute("DELETE FROM partial_movies")
+                connection.executemany(
+                    "INSERT INTO partial_movies VALUES (?, ?, ?)", kept
+                )
+        finally:
+            connection.close()
+        return len(evicted)
+
+    def flush(self):
+        """Remove every cached file.
+
+        Returns
+        -------
+        :class:`int`
+            The number of files removed.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                cached_file_names = self._cached_file_names()
+                for file_name in cached_file_names:
+                    try:
+                        os.remove(os.path.join(self.directory, file_name))
+                    except FileNotFoundError:
+                        pass
+                connection.execute("DELETE FROM partial_movies")
+        finally:
+            connection.close()
+        return len(cached_file_names)
@@ -1,6 +1,7 @@
 """Utilities for scene caching."""
 
 import collections
+import contextlib
 import copy
 import inspect
 import json
@@ -13,6 +14,8 @@ from typing import Any
 import numpy as np
 
 from .. import logger
+from ..mobject.mobject import Mobject
+from ..mobject.opengl_mobject import OpenGLMobject
 
 # Sometimes there are elements that are not suitable for hashing (too long or run-dependent)
 # This is used to filter them out.
@@ -20,6 +23,27 @@ KEYS_TO_FILTER_OUT = set(
     ["original_id", "background", "pixel_array", "pixel_array_to_cairo_context"]
 )
 
+# Attributes of mobjects that are not part of their content: links to the parents
+# (the content of a mobject does not depend on where it is used), and caches and
+# bookkeeping flags derived from the other attributes.
+MOBJECT_KEYS_TO_FILTER_OUT = set(
+    [
+        "parents",
+        "family",
+        "needs_new_bounding_box",
+        "point_hash",
+        "_arc_length_table",
+        "_bounding_box_cache",
+        "_family_cache",
+        "_shaded_rgbas_cache",
+        "_submobjects_have_updaters",
+    ]
+)
+
+# Source code of the functions processed, by code object. The source of a code object
+# cannot change during a run, and ``inspect.getsource`` has to read and tokenize the file.
+_SOURCE_CODE_CACHE = {}
+
 
 class _Memoizer:
     """Implements the memoization logic to optimize the hashing procedure and prevent the circular references within iterable processed.
@@ -32,12 +56,53 @@ class _Memoizer:
 
     _already_processed = set()
 
+    # Signatures of the objects that are never processed, in any scope (the scene).
+    _excluded = set()
+
+    # Digests of the mobjects processed, by id. The mobject is kept alongside its digest
+    # so that its id cannot be reused by another object while memoized.
+    _mobject_digests = {}
+
     # Can be changed to whatever string to help debugging the JSon generation.
     ALREADY_PROCESSED_PLACEHOLDER = "ALREADY PROCESSED"
 
     @classmethod
     def reset_already_processed(cls):
         cls._already_processed.clear()
+        cls._excluded.clear()
+        cls._mobject_digests.clear()
+
+    @classmethod
+    def exclude(cls, obj: Any) -> None:
+        """Marks an object as processed in the current and all the following scopes.
+
+        Parameters
+        ----------
+        obj : Any
+            The object to exclude from the hashing.
+        """
+        try:
+            sign = hash(obj)
+        except TypeError:
+            sign = id(obj)
+        cls._excluded.add(sign)
+        cls._already_processed.add(sign)
+
+    @classmethod
+    @contextlib.contextmanager
+    def fresh_scope(cls):
+        """Context manager processing objects independently of the ones processed before.
+
+        Within the scope, only the objects processed in it (and the excluded ones) are
+        replaced by the placeholder, so that the result does not depend on what was
+        hashed earlier in the same pass.
+        """
+        already_processed = cls._already_processed
+        cls._already_processed = set(cls._excluded)
+        try:
+            yield
+        finally:
+            cls._already_processed = already_processed
 
     @classmethod
     def check_already_processed_decorator(cls: "_Memoizer", is_method=False):
@@ -164,15 +229,11 @@ class _CustomEncoder(json.JSONEncoder):
                 # NOTE : All module types objects are removed, because otherwise it throws ValueError: Circular reference detected if not. TODO
                 if isinstance(cvardict[i], ModuleType):
                     del cvardict[i]
-            try:
-                code = inspect.getsource(obj)
-            except OSError:
-                # This happens when rendering videos included in the documentation
-                # within doctests and should be replaced by a solution avoiding
-                # hash collision (due to the same, empty, code strings) at some point.
-                # See https://github.com/ManimCommunity/manim/pull/402.
-                code = ""
-            return self._cleaned_iterable({"code": code, "nonlocals": cvardict})
+            return self._cleaned_iterable(
+                {"code": _get_source_code(obj), "nonlocals": cvardict}
+            )
+        elif isinstance(obj, (Mobject, OpenGLMobject)):
+            return f"MOBJECT DIGEST: {get_mobject_digest(obj)}"
         elif isinstance(obj, np.ndarray):
             if obj.size > 1000:
                 obj = np.resize(obj, (100, 100))
@@ -262,6 +323,111 @@ class _CustomEncoder(json.JSONEncoder):
         return super().encode(obj)
 
 
+def _get_source_code(func):
+    """Return the source code of a function or method, cached by code object.
+
+    Parameters
+    ----------
+    func : Union[FunctionType, MethodType]
+        The function whose source code is returned.
+
+    Returns
+    -------
+    :class:`str`
+        The source code, or an empty string if it is not available.
+    """
+    code_object = func.__code__
+    if code_object not in _SOURCE_CODE_CACHE:
+        try:
+            code = inspect.getsource(func)
+        except OSError:
+            # This happens when rendering videos included in the documentation
+            # within doctests and should be replaced by a solution avoiding
+            # hash collision (due to the same, empty, code strings) at some point.
+            # See https://github.com/ManimCommunity/manim/pull/402.
+            code = ""
+        _SOURCE_CODE_CACHE[code_object] = code
+    return _SOURCE_CODE_CACHE[code_object]
+
+
+def _update_digest(value, digest):
+    """Feed ``value`` into the running crc32 ``digest``.
+
+    Arrays are hashed from their raw bytes, mobjects through their own digest,
+    and containers element by element. Any other object is serialized with
+    :func:`get_json` in a fresh memoizer scope, so that the digest does not
+    depend on the objects hashed before.
+
+    Parameters
+    ----------
+    value : Any
+        The value to hash.
+    digest : :class:`int`
+        The current value of the digest.
+
+    Returns
+    -------
+    :class:`int`
+        The updated digest.
+    """
+    if isinstance(value, (Mobject, OpenGLMobject)):
+        return zlib.crc32(get_mobject_digest(value).to_bytes(4, "little"), digest)
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        digest = zlib.crc32(f"{value.dtype}{value.shape}".encode(), digest)
+        return zlib.crc32(np.ascontiguousarray(value), digest)
+    if isinstance(value, (list, tuple)):
+        digest = zlib.crc32(f"{type(value).__name__}{len(value)}".encode(), digest)
+        for element in value:
+            digest = _update_digest(element, digest)
+        return digest
+    if isinstance(value, dict):
+        digest = zlib.crc32(f"dict{len(value)}".encode(), digest)
+        for key, element in value.items():
+            digest = zlib.crc32(repr(key).encode(), digest)
+            digest = _update_digest(element, digest)
+        return digest
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return zlib.crc32(repr(value).encode(), digest)
+    with _Memoizer.fresh_scope():
+        return zlib.crc32(get_json(value).encode(), digest)
+
+
+def get_mobject_digest(mobject) -> int:
+    """Compute the content digest of a mobject.
+
+    The digest is Merkle-style: it combines the attributes of the mobject
+    itself with the digests of its submobjects, which are memoized for the
+    current hashing pass. A submobject shared by several mobjects is thus
+    only hashed once, and the point arrays are hashed from their raw bytes
+    rather than through their (truncated) ``repr``.
+
+    Parameters
+    ----------
+    mobject : :class:`~.Mobject`
+        The mobject to hash.
+
+    Returns
+    -------
+    :class:`int`
+        The crc32 digest of the mobject and its family.
+    """
+    memoized = _Memoizer._mobject_digests.get(id(mobject))
+    if memoized is not None and memoized[0] is mobject:
+        return memoized[1]
+    # A mobject referencing itself (e.g. through an updater) gets a placeholder digest.
+    _Memoizer._mobject_digests[id(mobject)] = (mobject, 0)
+    digest = zlib.crc32(type(mobject).__qualname__.encode())
+    for key, value in mobject.__dict__.items():
+        if key in KEYS_TO_FILTER_OUT or key in MOBJECT_KEYS_TO_FILTER_OUT:
+            continue
+        digest = zlib.crc32(key.encode(), digest)
+        digest = _update_digest(value, digest)
+    _Memoizer._mobject_digests[id(mobject)] = (mobject, digest)
+    return digest
+
+
 def get_json(obj):
     """Recursively serialize `object` to JSON using the :class:`CustomEncoder` class.
 
@@ -304,14 +470,14 @@ def get_hash_from_play_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    _Memoizer.mark_as_processed(scene_object)
+    _Memoizer.exclude(scene_object)
     camera_json = get_json(camera_object)
     animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = [
+    hash_camera, hash_animations = [
         zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
+        for json_val in [camera_json, animations_list_json]
     ]
+    hash_current_mobjects = _update_digest(list(current_mobjects_list), 0)
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
     t_end = perf_counter()
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
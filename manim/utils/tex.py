@@ -210,6 +210,45 @@ class TexTemplate:
         begin, end = self._texcode_for_environment(environment)
         return self.body.replace(self.placeholder_text, f"{begin}\n{expression}\n{end}")
 
+    def get_texcode_for_expressions(self, expressions, environment=None):
+        r"""Inserts several expressions into TeX template, each one on its own page.
+
+        The pages are made by the ``multi`` mode of the ``standalone`` document class,
+        so this is only supported by templates using that class.
+
+        Parameters
+        ----------
+        expressions : List[:class:`str`]
+            The strings containing the expressions to be typeset, e.g. ``$\\sqrt{2}$``
+        environment : Optional[:class:`str`], optional
+            The string containing the environment in which each expression should be typeset, e.g. ``align*``
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            LaTeX code based on template, with one page per expression, or ``None`` if the template
+            does not use the ``standalone`` document class.
+        """
+        if r"{standalone}" not in self.body or r"\begin{document}" not in self.body:
+            return None
+        if environment is not None:
+            begin, end = self._texcode_for_environment(environment)
+            expressions = [
+                f"{begin}\n{expression}\n{end}" for expression in expressions
+            ]
+        page = "manimpage"
+        pages = "\n".join(
+            f"\\begin{{{page}}}\n{expression}\n\\end{{{page}}}"
+            for expression in expressions
+        )
+        page_definition = (
+            f"\\newenvironment{{{page}}}{{}}{{}}\n\\standaloneconfig{{multi={page}}}\n"
+        )
+        body = self.body.replace(
+            r"\begin{document}", page_definition + r"\begin{document}", 1
+        )
+        return body.replace(self.placeholder_text, pages)
+
     def copy(self) -> "TexTemplate":
         return copy.deepcopy(self)
 
@@ -9,11 +9,21 @@
 import hashlib
 import os
 import re
+import threading
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 from .. import config, logger
 
+# Compilations started by prefetch, by svg file. Each svg file name is the hash of
+# its TeX code, so an expression is never compiled twice at the same time.
+_pending_compilations = {}
+# Errors of the compilations started by prefetch, raised when the svg file is used.
+_failed_compilations = {}
+_compilation_lock = threading.RLock()
+_compilation_pool = None
+
 
 def tex_hash(expression):
     id_str = str(expression)
@@ -43,12 +53,267 @@ def tex_to_svg_file(expression, environment=None, tex_template=None):
     if tex_template is None:
         tex_template = config["tex_template"]
     tex_file = generate_tex_file(expression, environment, tex_template)
+    svg_file = Path(tex_file).with_suffix(".svg").as_posix()
+    future = _pending_compilations.get(svg_file)
+    if future is not None:
+        wait([future])
+    if svg_file in _failed_compilations:
+        raise _failed_compilations.pop(svg_file)
+    if os.path.exists(svg_file):
+        # Either cached, or compiled as a page of a batch by tex_to_svg_files
+        return svg_file
+    return compile_tex_to_svg(tex_file, tex_template)
+
+
+def compile_tex_to_svg(tex_file, tex_template):
+    """Compiles a tex file and converts the result into an svg.
+
+    Parameters
+    ----------
+    tex_file : :class:`str`
+        File name of TeX file to be typeset.
+    tex_template : :class:`~.TexTemplate`
+        Template class used to typesetting.
+
+    Returns
+    -------
+    :class:`str`
+        Path to generated SVG file.
+    """
     dvi_file = compile_tex(
         tex_file, tex_template.tex_compiler, tex_template.output_format
     )
     return convert_to_svg(dvi_file, tex_template.output_format)
 
 
+def prefetch(expressions, environment=None, tex_template=None):
+    """Starts compiling tex expressions in the background.
+
+    The expressions whose svg file is neither cached nor already being compiled
+    are split into one batch per worker thread, and every batch is compiled as
+    in :func:`tex_to_svg_files`. Calling this with all expressions of a scene
+    up front lets the TeX compilations run concurrently; :func:`tex_to_svg_file`
+    waits for the compilation of its expression, if it is still running, and
+    raises its error, if it failed.
+
+    The expressions are typeset as given. :class:`~.MathTex` and :class:`~.Tex`
+    modify their strings and use their own environments, so use
+    :meth:`.MathTex.prefetch` and :meth:`.Tex.prefetch` to compile the TeX code
+    of these mobjects.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        Strings containing the TeX expressions to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment : Optional[:class:`str`], optional
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    List[:class:`concurrent.futures.Future`]
+        The futures of the compilations started.
+    """
+    global _compilation_pool
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    pending = {}
+    for expression in expressions:
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        svg_file = Path(tex_file).with_suffix(".svg").as_posix()
+        if svg_file not in _pending_compilations and not os.path.exists(svg_file):
+            pending.setdefault(svg_file, (tex_file, expression))
+    if not pending:
+        return []
+
+    max_workers = os.cpu_count() or 1
+    with _compilation_lock:
+        if _compilation_pool is None:
+            # The work is done by the TeX and dvisvgm processes, threads
+            # only have to wait for them.
+            _compilation_pool = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="tex"
+            )
+        n_batches = min(max_workers, len(pending))
+        svg_files = list(pending.keys())
+        futures = []
+        for batch_index in range(n_batches):
+            batch = svg_files[batch_index::n_batches]
+            future = _compilation_pool.submit(
+                _compile_in_background,
+                [pending[svg_file] for svg_file in batch],
+                batch,
+                environment,
+                tex_template,
+            )
+            for svg_file in batch:
+                _pending_compilations[svg_file] = future
+            future.add_done_callback(
+                lambda future, batch=batch: _forget_compilations(batch)
+            )
+            futures.append(future)
+    return futures
+
+
+def _compile_in_background(
+    tex_files_and_expressions, svg_files, environment, tex_template
+):
+    expressions = [expression for _, expression in tex_files_and_expressions]
+    if len(expressions) > 1 and compile_tex_batch(
+        expressions, svg_files, environment, tex_template
+    ):
+        return
+    for (tex_file, _), svg_file in zip(tex_files_and_expressions, svg_files):
+        if os.path.exists(svg_file):
+            continue
+        try:
+            compile_tex_to_svg(tex_file, tex_template)
+        except (RuntimeError, ValueError) as error:
+            _failed_compilations[svg_file] = error
+
+
+def _forget_compilations(svg_files):
+    with _compilation_lock:
+        for svg_file in svg_files:
+            _pending_compilations.pop(svg_file, None)
+
+
+def _temporary_path(path):
+    """Returns a path next to ``path`` that no other process or thread writes to.
+
+    Files are written to such a path first and then moved to ``path`` with
+    :func:`os.replace`, so that concurrent renders sharing a ``tex_dir`` never
+    read a partially written file.
+    """
+    path = Path(path)
+    name = f"{path.stem}_{os.getpid()}_{threading.get_ident()}{path.suffix}"
+    return path.with_name(name).as_posix()
+
+
+def tex_to_svg_files(expressions, environment=None, tex_template=None):
+    """Takes several tex expressions and returns the svg versions of the compiled tex
+
+    The expressions whose svg file is not cached yet are typeset as the pages
+    of a single document, which takes one run of the TeX compiler and of
+    ``dvisvgm`` instead of one for each expression. If the batch cannot be
+    compiled, e.g. because the template does not use the ``standalone``
+    document class or one of the expressions contains an error, the expressions
+    are compiled one by one as in :func:`tex_to_svg_file`.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        Strings containing the TeX expressions to be rendered, e.g. ``\\sqrt{2}`` or ``foo``
+    environment : Optional[:class:`str`], optional
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template : Optional[:class:`~.TexTemplate`], optional
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    List[:class:`str`]
+        Paths to generated SVG files, in the order of the expressions.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    pending = {}
+    for expression in expressions:
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        svg_file = Path(tex_file).with_suffix(".svg").as_posix()
+        # Expressions being compiled by prefetch are collected by tex_to_svg_file
+        if svg_file not in _pending_compilations and not os.path.exists(svg_file):
+            pending.setdefault(svg_file, expression)
+    if len(pending) > 1:
+        compile_tex_batch(
+            list(pending.values()), list(pending.keys()), environment, tex_template
+        )
+    return [
+        tex_to_svg_file(expression, environment, tex_template)
+        for expression in expressions
+    ]
+
+
+def compile_tex_batch(expressions, svg_files, environment, tex_template):
+    """Typesets expressions as the pages of one document and converts every page to svg.
+
+    Parameters
+    ----------
+    expressions : List[:class:`str`]
+        Strings containing the TeX expressions to be rendered.
+    svg_files : List[:class:`str`]
+        Paths where the svg file of each expression is moved to.
+    environment : Optional[:class:`str`]
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template : :class:`~.TexTemplate`
+        Template class used to typesetting.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the svg files of all expressions were generated.
+    """
+    output = tex_template.get_texcode_for_expressions(expressions, environment)
+    if output is None:
+        return False
+    tex_dir = Path(config.get_dir("tex_dir")).as_posix()
+    tex_file = os.path.join(tex_dir, tex_hash(output)) + ".tex"
+    tex_file = Path(tex_file).as_posix()
+    _write_atomically(tex_file, output)
+
+    # The intermediate files of the batch are only used by this call
+    output_format = tex_template.output_format
+    job_file = _temporary_path(tex_file)
+    command = tex_compilation_command(
+        tex_template.tex_compiler,
+        output_format,
+        tex_file,
+        tex_dir,
+        jobname=Path(job_file).stem,
+    )
+    exit_code = os.system(command)
+    for extension in [".log", ".aux"]:
+        if os.path.exists(job_file.replace(".tex", extension)):
+            os.remove(job_file.replace(".tex", extension))
+    dvi_file = job_file.replace(".tex", output_format)
+    if exit_code != 0 or not os.path.exists(dvi_file):
+        logger.debug("Batch compilation of %(path)s failed", {"path": tex_file})
+        if os.path.exists(dvi_file):
+            os.remove(dvi_file)
+        return False
+
+    # dvisvgm writes one file per page, with zero padded page numbers
+    digits = len(str(len(expressions)))
+    page_pattern = job_file.replace(".tex", f"-%{digits}p.svg")
+    commands = [
+        "dvisvgm",
+        "--pdf" if output_format == ".pdf" else "",
+        "-p 1-",
+        f'"{dvi_file}"',
+        "-n",
+        "-v 0",
+        "-o " + f'"{page_pattern}"',
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+    os.remove(dvi_file)
+    pages = [
+        job_file.replace(".tex", f"-{number:0{digits}d}.svg")
+        for number in range(1, len(expressions) + 2)
+    ]
+    extra_page = pages.pop()
+    if not all(os.path.exists(page) for page in pages) or os.path.exists(extra_page):
+        # The pages cannot be matched with the expressions
+        for page in pages + [extra_page]:
+            if os.path.exists(page):
+                os.remove(page)
+        return False
+    for page, svg_file in zip(pages, svg_files):
+        os.replace(page, svg_file)
+    return True
+
+
 def generate_tex_file(expression, environment=None, tex_template=None):
     """Takes a tex expression (and an optional tex environment),
     and returns a fully formed tex file ready for compilation.
@@ -81,12 +346,20 @@ def generate_tex_file(expression, environment=None, tex_template=None):
     result = os.path.join(tex_dir, tex_hash(output)) + ".tex"
     if not os.path.exists(result):
         logger.info('Writing "%s" to %s' % ("".join(expression), result))
-        with open(result, "w", encoding="utf-8") as outfile:
-            outfile.write(output)
+        _write_atomically(result, output)
     return result
 
 
-def tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
+def _write_atomically(file_name, content):
+    temporary_file = _temporary_path(file_name)
+    with open(temporary_file, "w", encoding="utf-8") as outfile:
+        outfile.write(content)
+    os.replace(temporary_file, file_name)
+
+
+def tex_compilation_command(
+    tex_compiler, output_format, tex_file, tex_dir, jobname=None
+):
     """Prepares the tex compilation command with all necessary cli flags
 
     Parameters
@@ -99,12 +372,15 @@ def tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
         File name of TeX file to be typeset.
     tex_dir : :class:`str`
         Path to the directory where compiler output will be stored.
+    jobname : Optional[:class:`str`], optional
+        Base name of the files written by the compiler. Defaults to the name of the TeX file.
 
     Returns
     -------
     :class:`str`
         Compilation command according to given parameters
     """
+    jobname_flag = f'-jobname="{jobname}"' if jobname is not None else ""
     if tex_compiler in {"latex", "pdflatex", "luatex", "lualatex"}:
         commands = [
             tex_compiler,
@@ -112,6 +388,7 @@ def tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
             f'-output-format="{output_format[1:]}"',
             "-halt-on-error",
             f'-output-directory="{tex_dir}"',
+            jobname_flag,
             f'"{tex_file}"',
             ">",
             os.devnull,
@@ -129,6 +406,7 @@ def tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
             "-interaction=batchmode",
             "-halt-on-error",
             f'-output-directory="{tex_dir}"',
+            jobname_flag,
             f'"{tex_file}"',
             ">",
             os.devnull,
@@ -176,10 +454,24 @@ def compile_tex(tex_file, tex_compiler, output_format):
     tex_file = Path(tex_file).as_posix()
     tex_dir = Path(config.get_dir("tex_dir")).as_posix()
     if not os.path.exists(result):
+        # Compile under a name of our own, and move the output in place when done
+        job_file = _temporary_path(tex_file)
         command = tex_compilation_command(
-            tex_compiler, output_format, tex_file, tex_dir
+            tex_compiler,
+            output_format,
+            tex_file,
+            tex_dir,
+            jobname=Path(job_file).stem,
         )
         exit_code = os.system(command)
+        for extension in [".log", ".aux", output_format]:
+            job_output = job_file.replace(".tex", extension)
+            if not os.path.exists(job_output):
+                continue
+            if exit_code == 0 or extension == ".log":
+                os.replace(job_output, tex_file.replace(".tex", extension))
+            else:
+                os.remove(job_output)
         if exit_code != 0:
             log_file = tex_file.replace(".tex", ".log")
             if not Path(log_file).exists():
@@ -260,6 +552,7 @@ def convert_to_svg(dvi_file, extension, page=1):
     result = Path(result).as_posix()
     dvi_file = Path(dvi_file).as_posix()
     if not os.path.exists(result):
+        temporary_result = _temporary_path(result)
         commands = [
             "dvisvgm",
             "--pdf" if extension == ".pdf" else "",
@@ -267,11 +560,13 @@ def convert_to_svg(dvi_file, extension, page=1):
             f'"{dvi_file}"',
             "-n",
             "-v 0",
-            "-o " + f'"{result}"',
+            "-o " + f'"{temporary_result}"',
             ">",
             os.devnull,
         ]
         os.system(" ".join(commands))
+        if os.path.exists(temporary_result):
+            os.replace(temporary_result, result)
 
     # if the file does not exist now, this means conversion failed
     if not os.path.exists(result):
@@ -0,0 +1,45 @@
+import os
+import time
+
+from manim.utils.caching import PartialMovieCache
+
+
+def write_partial_movie(directory, name, size):
+    path = os.path.join(str(directory), name)
+    with open(path, "wb") as file:
+        file.write(bytes(size))
+    return path
+
+
+def test_lookup_counts_hits_and_misses(tmp_path):
+    cache = PartialMovieCache(str(tmp_path))
+    path = write_partial_movie(tmp_path, "1_2_3.mp4", 10)
+    assert cache.lookup(path)
+    assert not cache.lookup(os.path.join(str(tmp_path), "4_5_6.mp4"))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_commit_is_atomic(tmp_path):
+    cache = PartialMovieCache(str(tmp_path))
+    path = os.path.join(str(tmp_path), "1_2_3.mp4")
+    write_partial_movie(tmp_path, os.path.basename(cache.temporary_path(path)), 10)
+    # Files being written are not part of the cache.
+    assert not cache.lookup(path)
+    assert cache.evict(max_files=0) == 0
+    cache.commit(path)
+    assert cache.lookup(path)
+
+
+def test_evict_least_recently_used(tmp_path):
+    cache = PartialMovieCache(str(tmp_path))
+    paths = [write_partial_movie(tmp_path, f"{i}.mp4", 100) for i in range(4)]
+    for path in paths:
+        cache.touch([path])
+        time.sleep(0.01)
+    cache.touch([paths[0]])
+    assert cache.evict(max_size=250) == 2
+    assert [os.path.exists(path) for path in paths] == [True, False, False, True]
+    assert cache.evict(max_files=1) == 1
+    assert os.path.exists(paths[0])
+    assert cache.evict(max_age=0) == 1
+    assert cache.flush() == 0
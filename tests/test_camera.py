@@ -0,0 +1,95 @@
+import numpy as np
+
+from manim import (
+    DEGREES,
+    DOWN,
+    ORIGIN,
+    RIGHT,
+    Camera,
+    ImageMobject,
+    PMobject,
+    Sphere,
+    Square,
+    ThreeDCamera,
+    VGroup,
+    tempconfig,
+)
+
+
+def test_batched_vmobject_paths_match_individual_paths():
+    squares = VGroup(
+        *(Square(side_length=0.5).shift(i * RIGHT) for i in range(-3, 4)),
+        Square(side_length=0.5, color="RED").shift(DOWN),
+    ).set_fill(opacity=0.5)
+
+    frames = []
+    for batch_vmobject_paths in [False, True]:
+        with tempconfig({"batch_vmobject_paths": batch_vmobject_paths}):
+            camera = Camera()
+            camera.capture_mobject(squares)
+            frames.append(np.array(camera.get_image()))
+    np.testing.assert_array_equal(frames[0], frames[1])
+
+
+def test_point_cloud_colors_are_blended():
+    cloud = PMobject().add_points(
+        [ORIGIN, ORIGIN, RIGHT], rgbas=[[1, 0, 0, 1], [0, 0, 1, 0.5], [0, 1, 0, 1]]
+    )
+    camera = Camera()
+    camera.capture_mobject(cloud)
+    x, y = camera.points_to_pixel_coords(cloud, np.array([ORIGIN, RIGHT]))
+    # The translucent blue point is composited over the opaque red one.
+    np.testing.assert_allclose(
+        camera.pixel_array[x[1], x[0]], [127, 0, 128, 255], atol=1
+    )
+    np.testing.assert_array_equal(camera.pixel_array[y[1], y[0]], [0, 255, 0, 255])
+
+
+def test_image_mobject_is_sheared():
+    image = ImageMobject(np.uint8([[[255, 0, 0]]]))
+    image.stretch_to_fit_width(2).stretch_to_fit_height(2)
+    image.apply_matrix([[1, 1, 0], [0, 1, 0], [0, 0, 1]])
+    camera = Camera()
+    camera.capture_mobject(image)
+    inside, outside = camera.points_to_pixel_coords(
+        image, np.array([[1.5, 0.8, 0], [-1.5, 0.8, 0]])
+    )
+    np.testing.assert_array_equal(
+        camera.pixel_array[inside[1], inside[0]], [255, 0, 0, 255]
+    )
+    np.testing.assert_array_equal(
+        camera.pixel_array[outside[1], outside[0]], [0, 0, 0, 255]
+    )
+
+    cached_images = len(camera.resampled_image_cache)
+    camera.capture_mobject(image)
+    assert len(camera.resampled_image_cache) == cached_images
+
+
+def test_three_d_camera_sorts_by_depth():
+    camera = ThreeDCamera(phi=75 * DEGREES, theta=30 * DEGREES)
+    square = Square()
+    mobjects = camera.get_mobjects_to_display([square, Sphere(resolution=(6, 6))])
+    rot_matrix = camera.get_rotation_matrix()
+    depths = [
+        np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        for mob in mobjects[:-1]
+    ]
+    assert depths == sorted(depths)
+    assert mobjects[-1] is square
+
+
+def test_three_d_camera_caches_shading():
+    camera = ThreeDCamera()
+    sphere = Sphere(resolution=(4, 4))
+    face = sphere.submobjects[0]
+    camera.capture_mobject(sphere)
+    shaded_rgbas = camera.get_fill_rgbas(face)
+    camera.capture_mobject(sphere)
+    assert camera.get_fill_rgbas(face) is shaded_rgbas
+    face.shift(RIGHT)
+    shifted_rgbas = camera.get_fill_rgbas(face)
+    assert shifted_rgbas is not shaded_rgbas
+    face.points[:, 2] += 1
+    face.refresh_bounding_box()
+    assert camera.get_fill_rgbas(face) is not shifted_rgbas
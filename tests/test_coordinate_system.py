@@ -3,7 +3,14 @@ import pytest
 
 from manim import LEFT, ORIGIN, Axes, ComplexPlane
 from manim import CoordinateSystem as CS
-from manim import NumberPlane, PolarPlane, ThreeDAxes, config, tempconfig
+from manim import (
+    NumberPlane,
+    ParametricFunction,
+    PolarPlane,
+    ThreeDAxes,
+    config,
+    tempconfig,
+)
 
 
 def test_initial_config():
@@ -41,3 +48,41 @@ def test_abstract_base_class():
     """Check that CoordinateSystem has some abstract methods."""
     with pytest.raises(Exception):
         CS().get_axes()
+
+
+def test_vectorized_graph():
+    ax = Axes(x_range=[-2, 3], y_range=[-4, 5])
+    graph = ax.get_graph(lambda x: x ** 2 - 1)
+    vectorized_graph = ax.get_graph(lambda x: x ** 2 - 1, vectorized=True)
+    np.testing.assert_allclose(graph.points, vectorized_graph.points)
+
+    xs = np.array([-1, 0, 2.5])
+    np.testing.assert_allclose(
+        ax.coords_to_point(xs, xs), [ax.coords_to_point(x, x) for x in xs]
+    )
+
+
+def test_adaptive_sampling():
+    def circle(t):
+        return np.cos(t), np.sin(t), 0
+
+    curve = ParametricFunction(
+        circle, t_range=[0, 2 * np.pi, 1], vectorized=True, use_smoothing=False
+    )
+    refined_curve = ParametricFunction(
+        circle,
+        t_range=[0, 2 * np.pi, 1],
+        vectorized=True,
+        adaptive=True,
+        use_smoothing=False,
+    )
+    assert len(refined_curve.points) > len(curve.points)
+    np.testing.assert_allclose(np.linalg.norm(refined_curve.get_anchors(), axis=1), 1)
+
+    line = ParametricFunction(
+        lambda t: np.array([t, 2 * t, 0]),
+        t_range=[0, 1, 0.25],
+        adaptive=True,
+        use_smoothing=False,
+    )
+    assert len(line.points) == 4 * 4
@@ -4,7 +4,7 @@ from zlib import crc32
 import pytest
 
 import manim.utils.hashing as hashing
-from manim import Square
+from manim import RIGHT, Circle, Square, VGroup
 
 ALREADY_PROCESSED_PLACEHOLDER = hashing._Memoizer.ALREADY_PROCESSED_PLACEHOLDER
 
@@ -157,3 +157,27 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def test_mobject_digest():
+    s = Square()
+    assert hashing.get_mobject_digest(s) == hashing.get_mobject_digest(s.copy())
+    hashing._Memoizer.reset_already_processed()
+    digest = hashing.get_mobject_digest(s)
+    hashing._Memoizer.reset_already_processed()
+    # Changes of a single coordinate are picked up, even in large arrays.
+    s.points = s.points.repeat(100, axis=0)
+    digest_large = hashing.get_mobject_digest(s)
+    hashing._Memoizer.reset_already_processed()
+    s.points[-1, 0] += 1
+    assert len({digest, digest_large, hashing.get_mobject_digest(s)}) == 3
+
+
+def test_mobject_digest_includes_submobjects():
+    group = VGroup(Square(), Circle())
+    digest_group = hashing.get_mobject_digest(group)
+    digest_square = hashing.get_mobject_digest(group[0])
+    hashing._Memoizer.reset_already_processed()
+    group[1].shift(RIGHT)
+    assert hashing.get_mobject_digest(group) != digest_group
+    assert hashing.get_mobject_digest(group[0]) == digest_square
@@ -0,0 +1,123 @@
+import importlib
+import os
+import sys
+from textwrap import dedent
+
+import pytest
+
+import manim
+from manim.mobject import geometry
+
+from .utils.commands import capture
+
+# Best of several cold starts, in seconds. Importing every module eagerly (as
+# ``import manim`` used to do) takes several times as long. Regressions are
+# caught reliably by test_import_does_not_load_heavy_modules.
+IMPORT_TIME_BUDGET = 1.0
+
+# Modules that ``import manim`` must not load by itself.
+HEAVY_MODULES = [
+    "cairo",
+    "manimpango",
+    "networkx",
+    "pygments",
+    "scipy",
+    "manim.animation.animation",
+    "manim.camera.camera",
+    "manim.mobject.mobject",
+    "manim.renderer.cairo_renderer",
+    "manim.scene.scene",
+]
+
+
+# Modules that ``from manim import *`` exported before the exports became lazy,
+# besides the names exported by the modules in ``manim._EXPORTS``. Leftovers of
+# the module body, such as loop variables, are not exported anymore.
+EXPORTED_MODULES = [
+    "animation",
+    "camera",
+    "cli",
+    "color",
+    "constants",
+    "gui",
+    "import_plugins",
+    "importlib_metadata",
+    "mobject",
+    "np",
+    "plugins",
+    "plugins_flags",
+    "rate_functions",
+    "renderer",
+    "scene",
+    "sys",
+    "time",
+    "typing",
+    "unit",
+    "utils",
+]
+
+
+def run_python(code):
+    out, err, exit_code = capture([sys.executable, "-c", dedent(code)])
+    assert exit_code == 0, err
+    return out
+
+
+@pytest.mark.skipif(
+    "MANIM_TEST_IMPORT_TIME" not in os.environ,
+    reason="Wall clock timings are unreliable on loaded machines, "
+    "set MANIM_TEST_IMPORT_TIME to run this test.",
+)
+def test_import_time():
+    code = """\
+        import time
+
+        start = time.perf_counter()
+        import manim
+        print(time.perf_counter() - start)
+    """
+    import_time = min(float(run_python(code)) for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGET
+
+
+def test_import_does_not_load_heavy_modules():
+    code = f"""\
+        import sys
+
+        import manim
+
+        print([name for name in {HEAVY_MODULES!r} if name in sys.modules])
+    """
+    assert run_python(code).strip() == "[]"
+
+
+def test_lazy_exports():
+    assert manim.Circle is geometry.Circle
+    assert "Circle" in dir(manim)
+    assert manim.color is manim.utils.color
+    namespace = {}
+    exec("from manim import *", namespace)
+    assert all(name in namespace for name in manim.__all__)
+    assert "multiprocessing" not in namespace
+    assert namespace["Scene"] is manim.scene.scene.Scene
+    assert namespace["constants"] is manim.constants
+    assert namespace["utils"] is manim.utils
+
+    # The names of the star imports the lazy exports replace, except for the
+    # multiprocessing module the cairo renderer has imported since then. The
+    # exceptions and hashing modules only export the names other modules import.
+    for module_name in manim._EXPORTS.keys() - {".utils.exceptions", ".utils.hashing"}:
+        module = importlib.import_module(module_name, "manim")
+        module_namespace = {}
+        exec(f"from {module.__name__} import *", module_namespace)
+        missing = set(module_namespace) - set(namespace)
+        assert missing <= {"__builtins__", "multiprocessing"}, module_name
+    assert set(EXPORTED_MODULES) <= set(namespace)
+
+
+def test_export_table_matches_modules():
+    for module_name, names in manim._EXPORTS.items():
+        module = importlib.import_module(module_name, "manim")
+        assert all(hasattr(module, name) for name in names)
+        if hasattr(module, "__all__"):
+            assert sorted(names) == sorted(module.__all__), module_name
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from manim import Mobject
+from manim import DOWN, LEFT, ORIGIN, RIGHT, UP, UR, Circle, Mobject, Square, VGroup
+from manim.mobject import mobject as mobject_module
 
 
 def test_mobject_add():
@@ -47,3 +49,115 @@ def test_mobject_remove():
     assert len(obj.submobjects) == 10
 
     assert obj.remove(Mobject()) is obj
+
+
+def test_mobject_family_cache():
+    """Test that the cached family follows changes of the submobjects."""
+    obj, child, grandchild = Mobject(), Mobject(), Mobject()
+    obj.add(child)
+    family = obj.get_family()
+    assert family == [obj, child]
+    assert obj.get_family() is family
+
+    child.add(grandchild)
+    assert obj.get_family() == [obj, child, grandchild]
+    obj.remove(child)
+    assert obj.get_family() == [obj]
+    obj.submobjects = [grandchild, child]
+    assert obj.get_family() == [obj, child, grandchild]
+    assert child.parents == [obj] and grandchild.parents == [child, obj]
+    obj.submobjects.pop()
+    obj.refresh_family()
+    assert obj.get_family() == [obj, grandchild]
+    other = Mobject()
+    obj.add(other).invert()
+    assert obj.get_family() == [obj, other, grandchild]
+
+    copy = obj.copy()
+    assert copy.get_family()[0] is copy
+    assert copy.get_family()[1] is not other
+    assert copy.get_family()[1].parents == [copy]
+    assert child.copy().parents == []
+
+
+def test_mobject_bounding_box_cache():
+    """Test that the cached bounding box follows changes of the family."""
+    square = Square()
+    group = VGroup(square)
+    box = group.get_bounding_box()
+    assert group.get_bounding_box() is box
+    np.testing.assert_allclose(group.get_critical_point(UR), [1, 1, 0])
+
+    square.shift(RIGHT)
+    np.testing.assert_allclose(group.get_critical_point(UR), [2, 1, 0])
+    np.testing.assert_allclose(group.get_center(), RIGHT)
+
+    # in place modification of the points of a submobject
+    square.points[:] += LEFT
+    square.refresh_bounding_box()
+    np.testing.assert_allclose(group.get_center(), ORIGIN)
+
+    group.add(Square().shift(3 * DOWN))
+    np.testing.assert_allclose(group.get_corner(DOWN + LEFT), [-1, -4, 0])
+    assert np.isclose(group.height, 5)
+
+    group.remove(square)
+    np.testing.assert_allclose(group.get_center(), 3 * DOWN)
+    np.testing.assert_allclose(VGroup().get_center(), ORIGIN)
+
+
+def test_mobject_bounding_box_ignores_handles():
+    """Test that the handles of a VMobject do not define its boundary."""
+    circle = Circle()
+    np.testing.assert_allclose(circle.get_top(), UP, atol=1e-8)
+    assert circle.get_top()[1] == circle.get_extremum_along_dim(dim=1, key=1)
+
+
+def test_mobject_updaters(monkeypatch):
+    calls = []
+    inner = Mobject()
+    outer = VGroup(Circle(), VGroup(Circle()))
+    mob = Mobject()
+    mob.add(outer, Mobject().add(inner))
+    assert not mob.has_updaters_in_family()
+
+    inspected = []
+
+    def get_parameters(function):
+        inspected.append(function)
+        return get_parameters_orig(function)
+
+    get_parameters_orig = mobject_module.get_parameters
+    monkeypatch.setattr(mobject_module, "get_parameters", get_parameters)
+
+    def time_based_updater(m, dt):
+        calls.append(("time based", dt))
+
+    inner.add_updater(time_based_updater)
+    assert mob.has_updaters_in_family()
+    assert not outer.has_updaters_in_family()
+    # Changes outside of a family keep its cached status
+    Mobject().add(Mobject().add_updater(time_based_updater))
+    assert outer._submobjects_have_updaters is False
+    for _ in range(3):
+        mob.update(0.5)
+    assert calls == [("time based", 0.5)] * 3
+    assert mob.get_family_updaters() == [time_based_updater]
+    # The parameters of the updater are only inspected when it is added
+    assert inspected == [time_based_updater]
+
+    calls.clear()
+    circle = Circle()
+    circle.add_updater(lambda m: calls.append("added"))
+    outer.submobjects[1].add(circle)
+    outer[0] = VGroup(Circle().add_updater(lambda m: calls.append("replaced")))
+    mob.update(0.5)
+    assert calls == ["replaced", "added", ("time based", 0.5)]
+
+    inner.clear_updaters()
+    circle.clear_updaters()
+    outer.clear_updaters()
+    calls.clear()
+    mob.update(0.5)
+    assert calls == []
+    assert not mob.has_updaters_in_family()
@@ -82,3 +82,26 @@ def test_hash_logic_is_called_when_caching_is_enabled(using_temp_config):
         scene = SquareToCircle()
         scene.render()
         mocked.assert_called_once()
+
+
+def test_render_in_worker_processes(using_temp_config, disabling_caching):
+    with tempconfig({"render_workers": 2}):
+        scene = SceneWithMultipleWaitCalls()
+        renderer = scene.renderer
+        renderer.update_frame = Mock(wraps=renderer.update_frame)
+        scene.render()
+        # Frames are only captured by the workers, never by the main process.
+        renderer.update_frame.assert_not_called()
+        assert renderer.render_processes == []
+        for partial_movie_file in renderer.file_writer.partial_movie_files:
+            assert_file_exists(partial_movie_file)
+        assert_file_exists(config["output_file"])
+
+
+def test_static_wait_pipes_a_single_frame(using_temp_config, disabling_caching):
+    scene = SceneWithStaticWait()
+    file_writer = scene.renderer.file_writer
+    file_writer.pipe_frame = Mock(wraps=file_writer.pipe_frame)
+    scene.render()
+    file_writer.pipe_frame.assert_called_once()
+    assert_file_exists(config["output_file"])
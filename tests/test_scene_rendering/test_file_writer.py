@@ -0,0 +1,34 @@
+import io
+
+import numpy as np
+import pytest
+
+from manim.scene.scene_file_writer import _FrameWriter
+
+
+def test_frame_writer_pipes_frames_in_order():
+    stream = io.BytesIO()
+    frame_writer = _FrameWriter(num_buffers=2)
+    frame_writer.start(stream)
+    frames = [np.full((2, 3, 4), i, dtype=np.uint8) for i in range(5)]
+    for frame in frames:
+        frame_writer.write(frame)
+        # The frame is copied, so it can be reused right away.
+        frame[:] = 255
+    frame_writer.write(bytes(24), num_frames=3)
+    stats = frame_writer.stop()
+    expected = b"".join(bytes([i]) * 24 for i in range(5)) + bytes(72)
+    assert stream.getvalue() == expected
+    assert stats["max_queue_depth"] <= 2
+
+
+def test_frame_writer_raises_errors_of_the_stream():
+    class BrokenStream:
+        def write(self, data):
+            raise BrokenPipeError()
+
+    frame_writer = _FrameWriter()
+    frame_writer.start(BrokenStream())
+    frame_writer.write(np.zeros(4, dtype=np.uint8))
+    with pytest.raises(BrokenPipeError):
+        frame_writer.stop()
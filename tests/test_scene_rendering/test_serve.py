@@ -0,0 +1,103 @@
+import os
+import stat
+import threading
+from pathlib import Path
+
+import pytest
+
+from manim.cli.serve import server
+
+
+def start_server(address, token=None):
+    render_server = server.make_server(address, token)
+    thread = threading.Thread(target=render_server.serve_forever, daemon=True)
+    thread.start()
+    return render_server
+
+
+@pytest.fixture
+def render_server(using_temp_config, disabling_caching, tmp_path):
+    render_server = start_server(str(tmp_path / "socket"))
+    yield render_server.server_address
+    render_server.shutdown()
+    render_server.server_close()
+
+
+@pytest.mark.slow
+def test_serve_renders_jobs(render_server, simple_scenes_path, monkeypatch):
+    imports = []
+
+    def get_module(file_name):
+        imports.append(file_name)
+        return server_get_module(file_name)
+
+    server_get_module = server.get_module
+    monkeypatch.setattr(server, "get_module", get_module)
+    for _ in range(2):
+        events = list(
+            server.submit_job(
+                render_server,
+                simple_scenes_path,
+                ["SquareToCircle"],
+                {"save_last_frame": True, "write_to_movie": False},
+            )
+        )
+        assert {"event": "scene", "scene": "SquareToCircle"} in events
+        assert any(event["event"] == "log" for event in events)
+        assert events[-1]["event"] == "done"
+        (output_file,) = events[-1]["output_files"]
+        assert Path(output_file).name == "SquareToCircle.png"
+        assert Path(output_file).exists()
+    assert len(imports) == 1
+
+    # Output files are also reported when their name is given
+    events = list(
+        server.submit_job(
+            render_server,
+            simple_scenes_path,
+            ["SquareToCircle"],
+            {"save_last_frame": True, "output_file": "square"},
+        )
+    )
+    (output_file,) = events[-1]["output_files"]
+    assert Path(output_file).name == "square.png"
+
+
+def test_serve_socket_is_private(render_server):
+    assert stat.S_IMODE(os.stat(render_server).st_mode) == 0o600
+
+
+def test_serve_tcp_requires_token(using_temp_config, simple_scenes_path):
+    with pytest.raises(ValueError):
+        server.make_server(("127.0.0.1", 0))
+
+    render_server = start_server(("127.0.0.1", 0), token="secret")
+    try:
+        for token in [None, "wrong"]:
+            events = list(
+                server.submit_job(
+                    render_server.server_address, simple_scenes_path, token=token
+                )
+            )
+            assert events == [{"event": "error", "message": "Wrong token."}]
+        events = list(
+            server.submit_job(
+                render_server.server_address, simple_scenes_path, token="secret"
+            )
+        )
+        assert "several scenes" in events[-1]["message"]
+    finally:
+        render_server.shutdown()
+        render_server.server_close()
+
+
+def test_serve_reports_errors(render_server, simple_scenes_path):
+    events = list(server.submit_job(render_server, simple_scenes_path))
+    assert events[-1]["event"] == "error"
+    assert "several scenes" in events[-1]["message"]
+
+    events = list(
+        server.submit_job(render_server, simple_scenes_path, config_overrides={"a": 1})
+    )
+    assert events[-1]["event"] == "error"
+    assert "Unknown config options: a" in events[-1]["message"]
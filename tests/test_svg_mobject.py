@@ -1,6 +1,12 @@
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
 from colour import Color
 
 from manim import *
+from manim.mobject.svg import svg_mobject
+from manim.mobject.svg.svg_path import path_string_to_points
 from tests.helpers.path_utils import get_svg_resource
 
 
@@ -50,3 +56,94 @@ def test_stroke_overrides_color():
         get_svg_resource("heart.svg"), color="#334433", stroke_color=expected_color
     )
     assert svg.stroke_color == expected_color
+
+
+def test_svg_geometry_is_cached(monkeypatch):
+    first = SVGMobject(get_svg_resource("heart.svg"))
+    monkeypatch.setattr(SVGMobject, "parse_svg", lambda self: [])
+    second = SVGMobject(get_svg_resource("heart.svg"))
+    assert len(second.submobjects) == len(first.submobjects) > 0
+    for first_mob, second_mob in zip(first.get_family(), second.get_family()):
+        assert first_mob is not second_mob
+        np.testing.assert_allclose(first_mob.points, second_mob.points)
+    second[0].set_color(RED)
+    assert first[0].get_fill_color() != second[0].get_fill_color()
+
+
+def test_svg_geometry_is_saved(tmp_path, monkeypatch):
+    svg_file = tmp_path / "heart.svg"
+    shutil.copy(get_svg_resource("heart.svg"), svg_file)
+    with tempconfig({"cache_svg_geometry": True}):
+        monkeypatch.setattr(svg_mobject, "_geometry_cache", OrderedDict())
+        first = SVGMobject(str(svg_file), fill_color="#FF862F")
+        assert len(list(tmp_path.glob("heart_*.npz"))) == 1
+        monkeypatch.setattr(svg_mobject, "_geometry_cache", OrderedDict())
+        monkeypatch.setattr(SVGMobject, "parse_svg", lambda self: [])
+        second = SVGMobject(str(svg_file), fill_color="#FF862F")
+    assert len(second.submobjects) == len(first.submobjects) > 0
+    for first_mob, second_mob in zip(first.get_family(), second.get_family()):
+        assert type(first_mob) is type(second_mob)
+        np.testing.assert_allclose(first_mob.points, second_mob.points)
+        np.testing.assert_allclose(first_mob.fill_rgbas, second_mob.fill_rgbas)
+        np.testing.assert_allclose(first_mob.stroke_rgbas, second_mob.stroke_rgbas)
+
+
+def test_path_string_to_points():
+    absolute = path_string_to_points(
+        "M 0 0 L 1 0 H 2 V 1 C 3 1 3 2 2 2 S 1 3 0 2 Q 0 1 1 1 T 2 0 Z"
+    )
+    relative = path_string_to_points(
+        "m 0 0 l 1 0 h 1 v 1 c 1 0 1 1 0 1 s -1 1 -2 0 q 0 -1 1 -1 t 1 -1 z"
+    )
+    np.testing.assert_allclose(absolute, relative)
+    # The moveto and the first handles and anchor of the first curve, then
+    # four points for each of the other seven curves.
+    assert len(absolute) == 1 + 3 + 4 * 7
+    np.testing.assert_allclose(absolute[-1], ORIGIN)
+
+
+def test_path_string_to_points_arc():
+    points = path_string_to_points("M 0 0 A 1 1 0 0 1 2 0")
+    # A half circle is split into two quarters.
+    assert len(points) == 8
+    anchors = points[[0, 3, 4, 7]]
+    np.testing.assert_allclose(np.linalg.norm(anchors - RIGHT, axis=1), 1)
+
+
+def test_glyphs_are_parsed_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(svg_mobject, "_geometry_cache", OrderedDict())
+    monkeypatch.setattr(svg_mobject, "_glyph_cache", OrderedDict())
+    parsed_paths = []
+    path_string_to_mobject = SVGMobject.path_string_to_mobject
+
+    def counting_path_string_to_mobject(self, path_string, style):
+        parsed_paths.append(path_string)
+        return path_string_to_mobject(self, path_string, style)
+
+    monkeypatch.setattr(
+        SVGMobject, "path_string_to_mobject", counting_path_string_to_mobject
+    )
+    # Three glyphs used seven times, with five combinations of glyph and style.
+    first = SVGMobject(get_svg_resource("aabbb.svg"))
+    assert len(first.submobjects) == 7
+    assert len(parsed_paths) == 5
+    np.testing.assert_allclose(
+        first[1].points - first[1].get_center(),
+        first[0].points - first[0].get_center(),
+    )
+
+    monkeypatch.setattr(svg_mobject, "_geometry_cache", OrderedDict())
+    second = SVGMobject(get_svg_resource("aabbb.svg"))
+    assert len(parsed_paths) == 5
+    for first_mob, second_mob in zip(first, second):
+        np.testing.assert_allclose(first_mob.points, second_mob.points)
+
+    # The same glyphs numbered in a different order, as in another string.
+    svg = Path(get_svg_resource("aabbb.svg")).read_text()
+    svg = svg.replace("glyph0-1", "glyph").replace("glyph0-2", "glyph0-1")
+    renumbered_file = tmp_path / "bbaaa.svg"
+    renumbered_file.write_text(svg.replace('glyph"', 'glyph0-2"'))
+    renumbered = SVGMobject(str(renumbered_file))
+    assert len(parsed_paths) == 5
+    for first_mob, renumbered_mob in zip(first, renumbered):
+        np.testing.assert_allclose(first_mob.points, renumbered_mob.points)
@@ -1,8 +1,14 @@
+from collections import OrderedDict
+from concurrent.futures import wait
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from manim import MathTex, SingleStringMathTex, Tex, config
+from manim import DecimalNumber, MathTex, SingleStringMathTex, Tex, TexTemplate, config
+from manim.mobject import numbers
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import prefetch, tex_to_svg_file, tex_to_svg_files
 
 
 def test_MathTex():
@@ -72,3 +78,66 @@ def test_tex_white_space_and_non_whitespace_args():
     assert len(tex[1]) == len("".join((str_part_2 + separator).split()))
     assert len(tex[2]) == len("".join((str_part_3 + separator).split()))
     assert len(tex[3]) == len("".join(str_part_4.split()))
+
+
+def test_tex_template_expressions_on_pages():
+    template = TexTemplate()
+    texcode = template.get_texcode_for_expressions(["a", "b"], environment="align*")
+    assert "\\standaloneconfig{multi=manimpage}" in texcode
+    assert texcode.count("\\begin{manimpage}\n\\begin{align*}") == 2
+    assert template.placeholder_text not in texcode
+
+    template = TexTemplate(documentclass=r"\documentclass{article}")
+    assert template.get_texcode_for_expressions(["a", "b"]) is None
+
+
+def test_tex_to_svg_files():
+    svg_files = tex_to_svg_files(["x^2", "y^2", "x^2"], environment="align*")
+    assert svg_files[0] == svg_files[2]
+    assert all(Path(svg_file).exists() for svg_file in svg_files)
+    assert svg_files[1] == tex_to_svg_file("y^2", environment="align*")
+
+
+def test_prefetch():
+    futures = prefetch(["p^2", "q^2", "p^2"], environment="align*")
+    assert len(futures) >= 1
+    # The compilation started by prefetch is collected on first access
+    assert Path(tex_to_svg_file("q^2", environment="align*")).exists()
+    assert prefetch(["p^2", "q^2"], environment="align*") == []
+
+
+@pytest.mark.parametrize("tex_class", [MathTex, Tex])
+def test_prefetch_tex_mobject(tex_class, monkeypatch):
+    wait(tex_class.prefetch("r^2", "+ s_", substrings_to_isolate=["s"]))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("prefetched TeX code compiled again")
+
+    monkeypatch.setattr(tex_file_writing, "compile_tex_to_svg", fail)
+    monkeypatch.setattr(tex_file_writing, "compile_tex_batch", fail)
+    tex_class("r^2", "+ s_", substrings_to_isolate=["s"])
+
+
+def test_decimal_number_reuses_glyphs(monkeypatch):
+    built = []
+
+    def make_glyph(tex_string, **kwargs):
+        built.append(tex_string)
+        return SingleStringMathTex(tex_string, **kwargs)
+
+    monkeypatch.setattr(numbers, "_glyph_atlas", OrderedDict())
+    monkeypatch.setattr(numbers, "SingleStringMathTex", make_glyph)
+    first = DecimalNumber(11.25, show_ellipsis=True)
+    second = DecimalNumber(11.25, show_ellipsis=True)
+    assert sorted(built) == sorted(["1", ".", "2", "5", "\\dots"])
+    assert np.allclose(first.points, second.points)
+    for glyph, other in zip(first.submobjects, second.submobjects):
+        assert glyph is not other
+        assert np.allclose(glyph.get_all_points(), other.get_all_points())
+
+    monkeypatch.setattr(numbers, "SingleStringMathTex", SingleStringMathTex)
+    fresh = SingleStringMathTex("1")
+    assert np.allclose(
+        fresh.get_all_points() - fresh.get_center(),
+        first[0].get_all_points() - first[0].get_center(),
+    )
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from manim import (
+    LEFT,
+    RED,
+    RIGHT,
+    UP,
+    UR,
+    Circle,
+    Dot,
+    StreamLines,
+    VectorField,
+    config,
+)
+
+
+def func(pos):
+    return np.sin(pos[0]) * UR + np.cos(pos[1]) * LEFT + pos / 5
+
+
+def vectorized_func(pos):
+    return np.sin(pos[:, [0]]) * UR + np.cos(pos[:, [1]]) * LEFT + pos / 5
+
+
+STREAM_LINES_CONFIG = {
+    "color": RED,
+    "x_min": -2,
+    "x_max": 2,
+    "y_min": -1,
+    "y_max": 1,
+    "padding": 1,
+}
+
+
+def test_vectorized_stream_lines():
+    stream_lines = StreamLines(func, **STREAM_LINES_CONFIG)
+    vectorized_stream_lines = StreamLines(
+        vectorized_func, vectorized=True, **STREAM_LINES_CONFIG
+    )
+    assert len(stream_lines) == len(vectorized_stream_lines) > 0
+    for line, vectorized_line in zip(stream_lines, vectorized_stream_lines):
+        np.testing.assert_allclose(line.points, vectorized_line.points)
+        assert line.duration == vectorized_line.duration
+
+
+@pytest.mark.parametrize("integration_method", ["rk4", "adaptive"])
+def test_stream_lines_integration_methods(integration_method):
+    # Circles around the origin
+    def rotation(pos):
+        return np.stack([-pos[:, 1], pos[:, 0], np.zeros(len(pos))], axis=1)
+
+    stream_lines = StreamLines(
+        rotation,
+        vectorized=True,
+        integration_method=integration_method,
+        virtual_time=1,
+        **STREAM_LINES_CONFIG,
+    )
+    assert len(stream_lines) > 0
+    for line in stream_lines:
+        radii = np.linalg.norm(line.get_anchors(), axis=1)
+        np.testing.assert_allclose(radii, radii[0], atol=1e-3)
+        assert line.duration <= 1
+
+
+def test_stream_lines_unknown_integration_method():
+    with pytest.raises(ValueError):
+        StreamLines(func, integration_method="midpoint", **STREAM_LINES_CONFIG)
+
+
+@pytest.mark.parametrize("pointwise", [False, True])
+def test_nudge_submobjects(pointwise):
+    field = VectorField(
+        lambda pos: np.sin(pos[1] / 2) * RIGHT + np.cos(pos[0] / 2) * UP
+    )
+    mobjects = [Circle().shift(LEFT), Dot(RIGHT)]
+    field.add(*[mob.copy() for mob in mobjects])
+    field.nudge_submobjects(0.5, 3, pointwise)
+    for mob, nudged_mob in zip(mobjects, field):
+        field.nudge(mob, 0.5, 3, pointwise)
+        np.testing.assert_allclose(mob.points, nudged_mob.points)
+
+
+def test_colored_background_image():
+    field = VectorField(func)
+    image = field.get_colored_background_image(sampling_rate=20)
+    assert field.get_colored_background_image(sampling_rate=20) is image
+    assert VectorField(func).get_colored_background_image(sampling_rate=20) is image
+
+    pixels = np.array(image)
+    height, width, _ = pixels.shape
+    xs = np.linspace(-config.frame_x_radius, config.frame_x_radius, width)
+    ys = np.linspace(config.frame_y_radius, -config.frame_y_radius, height)
+    for row, column in [(0, 0), (height // 3, width // 2), (height - 1, width - 1)]:
+        expected = field.pos_to_rgb(np.array([xs[column], ys[row], 0]))
+        np.testing.assert_array_equal(
+            pixels[row, column], (expected * 255).astype("uint8")
+        )
+
+    vectorized_field = VectorField(
+        vectorized_func,
+        vectorized=True,
+        color_scheme=lambda vectors: vectors[:, 0],
+        min_color_scheme_value=-1,
+        max_color_scheme_value=1,
+    )
+    field = VectorField(
+        func,
+        color_scheme=lambda vector: vector[0],
+        min_color_scheme_value=-1,
+        max_color_scheme_value=1,
+    )
+    np.testing.assert_array_equal(
+        np.array(vectorized_field.get_colored_background_image(sampling_rate=20)),
+        np.array(field.get_colored_background_image(sampling_rate=20)),
+    )
@@ -1,7 +1,18 @@
 import numpy as np
 import pytest
 
-from manim import Circle, Line, Mobject, Square, VDict, VGroup, VMobject
+from manim import (
+    DOWN,
+    RIGHT,
+    UL,
+    Circle,
+    Line,
+    Mobject,
+    Square,
+    VDict,
+    VGroup,
+    VMobject,
+)
 
 
 def test_vmobject_point_from_propotion():
@@ -28,6 +39,31 @@ def test_vmobject_point_from_propotion():
         obj.point_from_proportion(0)
 
 
+def test_vmobject_points_from_proportions():
+    circle = Circle()
+    alphas = np.linspace(0, 1, 11)
+    points = circle.points_from_proportions(alphas)
+    assert points.shape == (11, 3)
+    for alpha, point in zip(alphas, points):
+        np.testing.assert_allclose(point, circle.point_from_proportion(alpha))
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        circle.points_from_proportions([0.5, 2])
+
+
+def test_vmobject_arc_length_table_follows_points():
+    obj = VMobject()
+    obj.set_points_as_corners([np.array([0, 0, 0]), np.array([4, 0, 0])])
+    assert obj.get_arc_length() == pytest.approx(4)
+    np.testing.assert_allclose(obj.point_from_proportion(0.5), [2, 0, 0])
+
+    # The cached lengths are recomputed when the points change.
+    obj.points[-1] = np.array([8, 0, 0])
+    assert obj.get_arc_length() == pytest.approx(8, rel=0.1)
+    obj.scale(0.5, about_point=np.zeros(3))
+    assert obj.get_arc_length() == pytest.approx(4, rel=0.1)
+
+
 def test_vgroup_init():
     """Test the VGroup instantiation."""
     VGroup()
@@ -204,3 +240,46 @@ def test_vgroup_item_assignment_only_allows_vmobjects():
     vgroup = VGroup(VMobject())
     with pytest.raises(TypeError, match="All submobjects must be of type VMobject"):
         vgroup[0] = "invalid object"
+
+
+def test_vmobject_insert_n_curves_to_point_list():
+    obj = VMobject()
+    obj.set_points_as_corners(
+        [np.array([0, 0, 0]), np.array([3, 0, 0]), np.array([3, 3, 0])]
+    )
+    points = obj.insert_n_curves_to_point_list(3, obj.points)
+    # The lines are split in three and two pieces of equal lengths.
+    np.testing.assert_allclose(
+        points[::4],
+        [[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0], [3, 1.5, 0]],
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(points[-1], [3, 3, 0])
+    assert len(points) == 4 * 5
+
+
+def test_vmobject_align_points():
+    square = Square()
+    circle = Circle()
+    square.align_points(circle)
+    assert len(square.points) == len(circle.points)
+    np.testing.assert_allclose(square.get_corner(UL), [-1, 1, 0])
+
+
+def test_vmobject_get_subpath_curves_2d():
+    obj = VMobject()
+    obj.set_points_as_corners([UL, UL + RIGHT, UL + RIGHT + DOWN, UL])
+    obj.start_new_path(3 * RIGHT)
+    obj.add_line_to(4 * RIGHT)
+    subpaths = obj.get_subpath_curves_2d(obj.points)
+    assert len(subpaths) == 2
+
+    triangle, is_closed = subpaths[0]
+    assert triangle.shape == (3, 4, 2)
+    assert is_closed
+    np.testing.assert_array_equal(triangle[0, 0], UL[:2])
+
+    line, is_closed = subpaths[1]
+    assert line.shape == (1, 4, 2)
+    assert not is_closed
+    np.testing.assert_array_equal(line[0, -1], [4, 0])